@@ -2,16 +2,82 @@
 """
 Auto-format files after Claude edits them.
 Detects file type and runs appropriate formatter.
+
+Python and prettier-handled files are formatted through long-lived daemons
+(blackd / prettierd) so each edit doesn't pay interpreter or node startup.
+Falls back to spawning the plain formatter when a daemon is unavailable.
+
+With CLAUDE_FMT_BATCH=1 edited paths are queued instead, and
+`format-on-edit.py --flush` (run from the Stop hook) formats the whole
+queue with one formatter invocation per command. --flush also stops the
+blackd this hook started, so the daemon lives for one turn of edits.
 """
 import json
+import os
+import shutil
+import signal
 import subprocess
 import sys
-import os
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+# orjson parses the hook payload several times faster than the stdlib parser
+try:
+    import orjson
+
+    def load_input(stream):
+        return orjson.loads(stream.buffer.read())
+except ImportError:
+    load_input = json.load
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+FORMAT_TIMEOUT = 10
+
+BLACKD_HOST = 'localhost'
+BLACKD_PORT = 45484
+BLACKD_URL = f'http://{BLACKD_HOST}:{BLACKD_PORT}'
+PID_FILE = os.path.join(tempfile.gettempdir(), '.claude-fmt.pid')
+BLACKD_STARTUP_GRACE = 2
+
+# [tool.black] options blackd accepts as request headers, and the header for each
+BLACKD_OPTION_HEADERS = {
+    'line-length': 'X-Line-Length',
+    'target-version': 'X-Python-Variant',
+    'skip-string-normalization': 'X-Skip-String-Normalization',
+    'skip-magic-trailing-comma': 'X-Skip-Magic-Trailing-Comma',
+    'preview': 'X-Preview',
+}
+# Options that only select files, so they don't change how one file is formatted
+BLACK_FILE_SELECTION_OPTIONS = {
+    'include', 'exclude', 'extend-exclude', 'force-exclude', 'required-version',
+}
+
+QUEUE_FILE = os.path.join(
+    os.environ.get('CLAUDE_PROJECT_DIR', os.getcwd()), '.claude', '.fmt-queue'
+)
+
+PRETTIER_EXTENSIONS = {
+    '.js', '.jsx', '.ts', '.tsx', '.json', '.css', '.scss', '.md', '.yaml', '.yml',
+}
+
+def get_extension(file_path):
+    """Lowercased extension of the final path component, or '' if there is none."""
+    dot = file_path.rfind('.')
+    # No dot in the basename, or only a leading one (".bashrc")
+    if dot <= max(file_path.rfind('/'), file_path.rfind(os.sep)) + 1:
+        return ''
+    return file_path[dot:].lower()
 
 def get_formatter_command(file_path):
     """Return the formatter command for a given file type."""
-    ext = os.path.splitext(file_path)[1].lower()
-    
+    ext = get_extension(file_path)
+
     formatters = {
         # JavaScript/TypeScript
         '.js': ['npx', 'prettier', '--write'],
@@ -24,35 +90,232 @@ def get_formatter_command(file_path):
         '.md': ['npx', 'prettier', '--write'],
         '.yaml': ['npx', 'prettier', '--write'],
         '.yml': ['npx', 'prettier', '--write'],
-        
+
         # Python
         '.py': ['black', '--quiet'],
-        
+
         # Go
         '.go': ['gofmt', '-w'],
-        
+
         # Rust
         '.rs': ['rustfmt'],
     }
-    
+
     return formatters.get(ext)
 
+def find_pyproject(file_path):
+    """Nearest pyproject.toml at or above the file's directory, as black resolves it."""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    while True:
+        candidate = os.path.join(directory, 'pyproject.toml')
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+def blackd_headers(file_path):
+    """
+    Translate the project's [tool.black] options into blackd request headers.
+
+    blackd ignores pyproject.toml, so options must travel with each request.
+    Returns None when they can't (no TOML parser, or an option blackd has no
+    header for); the caller then runs the black CLI, which reads the config.
+    """
+    pyproject = find_pyproject(file_path)
+    if pyproject is None:
+        return {}
+    if tomllib is None:
+        return None
+    with open(pyproject, 'rb') as f:
+        config = tomllib.load(f).get('tool', {}).get('black', {})
+
+    headers = {}
+    for option, value in config.items():
+        option = option.replace('_', '-')
+        if option in BLACK_FILE_SELECTION_OPTIONS:
+            continue
+        header = BLACKD_OPTION_HEADERS.get(option)
+        if header is None:
+            return None
+        if isinstance(value, bool):
+            if value:
+                headers[header] = '1'
+        elif isinstance(value, list):
+            headers[header] = ','.join(value)
+        else:
+            headers[header] = str(value)
+    return headers
+
+def start_blackd():
+    """Launch blackd detached from this hook and remember its PID for stop_blackd."""
+    if not shutil.which('blackd'):
+        return False
+    proc = subprocess.Popen(
+        ['blackd', '--bind-host', BLACKD_HOST, '--bind-port', str(BLACKD_PORT)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    try:
+        with open(PID_FILE, 'w') as f:
+            f.write(str(proc.pid))
+    except OSError:
+        pass
+    return True
+
+def stop_blackd():
+    """Terminate the blackd started by start_blackd, if any."""
+    try:
+        with open(PID_FILE) as f:
+            pid = int(f.read().strip())
+        os.remove(PID_FILE)
+    except (OSError, ValueError):
+        return
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except OSError:
+        # Already gone
+        pass
+
+def post_to_blackd(source, headers):
+    """Send source to blackd; return formatted bytes, or None if unchanged."""
+    request = urllib.request.Request(BLACKD_URL, data=source, headers=headers, method='POST')
+    with urllib.request.urlopen(request, timeout=FORMAT_TIMEOUT) as response:
+        # 204 means the source is already well formatted
+        return response.read() if response.status == 200 else None
+
+def format_with_blackd(file_path):
+    """
+    Format a Python file through blackd.
+
+    Returns False if blackd is unreachable or can't apply the project's options.
+    """
+    headers = blackd_headers(file_path)
+    if headers is None:
+        return False
+    with open(file_path, 'rb') as f:
+        source = f.read()
+
+    now = time.monotonic()
+    deadline = now + FORMAT_TIMEOUT
+    # A daemon recorded by an earlier run may still be starting up; past this
+    # point its PID file is treated as stale and a fresh daemon replaces it
+    startup_grace = now + BLACKD_STARTUP_GRACE
+    started = False
+    while True:
+        try:
+            formatted = post_to_blackd(source, headers)
+            break
+        except urllib.error.HTTPError:
+            # 400/500: syntax error or formatter failure - leave the file alone
+            return True
+        except (urllib.error.URLError, ConnectionError):
+            if not started and (
+                not os.path.exists(PID_FILE) or time.monotonic() >= startup_grace
+            ):
+                stop_blackd()
+                if not start_blackd():
+                    return False
+                started = True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+
+    if formatted is not None:
+        with open(file_path, 'wb') as f:
+            f.write(formatted)
+    return True
+
+def format_with_prettierd(file_path):
+    """Format through prettierd, which spawns and reuses its own daemon."""
+    if not shutil.which('prettierd'):
+        return False
+    with open(file_path, 'rb') as f:
+        source = f.read()
+    result = subprocess.run(
+        ['prettierd', file_path],
+        input=source,
+        capture_output=True,
+        timeout=FORMAT_TIMEOUT,
+    )
+    if result.returncode == 0 and result.stdout and result.stdout != source:
+        with open(file_path, 'wb') as f:
+            f.write(result.stdout)
+    return True
+
+def format_file(file_path, ext):
+    """Format a file, preferring a persistent daemon over a per-file process."""
+    try:
+        if ext == '.py' and format_with_blackd(file_path):
+            return
+        if ext in PRETTIER_EXTENSIONS and format_with_prettierd(file_path):
+            return
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+
+    formatter = get_formatter_command(file_path)
+    if formatter:
+        cmd = formatter + [file_path]
+        try:
+            subprocess.run(cmd, capture_output=True, timeout=FORMAT_TIMEOUT)
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            # Formatter not installed or timed out - skip silently
+            pass
+
+def enqueue(file_path):
+    """Append a path to the batch queue (NUL-separated, like xargs -0 input)."""
+    os.makedirs(os.path.dirname(QUEUE_FILE), exist_ok=True)
+    with open(QUEUE_FILE, 'a', encoding='utf-8') as f:
+        f.write(file_path + '\0')
+
+def flush_queue():
+    """Format every queued path, running each formatter once over all its files."""
+    try:
+        with open(QUEUE_FILE, encoding='utf-8') as f:
+            queued = f.read()
+        os.remove(QUEUE_FILE)
+    except OSError:
+        return
+
+    groups = {}
+    for file_path in dict.fromkeys(p for p in queued.split('\0') if p):
+        formatter = get_formatter_command(file_path)
+        if formatter and os.path.exists(file_path):
+            groups.setdefault(tuple(formatter), []).append(file_path)
+
+    for formatter, paths in groups.items():
+        try:
+            subprocess.run(list(formatter) + paths, capture_output=True, timeout=FORMAT_TIMEOUT)
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            pass
+
 def main():
+    if '--flush' in sys.argv[1:]:
+        try:
+            flush_queue()
+        except Exception:
+            pass
+        stop_blackd()
+        sys.exit(0)
+
     try:
-        input_data = json.load(sys.stdin)
+        input_data = load_input(sys.stdin)
         file_path = input_data.get('tool_input', {}).get('file_path', '')
-        
-        if not file_path or not os.path.exists(file_path):
+
+        # Resolve the formatter before touching the filesystem: most edited file
+        # types have none, and then there is nothing to stat
+        if not file_path or not get_formatter_command(file_path):
             sys.exit(0)
-        
-        formatter = get_formatter_command(file_path)
-        if formatter:
-            cmd = formatter + [file_path]
-            try:
-                subprocess.run(cmd, capture_output=True, timeout=10)
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                # Formatter not installed or timed out - skip silently
-                pass
+        if not os.path.exists(file_path):
+            sys.exit(0)
+
+        if os.environ.get('CLAUDE_FMT_BATCH') == '1':
+            enqueue(file_path)
+        else:
+            format_file(file_path, get_extension(file_path))
     except Exception:
         # Don't block on formatter errors
         pass
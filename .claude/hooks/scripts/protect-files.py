@@ -7,6 +7,16 @@ import json
 import sys
 import os
 import fnmatch
+import re
+
+# orjson parses the hook payload several times faster than the stdlib parser
+try:
+    import orjson
+
+    def load_input(stream):
+        return orjson.loads(stream.buffer.read())
+except ImportError:
+    load_input = json.load
 
 # Files/patterns to protect (exit code 2 = block)
 PROTECTED_PATTERNS = [
@@ -40,26 +50,60 @@ WARN_PATTERNS = [
     '**/production/*',
 ]
 
-def matches_pattern(file_path, patterns):
-    """Check if file matches any protected pattern."""
-    file_path = file_path.lstrip('./')
+def compile_patterns(patterns):
+    """
+    Split patterns into exact basenames and globs.
+
+    Literal names (no wildcard, no directory part) go into a dict for an O(1)
+    basename lookup. The remaining globs are unioned into one regex whose
+    group ``p<index>`` names the matching glob. Returns (exact, glob_re, globs).
+    """
+    exact = {}
+    globs = []
     for pattern in patterns:
-        if fnmatch.fnmatch(file_path, pattern):
-            return pattern
-        if fnmatch.fnmatch(os.path.basename(file_path), pattern):
-            return pattern
-    return None
+        if any(c in pattern for c in '*?[') or '/' in pattern:
+            globs.append(pattern)
+        else:
+            exact.setdefault(os.path.normcase(pattern), pattern)
+    glob_re = re.compile("|".join(
+        f"(?P<p{i}>{fnmatch.translate(os.path.normcase(pattern))})"
+        for i, pattern in enumerate(globs)
+    )) if globs else None
+    return exact, glob_re, globs
+
+# Compiled once at import so each check is a dict lookup plus one regex match per name
+_PROTECTED = compile_patterns(PROTECTED_PATTERNS)
+_WARN = compile_patterns(WARN_PATTERNS)
+
+def matches_pattern(file_path, patterns, compiled=None):
+    """Check if file matches any protected pattern."""
+    exact, glob_re, globs = compiled or compile_patterns(patterns)
+    file_path = os.path.normcase(file_path.lstrip('./'))
+    basename = os.path.basename(file_path)
+
+    if basename in exact:
+        return exact[basename]
+    if glob_re is None:
+        return None
+
+    hits = [
+        int(match.lastgroup[1:])
+        for match in (glob_re.match(file_path), glob_re.match(basename))
+        if match
+    ]
+    # Report the earliest listed glob, as a pattern-by-pattern scan would
+    return globs[min(hits)] if hits else None
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = load_input(sys.stdin)
         file_path = input_data.get('tool_input', {}).get('file_path', '')
         
         if not file_path:
             sys.exit(0)
         
         # Check for blocked patterns
-        blocked = matches_pattern(file_path, PROTECTED_PATTERNS)
+        blocked = matches_pattern(file_path, PROTECTED_PATTERNS, _PROTECTED)
         if blocked:
             print(f"🚫 BLOCKED: {file_path}")
             print(f"   Matches protected pattern: {blocked}")
@@ -67,7 +111,7 @@ def main():
             sys.exit(2)  # Block the operation
         
         # Check for warning patterns
-        warned = matches_pattern(file_path, WARN_PATTERNS)
+        warned = matches_pattern(file_path, WARN_PATTERNS, _WARN)
         if warned:
             print(f"⚠️ WARNING: Editing sensitive file: {file_path}")
             print(f"   Matches pattern: {warned}")
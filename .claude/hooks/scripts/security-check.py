@@ -4,27 +4,77 @@ Pre-commit security check hook.
 Blocks commits that might contain secrets or security issues.
 """
 import json
-import re
 import sys
 import os
 
-# Patterns that indicate potential secrets
+# orjson parses the hook payload several times faster than the stdlib parser
+try:
+    import orjson
+
+    def load_input(stream):
+        return orjson.loads(stream.buffer.read())
+except ImportError:
+    load_input = json.load
+
+# Prefer RE2 (linear-time DFA matching, immune to pathological backtracking on large
+# pasted blobs); fall back to the stdlib engine when google-re2 isn't installed
+try:
+    import re2 as _re
+except ImportError:
+    import re as _re
+
+# Patterns that indicate potential secrets, with the lowercase literals at least one of
+# which must appear in the content for the pattern to possibly match
 SECRET_PATTERNS = [
-    (r'(?i)(api[_-]?key|apikey)\s*[:=]\s*["\']?[a-zA-Z0-9_-]{20,}', "API key"),
-    (r'(?i)(secret|password|passwd|pwd)\s*[:=]\s*["\'][^"\']+["\']', "Password/Secret"),
-    (r"(?i)bearer\s+[a-zA-Z0-9_-]{20,}", "Bearer token"),
-    (r"ghp_[a-zA-Z0-9]{36}", "GitHub Personal Access Token"),
-    (r"github_pat_[a-zA-Z0-9]{22}_[a-zA-Z0-9]{59}", "GitHub PAT (fine-grained)"),
-    (r"sk-[a-zA-Z0-9]{48}", "OpenAI API Key"),
-    (r"sk-ant-[a-zA-Z0-9-]{90,}", "Anthropic API Key"),
-    (r"-----BEGIN (?:RSA |EC |DSA )?PRIVATE KEY-----", "Private key"),
-    (r"(?i)aws[_-]?access[_-]?key[_-]?id\s*[:=]\s*[A-Z0-9]{20}", "AWS Access Key"),
+    (
+        r'(?i)(api[_-]?key|apikey)\s*[:=]\s*["\']?[a-zA-Z0-9_-]{20,}',
+        "API key",
+        ("api",),
+    ),
+    (
+        r'(?i)(secret|password|passwd|pwd)\s*[:=]\s*["\'][^"\']+["\']',
+        "Password/Secret",
+        ("secret", "passw", "pwd"),
+    ),
+    (r"(?i)bearer\s+[a-zA-Z0-9_-]{20,}", "Bearer token", ("bearer",)),
+    (r"ghp_[a-zA-Z0-9]{36}", "GitHub Personal Access Token", ("ghp_",)),
+    (
+        r"github_pat_[a-zA-Z0-9]{22}_[a-zA-Z0-9]{59}",
+        "GitHub PAT (fine-grained)",
+        ("github_pat_",),
+    ),
+    (r"sk-[a-zA-Z0-9]{48}", "OpenAI API Key", ("sk-",)),
+    (r"sk-ant-[a-zA-Z0-9-]{90,}", "Anthropic API Key", ("sk-ant-",)),
+    (r"-----BEGIN (?:RSA |EC |DSA )?PRIVATE KEY-----", "Private key", ("-----begin",)),
+    (
+        r"(?i)aws[_-]?access[_-]?key[_-]?id\s*[:=]\s*[A-Z0-9]{20}",
+        "AWS Access Key",
+        ("aws",),
+    ),
     (
         r"(?i)aws[_-]?secret[_-]?access[_-]?key\s*[:=]\s*[a-zA-Z0-9/+=]{40}",
         "AWS Secret Key",
+        ("aws",),
     ),
 ]
 
+
+# Each pattern compiled once per process. They are searched one by one rather than as a
+# single union: a union scan only returns non-overlapping matches, so a secret nested
+# inside another match (e.g. an OpenAI key assigned to api_key) would go unreported.
+_SECRET_RES = tuple(_re.compile(pattern) for pattern, _, _ in SECRET_PATTERNS)
+# Bytes twins: the patterns are pure ASCII, and scanning bytes skips the per-character
+# Unicode handling of str matching
+_SECRET_RES_BYTES = tuple(
+    _re.compile(pattern.encode("ascii")) for pattern, _, _ in SECRET_PATTERNS
+)
+_LABELS = [secret_type for _, secret_type, _ in SECRET_PATTERNS]
+_REQUIRED = [required for _, _, required in SECRET_PATTERNS]
+_REQUIRED_BYTES = [tuple(literal.encode("ascii") for literal in required) for required in _REQUIRED]
+
+# str content above this size is scanned as bytes when it is pure ASCII
+BYTES_SCAN_THRESHOLD = 1024 * 1024
+
 # Files to always skip
 SKIP_FILES = {
     ".env.example",
@@ -36,36 +86,53 @@ SKIP_FILES = {
 }
 
 
-def check_for_secrets(content, file_path):
-    """Check content for potential secrets."""
-    issues = []
-
+def should_skip(file_path):
+    """Whether a file is exempt from the secret scan."""
     # Skip certain files
     if os.path.basename(file_path) in SKIP_FILES:
-        return issues
+        return True
 
     # Skip test files checking for secret patterns
-    if "test" in file_path.lower() or "spec" in file_path.lower():
-        return issues
+    path_lower = file_path.lower()
+    return "test" in path_lower or "spec" in path_lower
+
+
+def check_for_secrets(content, file_path):
+    """Check content for potential secrets. Callers filter out skipped files first."""
+    issues = []
 
-    for pattern, secret_type in SECRET_PATTERNS:
-        matches = re.findall(pattern, content)
-        if matches:
-            issues.append(f"Potential {secret_type} detected")
+    if isinstance(content, str) and len(content) > BYTES_SCAN_THRESHOLD and content.isascii():
+        content = content.encode("ascii")
+    if isinstance(content, bytes):
+        secret_res, required_literals = _SECRET_RES_BYTES, _REQUIRED_BYTES
+    else:
+        secret_res, required_literals = _SECRET_RES, _REQUIRED
+
+    # Cheap substring prefilter: only patterns whose literal markers occur can match,
+    # and most content contains none of them, so their regex scans are skipped entirely
+    content_lower = content.lower()
+    for index, required in enumerate(required_literals):
+        if any(literal in content_lower for literal in required):
+            if secret_res[index].search(content):
+                issues.append(f"Potential {_LABELS[index]} detected")
 
     return issues
 
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = load_input(sys.stdin)
         tool_input = input_data.get("tool_input", {})
 
         # Get file path and content based on tool type
         file_path = tool_input.get("file_path", "")
-        content = tool_input.get("content", "") or tool_input.get("new_string", "")
 
-        if not file_path or not content:
+        # Decide on the path alone before pulling out a potentially large payload
+        if not file_path or should_skip(file_path):
+            sys.exit(0)
+
+        content = tool_input.get("content", "") or tool_input.get("new_string", "")
+        if not content:
             sys.exit(0)
 
         issues = check_for_secrets(content, file_path)
@@ -3,10 +3,16 @@
 SessionStart hook - Validates environment on session startup.
 Checks for required tools, configuration, and potential issues.
 """
+import hashlib
 import json
 import os
 import shutil
 import sys
+import time
+
+PROJECT_DIR = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
+CACHE_FILE = os.path.join(PROJECT_DIR, ".claude", ".env-check.json")
+CACHE_TTL_SECONDS = 24 * 60 * 60
 
 
 def check_environment():
@@ -33,7 +39,7 @@ def check_environment():
         warnings.append("Git not found - version control commands unavailable")
 
     # Check for .env file (warning if missing in project root)
-    project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
+    project_dir = PROJECT_DIR
     env_file = os.path.join(project_dir, ".env")
 
     if not os.path.exists(env_file):
@@ -49,9 +55,54 @@ def check_environment():
     return info, warnings
 
 
+def cache_key():
+    """
+    Fingerprint of everything the check depends on.
+
+    PATH decides the tool lookups; the project directory's mtime changes
+    whenever .env, package.json or node_modules is created or removed.
+    """
+    try:
+        project_mtime = os.stat(PROJECT_DIR).st_mtime_ns
+    except OSError:
+        project_mtime = 0
+    raw = f"{os.environ.get('PATH', '')}\0{PROJECT_DIR}\0{project_mtime}"
+    return hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()
+
+
+def load_cached(key):
+    """Return cached (info, warnings) if fresh and computed for this key."""
+    try:
+        if time.time() - os.path.getmtime(CACHE_FILE) > CACHE_TTL_SECONDS:
+            return None
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("key") != key:
+        return None
+    return data.get("info", []), data.get("warnings", [])
+
+
+def save_cached(key, info, warnings):
+    """Store the check results; failures are ignored."""
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "info": info, "warnings": warnings}, f)
+    except OSError:
+        pass
+
+
 def main():
     try:
-        info, warnings = check_environment()
+        key = cache_key()
+        cached = load_cached(key)
+        if cached is not None:
+            info, warnings = cached
+        else:
+            info, warnings = check_environment()
+            save_cached(key, info, warnings)
 
         # Print environment status
         if info:
@@ -7,6 +7,15 @@ import json
 import re
 import sys
 
+# orjson parses the hook payload several times faster than the stdlib parser
+try:
+    import orjson
+
+    def load_input(stream):
+        return orjson.loads(stream.buffer.read())
+except ImportError:
+    load_input = json.load
+
 # Keywords that might benefit from specific agent involvement
 AGENT_HINTS = {
     r"\b(review|check|look at)\b.*\b(code|changes|pr|pull request)\b": "Tip: Consider using the code-reviewer agent for thorough code reviews.",
@@ -29,22 +38,31 @@ DANGEROUS_PATTERNS = [
     (r"\btruncate\s+table\b", "⚠️ Warning: TRUNCATE TABLE will delete all data"),
 ]
 
+# Compiled once at import rather than on every prompt. Matching is case-insensitive at the
+# regex level so the prompt never needs a lowercased copy.
+_AGENT_HINTS = [
+    (re.compile(pattern, re.IGNORECASE), hint) for pattern, hint in AGENT_HINTS.items()
+]
+# Dangerous patterns are searched one by one: a unioned scan only returns non-overlapping
+# matches, and the greedy force-push pattern would hide any command after it on the line
+_DANGEROUS_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), warning) for pattern, warning in DANGEROUS_PATTERNS
+)
+
 
 def validate_prompt(prompt):
     """Validate the user prompt and provide helpful context."""
     messages = []
 
-    prompt_lower = prompt.lower()
-
     # Check for agent hints
-    for pattern, hint in AGENT_HINTS.items():
-        if re.search(pattern, prompt_lower):
+    for pattern, hint in _AGENT_HINTS:
+        if pattern.search(prompt):
             messages.append(hint)
             break  # Only show one hint
 
     # Check for dangerous patterns
-    for pattern, warning in DANGEROUS_PATTERNS:
-        if re.search(pattern, prompt_lower, re.IGNORECASE):
+    for pattern, warning in _DANGEROUS_PATTERNS:
+        if pattern.search(prompt):
             messages.append(warning)
 
     return messages
@@ -52,7 +70,7 @@ def validate_prompt(prompt):
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = load_input(sys.stdin)
         prompt = input_data.get("prompt", "")
 
         if not prompt:
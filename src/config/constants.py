@@ -3,7 +3,9 @@ Application constants and default paths.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Tuple
 
 # Application Info
 APP_NAME = "IDA Plugin Manager"
@@ -15,6 +17,15 @@ CONFIG_DIR = Path(os.environ.get("APPDATA", "")) / "IDA-Plugin-Manager"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 LOG_DIR = CONFIG_DIR / "logs"
 DATABASE_FILE = CONFIG_DIR / "plugins.db"
+# Caches must not land in the working directory when APPDATA is unset, so they fall
+# back to the same data directory the DI container uses for the database
+CACHE_DIR = (
+    CONFIG_DIR
+    if CONFIG_DIR.is_absolute()
+    else Path.home() / "AppData" / "Roaming" / "IDA-Plugin-Manager"
+)
+IDA_CACHE_FILE = CACHE_DIR / "ida_cache.json"
+ASSET_CACHE_DIR = CACHE_DIR / "asset_cache"
 
 # IDA Pro Default Paths
 # Uses glob patterns to match any version - future-proof for IDA 9.x, 10.x, etc.
@@ -33,6 +44,48 @@ IDA_DEFAULT_PATHS = [
     Path("C:/Program Files (x86)/IDA*"),
 ]
 
+
+@lru_cache(maxsize=1)
+def resolve_ida_paths() -> Tuple[Path, ...]:
+    """
+    Expand IDA_DEFAULT_PATHS into the existing directories they match.
+
+    Trailing-only wildcards (``IDA Pro*``) list each parent directory once
+    with os.scandir and filter by name prefix, avoiding the per-entry fnmatch
+    and stat work of Path.glob; any other pattern (``?``, ``[...]`` or a
+    non-trailing ``*``) falls back to Path.glob. The result is cached for
+    the lifetime of the process; call ``resolve_ida_paths.cache_clear()``
+    to rescan.
+
+    Returns:
+        Tuple of matching paths in IDA_DEFAULT_PATHS order, without duplicates.
+    """
+    results = {}
+    for pattern_path in IDA_DEFAULT_PATHS:
+        name = pattern_path.name
+        if not any(c in name for c in "*?["):
+            if pattern_path.exists():
+                results[pattern_path] = None
+            continue
+
+        prefix = name.rstrip("*")
+        if any(c in prefix for c in "*?["):
+            for match in sorted(pattern_path.parent.glob(name)):
+                if match.is_dir():
+                    results[match] = None
+            continue
+
+        prefix = os.path.normcase(prefix)
+        try:
+            with os.scandir(pattern_path.parent) as entries:
+                for entry in entries:
+                    if os.path.normcase(entry.name).startswith(prefix) and entry.is_dir():
+                        results[Path(entry.path)] = None
+        except OSError:
+            continue
+
+    return tuple(results)
+
 # Windows Registry Keys for IDA Pro
 IDA_REGISTRY_KEYS = [
     (r"SOFTWARE\Hex-Rays\IDA", "InstallDir"),
@@ -65,6 +118,7 @@ DEFAULT_AUTO_CHECK_UPDATES = True
 
 # Installation
 INSTALL_BACKUP_ENABLED = True
+INSTALL_BACKUP_KEEP = 3  # Backups kept per plugin; older ones are deleted
 INSTALL_CONCURRENT_DOWNLOADS = 3
 
 # Logging
@@ -75,3 +129,6 @@ LOG_BACKUP_COUNT = 5
 
 # Cache
 GITHUB_CACHE_TTL_SECONDS = 24 * 60 * 60  # 24 hours
+LATEST_RELEASE_CACHE_TTL_SECONDS = 5 * 60  # 5 minutes, revalidated by ETag afterwards
+UPDATE_RECHECK_INTERVAL_SECONDS = 60 * 60  # Stored update-check results trusted for 1 hour
+ASSET_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 256 MB of release assets, least recently used evicted
@@ -3,9 +3,15 @@ Configuration management for IDA Plugin Manager.
 """
 
 import json
-from dataclasses import dataclass, field
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
 
 from src.config.constants import (
     CONFIG_DIR,
@@ -104,6 +110,8 @@ class SettingsManager:
         """
         self.config_path = config_path or CONFIG_FILE
         self.config = AppConfig()
+        self._in_batch = False
+        self._dirty = False
         self._ensure_config_dir()
         self.load()
 
@@ -127,15 +135,7 @@ class SettingsManager:
                 data = json.load(f)
 
             # Parse into config object
-            self.config = AppConfig(
-                version=data.get("version", "0.1.0"),
-                ida=IDAConfig(**data.get("ida", {})),
-                github=GitHubConfig(**data.get("github", {})),
-                plugin_sources=data.get("plugin_sources", []),
-                updates=UpdatesConfig(**data.get("updates", {})),
-                ui=UIConfig(**data.get("ui", {})),
-                advanced=AdvancedConfig(**data.get("advanced", {})),
-            )
+            self.config = self._from_dict(data)
             return True
 
         except (json.JSONDecodeError, TypeError) as e:
@@ -150,49 +150,53 @@ class SettingsManager:
             True if successful, False otherwise.
         """
         try:
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self._to_dict(), f, indent=2)
+            self._write_json(self.config_path)
             return True
         except (IOError, TypeError) as e:
             print(f"Failed to save config: {e}")
             return False
 
+    @staticmethod
+    def _from_dict(data: Dict[str, Any]) -> AppConfig:
+        """
+        Build a config object from a parsed JSON dictionary.
+
+        Nested sections are constructed from their sub-dictionaries by walking
+        the AppConfig fields, so new sections need no changes here. Missing
+        keys keep their defaults; unknown keys in a section raise TypeError.
+        """
+        values = {}
+        for config_field in fields(AppConfig):
+            if config_field.name not in data:
+                continue
+            value = data[config_field.name]
+            if is_dataclass(config_field.type):
+                value = config_field.type(**value)
+            values[config_field.name] = value
+        return AppConfig(**values)
+
+    def _write_json(self, path: Path) -> None:
+        """
+        Write the configuration as indented JSON.
+
+        Uses orjson when installed, which serializes the dataclasses directly
+        without building an intermediate dict; falls back to the json module.
+        Encoding errors surface as TypeError either way.
+        """
+        if orjson is not None:
+            path.write_bytes(
+                orjson.dumps(
+                    self.config, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS
+                )
+            )
+            return
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self._to_dict(), f, indent=2)
+
     def _to_dict(self) -> Dict[str, Any]:
         """Convert config object to dictionary."""
-        return {
-            "version": self.config.version,
-            "ida": {
-                "install_path": self.config.ida.install_path,
-                "version": self.config.ida.version,
-                "plugin_dir": self.config.ida.plugin_dir,
-                "auto_detect": self.config.ida.auto_detect,
-            },
-            "github": {
-                "token": self.config.github.token,
-                "api_base": self.config.github.api_base,
-                "rate_limit": self.config.github.rate_limit,
-            },
-            "plugin_sources": self.config.plugin_sources,
-            "updates": {
-                "auto_check": self.config.updates.auto_check,
-                "check_interval_hours": self.config.updates.check_interval_hours,
-                "include_pre_release": self.config.updates.include_pre_release,
-                "notify_only": self.config.updates.notify_only,
-            },
-            "ui": {
-                "theme": self.config.ui.theme,
-                "window_width": self.config.ui.window_width,
-                "window_height": self.config.ui.window_height,
-                "column_widths": self.config.ui.column_widths,
-            },
-            "advanced": {
-                "log_level": self.config.advanced.log_level,
-                "backup_on_uninstall": self.config.advanced.backup_on_uninstall,
-                "keep_install_history": self.config.advanced.keep_install_history,
-                "max_history_entries": self.config.advanced.max_history_entries,
-                "concurrent_downloads": self.config.advanced.concurrent_downloads,
-            },
-        }
+        return asdict(self.config)
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -237,8 +241,50 @@ class SettingsManager:
                 return False
 
         setattr(obj, keys[-1], value)
+        if self._in_batch:
+            self._dirty = True
+            return True
         return self.save()
 
+    @contextmanager
+    def batch(self) -> Iterator["SettingsManager"]:
+        """
+        Defer saving while applying several set() calls.
+
+        The configuration is written once when the block exits, and only if
+        something was changed inside it.
+
+        Example:
+            with settings.batch():
+                settings.set("ui.theme", "Light")
+                settings.set("ui.window_width", 1600)
+        """
+        if self._in_batch:
+            # Nested batch: the outermost block does the save
+            yield self
+            return
+
+        self._in_batch = True
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            if self._dirty:
+                self.flush()
+
+    def flush(self) -> bool:
+        """
+        Save pending changes made inside a batch.
+
+        Returns:
+            True if successful (or nothing was pending), False otherwise
+        """
+        if not self._dirty:
+            return True
+        saved = self.save()
+        self._dirty = not saved
+        return saved
+
     def reset_to_defaults(self) -> None:
         """Reset configuration to defaults."""
         self.config = AppConfig()
@@ -255,8 +301,7 @@ class SettingsManager:
             True if successful, False otherwise
         """
         try:
-            with open(destination, "w", encoding="utf-8") as f:
-                json.dump(self._to_dict(), f, indent=2)
+            self._write_json(destination)
             return True
         except (IOError, TypeError) as e:
             print(f"Failed to export config: {e}")
@@ -276,15 +321,7 @@ class SettingsManager:
             with open(source, "r", encoding="utf-8") as f:
                 data = json.load(f)
 
-            self.config = AppConfig(
-                version=data.get("version", "0.1.0"),
-                ida=IDAConfig(**data.get("ida", {})),
-                github=GitHubConfig(**data.get("github", {})),
-                plugin_sources=data.get("plugin_sources", []),
-                updates=UpdatesConfig(**data.get("updates", {})),
-                ui=UIConfig(**data.get("ui", {})),
-                advanced=AdvancedConfig(**data.get("advanced", {})),
-            )
+            self.config = self._from_dict(data)
             return self.save()
         except (json.JSONDecodeError, TypeError, IOError) as e:
             print(f"Failed to import config: {e}")
@@ -7,6 +7,7 @@ Provides DI container for managing application dependencies.
 from src.containers.di_container import (
     DIContainer,
     ApplicationContainer,
+    CircularDependencyError,
     get_container,
     reset_container,
 )
@@ -14,6 +15,7 @@ from src.containers.di_container import (
 __all__ = [
     "DIContainer",
     "ApplicationContainer",
+    "CircularDependencyError",
     "get_container",
     "reset_container",
 ]
@@ -3,25 +3,138 @@ Dependency Injection Container.
 
 Manages application dependencies and their lifecycle.
 Follows Service Locator pattern for dependency resolution.
+
+Component modules are imported lazily inside the factory methods, so only
+the components actually resolved pay their import cost. Registrations are
+keyed by the dotted path of the type (module plus qualified name), so
+same-named classes in different modules never collide. get() accepts a
+type, its dotted path, or the short name of a built-in component.
 """
 
+from __future__ import annotations
+
+import threading
+from collections import deque
+from functools import cached_property, lru_cache
 from logging import getLogger
-from typing import Optional, Dict, Any, TypeVar, Type, Callable
+from typing import (
+    TYPE_CHECKING, Optional, Dict, Any, TypeVar, Type, Callable, Union, List, Tuple,
+)
 from pathlib import Path
 
-from src.database.db_manager import DatabaseManager
-from src.github.client import GitHubClient
-from src.core.ida_detector import IDADetector
-from src.core.installer import PluginInstaller
-from src.core.version_manager import VersionManager
-from src.core.plugin_manager import PluginManager
-from src.services.plugin_service import PluginService
-from src.repositories.plugin_repository import PluginRepository
+if TYPE_CHECKING:
+    from src.database.db_manager import DatabaseManager
+    from src.github.client import GitHubClient
+    from src.core.ida_detector import IDADetector
+    from src.core.installer import PluginInstaller
+    from src.core.version_manager import VersionManager
+    from src.core.plugin_manager import PluginManager
+    from src.services.plugin_service import PluginService
+    from src.repositories.plugin_repository import PluginRepository
 
 logger = getLogger(__name__)
 
 T = TypeVar('T')
 
+# Sentinel for singleton lookups, distinct from a registered None
+_MISSING = object()
+
+
+# Dotted paths of the built-in components, by the short names they are also
+# looked up with
+_COMPONENT_PATHS: Dict[str, str] = {
+    "DatabaseManager": "src.database.db_manager.DatabaseManager",
+    "GitHubClient": "src.github.client.GitHubClient",
+    "IDADetector": "src.core.ida_detector.IDADetector",
+    "VersionManager": "src.core.version_manager.VersionManager",
+    "PluginInstaller": "src.core.installer.PluginInstaller",
+    "PluginRepository": "src.repositories.plugin_repository.PluginRepository",
+    "PluginManager": "src.core.plugin_manager.PluginManager",
+    "PluginService": "src.services.plugin_service.PluginService",
+}
+
+
+def _type_key(type_: Union[Type, str]) -> str:
+    """Return the registry key (dotted path) for a type, a dotted path or a short name."""
+    if isinstance(type_, str):
+        return _COMPONENT_PATHS.get(type_, type_)
+    return f"{type_.__module__}.{type_.__qualname__}"
+
+
+class CircularDependencyError(ValueError):
+    """Raised when resolving a type requires resolving that same type again."""
+
+
+# Dependencies of the default factories, by short name
+_DEFAULT_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    "DatabaseManager": (),
+    "GitHubClient": (),
+    "IDADetector": (),
+    "VersionManager": (),
+    "PluginInstaller": ("GitHubClient", "VersionManager"),
+    "PluginRepository": ("DatabaseManager",),
+    "PluginManager": (
+        "DatabaseManager",
+        "GitHubClient",
+        "IDADetector",
+        "PluginInstaller",
+        "VersionManager",
+    ),
+    "PluginService": (
+        "DatabaseManager",
+        "GitHubClient",
+        "IDADetector",
+        "PluginInstaller",
+        "VersionManager",
+    ),
+}
+
+# The same graph by registry key
+_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    _type_key(name): tuple(_type_key(dependency) for dependency in dependencies)
+    for name, dependencies in _DEFAULT_DEPENDENCIES.items()
+}
+
+
+@lru_cache(maxsize=None)
+def _resolution_order(key: str) -> Tuple[str, ...]:
+    """
+    Return the dependencies of ``key`` in construction order, ending with ``key``.
+
+    Uses Kahn's algorithm over the subgraph of _DEPENDENCIES reachable from
+    ``key``; the graph is static, so each order is computed once per process.
+
+    Raises:
+        CircularDependencyError: If the dependency graph contains a cycle
+    """
+    nodes = []
+    stack = [key]
+    while stack:
+        node = stack.pop()
+        if node not in nodes:
+            nodes.append(node)
+            stack.extend(_DEPENDENCIES.get(node, ()))
+
+    remaining = {node: len(_DEPENDENCIES.get(node, ())) for node in nodes}
+    dependents: Dict[str, List[str]] = {node: [] for node in nodes}
+    for node in nodes:
+        for dependency in _DEPENDENCIES.get(node, ()):
+            dependents[dependency].append(node)
+
+    ready = deque(node for node in nodes if remaining[node] == 0)
+    order = []
+    while ready:
+        node = ready.popleft()
+        order.append(node)
+        for dependent in dependents[node]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+
+    if len(order) != len(nodes):
+        raise CircularDependencyError(f"Circular dependency detected while resolving {key}")
+    return tuple(order)
+
 
 class DIContainer:
     """
@@ -38,9 +151,13 @@ class DIContainer:
         Args:
             config_path: Optional path to configuration file
         """
-        self._singletons: Dict[Type, Any] = {}
-        self._factories: Dict[Type, Callable] = {}
+        self._singletons: Dict[str, Any] = {}
+        self._factories: Dict[str, Callable] = {}
+        # The built-in factories, whose dependencies _DEPENDENCIES describes
+        self._default_factories: Dict[str, Callable] = {}
         self._config: Dict[str, Any] = {}
+        # Per-thread (keys, chain) of the types currently being constructed
+        self._resolving = threading.local()
 
         # Load configuration if provided
         if config_path:
@@ -63,23 +180,29 @@ class DIContainer:
 
     def _register_default_factories(self):
         """Register default factory methods for common types."""
-        self._factories[DatabaseManager] = self._create_database_manager
-        self._factories[GitHubClient] = self._create_github_client
-        self._factories[IDADetector] = self._create_ida_detector
-        self._factories[VersionManager] = self._create_version_manager
-        self._factories[PluginInstaller] = self._create_plugin_installer
-        self._factories[PluginRepository] = self._create_plugin_repository
-        self._factories[PluginManager] = self._create_plugin_manager
-        self._factories[PluginService] = self._create_plugin_service
+        # Keyed by dotted path, not type, so registering does not import the
+        # component modules
+        self._default_factories = {
+            _type_key("DatabaseManager"): self._create_database_manager,
+            _type_key("GitHubClient"): self._create_github_client,
+            _type_key("IDADetector"): self._create_ida_detector,
+            _type_key("VersionManager"): self._create_version_manager,
+            _type_key("PluginInstaller"): self._create_plugin_installer,
+            _type_key("PluginRepository"): self._create_plugin_repository,
+            _type_key("PluginManager"): self._create_plugin_manager,
+            _type_key("PluginService"): self._create_plugin_service,
+        }
+        self._factories.update(self._default_factories)
 
     # ============ Factory Methods ============
 
     def _create_database_manager(self) -> DatabaseManager:
         """Create DatabaseManager instance."""
+        from src.database.db_manager import DatabaseManager
+
         db_path = self._config.get('database_path')
         if not db_path:
             # Default to AppData
-            from pathlib import Path
             appdata = Path.home() / "AppData" / "Roaming" / "IDA-Plugin-Manager"
             appdata.mkdir(parents=True, exist_ok=True)
             db_path = appdata / "plugins.db"
@@ -91,6 +214,8 @@ class DIContainer:
 
     def _create_github_client(self) -> GitHubClient:
         """Create GitHubClient instance."""
+        from src.github.client import GitHubClient
+
         token = self._config.get('github_token')
         client = GitHubClient(token=token)
         logger.info("Created GitHubClient")
@@ -98,12 +223,16 @@ class DIContainer:
 
     def _create_ida_detector(self) -> IDADetector:
         """Create IDADetector instance."""
+        from src.core.ida_detector import IDADetector
+
         detector = IDADetector()
         logger.info("Created IDADetector")
         return detector
 
     def _create_version_manager(self) -> VersionManager:
         """Create VersionManager instance."""
+        from src.core.version_manager import VersionManager
+
         manager = VersionManager()
         logger.info("Created VersionManager")
         return manager
@@ -114,10 +243,12 @@ class DIContainer:
         version_manager: Optional[VersionManager] = None,
     ) -> PluginInstaller:
         """Create PluginInstaller instance."""
+        from src.core.installer import PluginInstaller
+
         if github_client is None:
-            github_client = self.get(GitHubClient)
+            github_client = self.get("GitHubClient")
         if version_manager is None:
-            version_manager = self.get(VersionManager)
+            version_manager = self.get("VersionManager")
 
         installer = PluginInstaller(github_client, version_manager)
         logger.info("Created PluginInstaller")
@@ -128,8 +259,10 @@ class DIContainer:
         db_manager: Optional[DatabaseManager] = None,
     ) -> PluginRepository:
         """Create PluginRepository instance."""
+        from src.repositories.plugin_repository import PluginRepository
+
         if db_manager is None:
-            db_manager = self.get(DatabaseManager)
+            db_manager = self.get("DatabaseManager")
 
         repository = PluginRepository(db_manager)
         logger.info("Created PluginRepository")
@@ -144,16 +277,18 @@ class DIContainer:
         version_manager: Optional[VersionManager] = None,
     ) -> PluginManager:
         """Create PluginManager instance."""
+        from src.core.plugin_manager import PluginManager
+
         if db_manager is None:
-            db_manager = self.get(DatabaseManager)
+            db_manager = self.get("DatabaseManager")
         if github_client is None:
-            github_client = self.get(GitHubClient)
+            github_client = self.get("GitHubClient")
         if ida_detector is None:
-            ida_detector = self.get(IDADetector)
+            ida_detector = self.get("IDADetector")
         if installer is None:
-            installer = self.get(PluginInstaller)
+            installer = self.get("PluginInstaller")
         if version_manager is None:
-            version_manager = self.get(VersionManager)
+            version_manager = self.get("VersionManager")
 
         manager = PluginManager(
             db_manager=db_manager,
@@ -174,17 +309,18 @@ class DIContainer:
         version_manager: Optional[VersionManager] = None,
     ) -> PluginService:
         """Create PluginService instance."""
+        from src.services.plugin_service import PluginService
+
         if db_manager is None:
-            db_manager = self.get(DatabaseManager)
+            db_manager = self.get("DatabaseManager")
         if github_client is None:
-            github_client = self.get(GitHubClient)
+            github_client = self.get("GitHubClient")
         if ida_detector is None:
-            ida_detector = self.get(IDADetector)
-        if version_manager is None:
-            version_manager = self.get(VersionManager)
-        # PluginInstaller must be created AFTER github_client and version_manager are resolved
+            ida_detector = self.get("IDADetector")
         if installer is None:
-            installer = PluginInstaller(github_client, version_manager)
+            installer = self.get("PluginInstaller")
+        if version_manager is None:
+            version_manager = self.get("VersionManager")
 
         service = PluginService(
             db_manager=db_manager,
@@ -198,56 +334,86 @@ class DIContainer:
 
     # ============ Public API ============
 
-    def get(self, type_: Type[T]) -> T:
+    def get(self, type_: Union[Type[T], str]) -> T:
         """
         Get instance of specified type.
 
         Args:
-            type_: Type to retrieve
+            type_: Type to retrieve, or its name
 
         Returns:
             Instance of requested type
 
         Raises:
             ValueError: If type is not registered
+            CircularDependencyError: If constructing the type requires itself
         """
-        # Check if singleton exists
-        if type_ in self._singletons:
-            return self._singletons[type_]
+        key = _type_key(type_)
 
-        # Check if factory exists
-        if type_ not in self._factories:
-            raise ValueError(f"Type {type_.__name__} is not registered in container")
+        # Check if singleton exists (one lookup; None is a valid registered instance)
+        instance = self._singletons.get(key, _MISSING)
+        if instance is not _MISSING:
+            return instance
 
-        # Create instance using factory
-        instance = self._factories[type_]()
+        # Check if factory exists
+        factory = self._factories.get(key)
+        if factory is None:
+            raise ValueError(f"Type {key} is not registered in container")
+
+        # Guard against factories that (transitively) resolve their own type
+        resolving = getattr(self._resolving, "stack", None)
+        if resolving is None:
+            resolving = self._resolving.stack = (set(), [])
+        keys, chain = resolving
+        if key in keys:
+            raise CircularDependencyError(
+                "Circular dependency detected: " + " -> ".join(chain + [key])
+            )
+        keys.add(key)
+        chain.append(key)
+        try:
+            # Materialize a built-in factory's dependencies in topological order,
+            # so its own lookups are all singleton hits and each dependency is
+            # built once. A registered factory may need none of them.
+            if factory is self._default_factories.get(key):
+                for dependency in _resolution_order(key)[:-1]:
+                    if dependency not in self._singletons and self.is_registered(dependency):
+                        self.get(dependency)
+
+            # Create instance using factory
+            instance = factory()
+        finally:
+            keys.discard(key)
+            chain.pop()
 
         # Store as singleton
-        self._singletons[type_] = instance
+        self._singletons[key] = instance
 
         return instance
 
-    def register(self, type_: Type[T], instance: T):
+    def register(self, type_: Union[Type[T], str], instance: T):
         """
         Register a singleton instance.
 
         Args:
-            type_: Type to register
+            type_: Type to register, or its name
             instance: Instance to use
         """
-        self._singletons[type_] = instance
-        logger.info(f"Registered singleton: {type_.__name__}")
+        key = _type_key(type_)
+        self._singletons[key] = instance
+        logger.info(f"Registered singleton: {key}")
 
-    def register_factory(self, type_: Type[T], factory: Callable[..., T]):
+    def register_factory(self, type_: Union[Type[T], str], factory: Callable[..., T]):
         """
         Register a factory method for a type.
 
         Args:
-            type_: Type to register
+            type_: Type to register, or its name
             factory: Factory method
         """
-        self._factories[type_] = factory
-        logger.info(f"Registered factory: {type_.__name__}")
+        key = _type_key(type_)
+        self._factories[key] = factory
+        logger.info(f"Registered factory: {key}")
 
     def set_config(self, key: str, value: Any):
         """
@@ -273,17 +439,18 @@ class DIContainer:
         """
         return self._config.get(key, default)
 
-    def is_registered(self, type_: Type) -> bool:
+    def is_registered(self, type_: Union[Type, str]) -> bool:
         """
         Check if type is registered.
 
         Args:
-            type_: Type to check
+            type_: Type to check, or its name
 
         Returns:
             True if registered, False otherwise
         """
-        return type_ in self._factories or type_ in self._singletons
+        key = _type_key(type_)
+        return key in self._factories or key in self._singletons
 
     def clear(self):
         """Clear all singletons and reset container."""
@@ -309,52 +476,80 @@ class ApplicationContainer(DIContainer):
     Application-specific DI container.
 
     Provides convenience methods for common application dependencies.
+    Each accessor resolves its component once and then caches it on the
+    instance; clear() and register() drop the cached attributes.
     """
 
+    _CACHED_PROPERTIES = (
+        "db",
+        "github",
+        "ida_detector",
+        "installer",
+        "version_manager",
+        "plugin_repository",
+        "plugin_manager",
+        "plugin_service",
+    )
+
     def __init__(self, config_path: Optional[Path] = None):
         """Initialize application container."""
         super().__init__(config_path)
         logger.info("ApplicationContainer initialized")
 
-    @property
+    def _invalidate_properties(self):
+        """Drop component instances cached by the convenience properties."""
+        for name in self._CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
+
+    def register(self, type_: Union[Type[T], str], instance: T):
+        """Register a singleton instance, replacing any cached property value."""
+        super().register(type_, instance)
+        self._invalidate_properties()
+
+    def clear(self):
+        """Clear all singletons, including those cached by the properties."""
+        self._invalidate_properties()
+        super().clear()
+
+    @cached_property
     def db(self) -> DatabaseManager:
         """Get database manager."""
-        return self.get(DatabaseManager)
+        return self.get("DatabaseManager")
 
-    @property
+    @cached_property
     def github(self) -> GitHubClient:
         """Get GitHub client."""
-        return self.get(GitHubClient)
+        return self.get("GitHubClient")
 
-    @property
+    @cached_property
     def ida_detector(self) -> IDADetector:
         """Get IDA detector."""
-        return self.get(IDADetector)
+        return self.get("IDADetector")
 
-    @property
+    @cached_property
     def installer(self) -> PluginInstaller:
         """Get plugin installer."""
-        return self.get(PluginInstaller)
+        return self.get("PluginInstaller")
 
-    @property
+    @cached_property
     def version_manager(self) -> VersionManager:
         """Get version manager."""
-        return self.get(VersionManager)
+        return self.get("VersionManager")
 
-    @property
+    @cached_property
     def plugin_repository(self) -> PluginRepository:
         """Get plugin repository."""
-        return self.get(PluginRepository)
+        return self.get("PluginRepository")
 
-    @property
+    @cached_property
     def plugin_manager(self) -> PluginManager:
         """Get plugin manager."""
-        return self.get(PluginManager)
+        return self.get("PluginManager")
 
-    @property
+    @cached_property
     def plugin_service(self) -> PluginService:
         """Get plugin service."""
-        return self.get(PluginService)
+        return self.get("PluginService")
 
 
 # ============ Global Container Instance ============
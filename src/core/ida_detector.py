@@ -5,14 +5,19 @@ Handles detection of IDA Pro installations on Windows, version extraction,
 and plugin directory path resolution.
 """
 
+import hashlib
+import json
 import os
 import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import winreg
 
-from src.config.constants import IDA_DEFAULT_PATHS, IDA_REGISTRY_KEYS
+from src.config.constants import IDA_CACHE_FILE, IDA_REGISTRY_KEYS, resolve_ida_paths
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -29,46 +34,162 @@ class IDADetector:
     4. PATH environment variable
     """
 
-    def __init__(self):
-        """Initialize IDA detector."""
+    # Version patterns for idatag.cfg, e.g. "Version 9.0", tried in order
+    _CFG_PATTERNS = tuple(
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r"Version\s+(\d+\.\d+)",
+            r"IDA\s+Version\s*[:=]\s*(\d+\.\d+)",
+            r"HEXRAYS_IDA_VERSION\s*[:=]\s*[\"']?(\d+\.\d+)",
+        )
+    )
+    # Executable names that mark a directory as an IDA installation
+    _IDA_EXECUTABLES = frozenset({"ida.exe", "idat.exe"})
+    # Characters of idatag.cfg searched before falling back to the whole file
+    _CFG_HEAD_SIZE = 8192
+    # Directory name patterns: "IDA Pro X.Y" (or "X.Y.ZZZ"), then a bare version number
+    _PATH_PATTERNS = (
+        re.compile(r"IDA Pro\s+(\d+\.\d+)", re.IGNORECASE),
+        re.compile(r"(\d+\.\d+)"),
+    )
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        """
+        Initialize IDA detector.
+
+        Args:
+            cache_path: Path of the on-disk installation cache. Defaults to IDA_CACHE_FILE.
+        """
         self._cached_installations: Optional[List[Tuple[Path, str]]] = None
+        # Detected versions keyed by _path_key(path); each lookup opens ida.exe and idatag.cfg
+        self._version_cache: Dict[str, Optional[str]] = {}
+        # Guards _version_cache, which the background refresh replaces
+        self._version_lock = threading.Lock()
+        # (IDAUSR value, directories) from the last get_idausr_directories call
+        self._idausr_cache: Optional[Tuple[str, List[Path]]] = None
+        self._cache_path = cache_path or IDA_CACHE_FILE
 
     def find_all_installations(self) -> List[Tuple[Path, str]]:
         """
         Find all IDA Pro installations on the system.
 
+        Results persist on disk between runs. When the on-disk cache matches
+        the current environment it is returned immediately and a background
+        thread rescans and rewrites it (stale-while-revalidate); otherwise the
+        scan runs synchronously and the cache is written.
+
         Returns:
             List of tuples (installation_path, version)
         """
         if self._cached_installations is not None:
             return self._cached_installations
 
-        installations = []
-
-        # Method 1: Check Windows Registry
-        installations.extend(self._find_from_registry())
+        fingerprint = self._environment_fingerprint()
+        cached = self._load_disk_cache(fingerprint)
+        if cached is not None:
+            self._cached_installations = cached
+            threading.Thread(
+                target=self._refresh_cache_bg, args=(fingerprint,), daemon=True
+            ).start()
+            return cached
 
-        # Method 2: Check common paths
-        installations.extend(self._find_from_common_paths())
+        unique_installations = self._scan_installations()
+        self._cached_installations = unique_installations
+        self._write_disk_cache(fingerprint, unique_installations)
+        return unique_installations
 
-        # Method 3: Check PATH environment variable
-        installations.extend(self._find_from_path())
+    def _scan_installations(self) -> List[Tuple[Path, str]]:
+        """Run every detection method and return validated, deduplicated installations."""
+        # The three methods are I/O bound and independent, so probe them concurrently.
+        # Results are gathered in submission order to keep registry hits first.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                # Method 1: Check Windows Registry
+                executor.submit(self._find_from_registry),
+                # Method 2: Check common paths
+                executor.submit(self._find_from_common_paths),
+                # Method 3: Check PATH environment variable
+                executor.submit(self._find_from_path),
+            ]
+            installations = [entry for future in futures for entry in future.result()]
 
         # Remove duplicates and validate
         seen = set()
         unique_installations = []
         for path, version in installations:
-            if str(path) not in seen:
-                if self.validate_ida_installation(path):
-                    seen.add(str(path))
-                    # If version not found, try to detect it
-                    if not version:
-                        version = self.get_ida_version(path) or "unknown"
-                    unique_installations.append((path, version))
+            # Registry and PATH entries may differ only in case or separators
+            key = self._path_key(path)
+            if key in seen:
+                continue
+            seen.add(key)
+            if self.validate_ida_installation(path):
+                # Candidates carry no version; detect it once per unique install
+                if not version:
+                    version = self.get_ida_version(path) or "unknown"
+                unique_installations.append((path, version))
 
-        self._cached_installations = unique_installations
         return unique_installations
 
+    @staticmethod
+    def _path_key(path: Path) -> str:
+        """Comparison key for a path: normalized, and case-folded on Windows."""
+        return os.path.normcase(os.path.normpath(str(path)))
+
+    def _environment_fingerprint(self) -> str:
+        """Fingerprint of the environment variables that influence detection."""
+        # Separated so that moving text between the two variables changes the fingerprint
+        raw = "\0".join((os.environ.get("PATH", ""), os.environ.get("IDAUSR", "")))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _load_disk_cache(self, fingerprint: str) -> Optional[List[Tuple[Path, str]]]:
+        """Load cached installations if the cache was written for this fingerprint."""
+        try:
+            with open(self._cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("fingerprint") != fingerprint:
+                return None
+            return [(Path(path), version) for path, version in data["entries"]]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"IDA installation cache unavailable: {e}")
+            return None
+
+    def _write_disk_cache(
+        self, fingerprint: str, installations: List[Tuple[Path, str]]
+    ) -> None:
+        """Atomically replace the on-disk cache with the given installations."""
+        data = {
+            "fingerprint": fingerprint,
+            "entries": [[str(path), version] for path, version in installations],
+        }
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self._cache_path.parent, prefix=".ida_cache_", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self._cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Failed to write IDA installation cache: {e}")
+
+    def _refresh_cache_bg(self, fingerprint: str) -> None:
+        """Rescan installations and refresh both the in-memory and on-disk caches."""
+        try:
+            # Rescan from scratch so upgraded installs report their new version
+            with self._version_lock:
+                self._version_cache = {}
+            installations = self._scan_installations()
+        except Exception as e:
+            logger.debug(f"Background IDA detection failed: {e}")
+            return
+
+        self._cached_installations = installations
+        self._write_disk_cache(fingerprint, installations)
+
     def find_ida_installation(self, preferred_version: Optional[str] = None) -> Optional[Path]:
         """
         Find IDA Pro installation.
@@ -107,6 +228,18 @@ class IDADetector:
         Returns:
             Version string or None if not found.
         """
+        key = self._path_key(ida_path)
+        with self._version_lock:
+            if key in self._version_cache:
+                return self._version_cache[key]
+        # Detect outside the lock; a concurrent lookup of the same path only repeats the work
+        version = self._detect_ida_version(ida_path)
+        with self._version_lock:
+            self._version_cache[key] = version
+        return version
+
+    def _detect_ida_version(self, ida_path: Path) -> Optional[str]:
+        """Run the version detection methods in order, uncached."""
         # Method 1: Check exe file properties
         version = self._get_exe_version(ida_path)
         if version:
@@ -133,11 +266,21 @@ class IDADetector:
         - Windows: semicolon (;)
         - Linux/Mac: colon (:)
 
+        The result is cached until the value of IDAUSR changes.
+
         Returns:
             List of IDAUSR directories. Returns default location if not set.
         """
         idausr_env = os.environ.get("IDAUSR", "")
+        if self._idausr_cache is not None and self._idausr_cache[0] == idausr_env:
+            return list(self._idausr_cache[1])
 
+        paths = self._resolve_idausr_directories(idausr_env)
+        self._idausr_cache = (idausr_env, paths)
+        return list(paths)
+
+    def _resolve_idausr_directories(self, idausr_env: str) -> List[Path]:
+        """Resolve IDAUSR directories for the given environment value, uncached."""
         if not idausr_env:
             # Return default location based on platform
             if os.name == "nt":  # Windows
@@ -180,16 +323,17 @@ class IDADetector:
         if prefer_user:
             idausr_dirs = self.get_idausr_directories()
             for idausr_dir in idausr_dirs:
-                user_plugin_dir = idausr_dir / "plugins"
-                if user_plugin_dir.exists():
+                # Probe with plain strings; build a Path only for the hit
+                user_plugin_dir = os.path.join(idausr_dir, "plugins")
+                if os.path.isdir(user_plugin_dir):
                     logger.info(f"Using IDAUSR plugins directory: {user_plugin_dir}")
-                    return user_plugin_dir
+                    return Path(user_plugin_dir)
 
         # 2. Fallback to installation directory
-        plugin_dir = ida_path / "plugins"
-        if plugin_dir.exists():
+        plugin_dir = os.path.join(ida_path, "plugins")
+        if os.path.isdir(plugin_dir):
             logger.info(f"Using IDADIR plugins directory: {plugin_dir}")
-            return plugin_dir
+            return Path(plugin_dir)
 
         # 3. Create IDAUSR plugins dir as last resort
         if prefer_user:
@@ -201,7 +345,7 @@ class IDADetector:
                 return user_plugin_dir
 
         # 4. Final fallback
-        return plugin_dir
+        return Path(plugin_dir)
 
     def get_all_plugin_directories(self, ida_path: Path) -> List[Path]:
         """
@@ -222,14 +366,14 @@ class IDADetector:
         # 1. Add all IDAUSR/plugins directories
         idausr_dirs = self.get_idausr_directories()
         for idausr_dir in idausr_dirs:
-            user_plugin_dir = idausr_dir / "plugins"
-            if user_plugin_dir.exists():
-                plugin_dirs.append(user_plugin_dir)
+            user_plugin_dir = os.path.join(idausr_dir, "plugins")
+            if os.path.isdir(user_plugin_dir):
+                plugin_dirs.append(Path(user_plugin_dir))
 
         # 2. Add installation directory
-        plugin_dir = ida_path / "plugins"
-        if plugin_dir.exists():
-            plugin_dirs.append(plugin_dir)
+        plugin_dir = os.path.join(ida_path, "plugins")
+        if os.path.isdir(plugin_dir):
+            plugin_dirs.append(Path(plugin_dir))
 
         return plugin_dirs
 
@@ -248,29 +392,31 @@ class IDADetector:
         Returns:
             True if valid IDA installation, False otherwise.
         """
-        # Check for main executables
-        ida_exe = path / "ida.exe"
-        idat_exe = path / "idat.exe"
+        # One directory listing answers every check below (names are case-insensitive on Windows)
+        try:
+            with os.scandir(path) as it:
+                entries = {entry.name.lower() for entry in it}
+        except OSError:
+            return False
 
-        if not (ida_exe.exists() or idat_exe.exists()):
+        # Check for main executables
+        if not entries & self._IDA_EXECUTABLES:
             return False
 
         # Check for plugins directory
-        plugins_dir = path / "plugins"
-        if not plugins_dir.exists():
+        if "plugins" not in entries:
             return False
 
         # cfg directory is optional but good indicator
-        cfg_dir = path / "cfg"
-        if not cfg_dir.exists():
+        if "cfg" not in entries:
             logger.warning(f"IDA installation at {path} missing cfg directory")
 
         return True
 
     # ============ Private Methods ============
 
-    def _find_from_registry(self) -> List[Tuple[Path, str]]:
-        """Find IDA installations from Windows registry."""
+    def _find_from_registry(self) -> List[Tuple[Path, Optional[str]]]:
+        """Find IDA installations from Windows registry. Versions are resolved after dedup."""
         installations = []
 
         try:
@@ -278,60 +424,48 @@ class IDADetector:
                 # Try both HKLM and HKCU
                 for root_key in [winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER]:
                     try:
-                        key = winreg.OpenKey(root_key, key_path)
-                        install_dir, _ = winreg.QueryValueEx(key, value_name)
-                        winreg.CloseKey(key)
-
-                        if install_dir:
-                            path = Path(install_dir)
-                            version = self.get_ida_version(path)
-                            installations.append((path, version))
-
-                    except (WindowsError, FileNotFoundError):
+                        # Read the 64-bit view explicitly so 32-bit Python isn't redirected
+                        with winreg.OpenKey(
+                            root_key, key_path, 0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY
+                        ) as key:
+                            install_dir, _ = winreg.QueryValueEx(key, value_name)
+                    except OSError:
                         continue
 
+                    if install_dir:
+                        installations.append((Path(install_dir), None))
+
         except Exception as e:
             logger.debug(f"Error reading registry: {e}")
 
         return installations
 
-    def _find_from_common_paths(self) -> List[Tuple[Path, str]]:
-        """Find IDA installations from common paths."""
+    def _find_from_common_paths(self) -> List[Tuple[Path, Optional[str]]]:
+        """Find IDA installations from common paths. Versions are resolved after dedup."""
         installations = []
 
-        for pattern_path in IDA_DEFAULT_PATHS:
-            # Handle wildcard patterns
-            if "*" in str(pattern_path):
-                parent = pattern_path.parent
-                pattern = pattern_path.name
-                if parent.exists():
-                    for path in parent.glob(pattern):
-                        if path.is_dir():
-                            version = self.get_ida_version(path)
-                            installations.append((path, version))
-            else:
-                # Direct path
-                if pattern_path.exists():
-                    version = self.get_ida_version(pattern_path)
-                    installations.append((pattern_path, version))
+        # Wildcard patterns are expanded once per process
+        for path in resolve_ida_paths():
+            installations.append((path, None))
 
         return installations
 
-    def _find_from_path(self) -> List[Tuple[Path, str]]:
-        """Find IDA from PATH environment variable."""
+    def _find_from_path(self) -> List[Tuple[Path, Optional[str]]]:
+        """Find IDA from PATH environment variable. Versions are resolved after dedup."""
         installations = []
 
         try:
             path_env = os.environ.get("PATH", "")
             for dir_path in path_env.split(os.pathsep):
+                # An empty entry would resolve to the current directory
+                if not dir_path:
+                    continue
                 dir_path = Path(dir_path)
-                ida_exe = dir_path / "ida.exe"
-                idat_exe = dir_path / "idat.exe"
 
-                if ida_exe.exists() or idat_exe.exists():
+                # A stat per executable; PATH directories like System32 are too large to list
+                if any((dir_path / exe).exists() for exe in self._IDA_EXECUTABLES):
                     # Found IDA in PATH
-                    version = self.get_ida_version(dir_path)
-                    installations.append((dir_path, version))
+                    installations.append((dir_path, None))
 
         except Exception as e:
             logger.debug(f"Error searching PATH: {e}")
@@ -371,35 +505,33 @@ class IDADetector:
                 return None
 
             with open(cfg_file, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
+                # The version line sits near the top; only read the rest on a miss
+                content = f.read(self._CFG_HEAD_SIZE)
+                version = self._search_cfg_version(content)
+                if version is None and len(content) == self._CFG_HEAD_SIZE:
+                    version = self._search_cfg_version(content + f.read())
 
-            # Look for version pattern like: "Version 9.0" or similar
-            patterns = [
-                r"Version\s+(\d+\.\d+)",
-                r"IDA\s+Version\s*[:=]\s*(\d+\.\d+)",
-                r"HEXRAYS_IDA_VERSION\s*[:=]\s*[\"']?(\d+\.\d+)",
-            ]
-
-            for pattern in patterns:
-                match = re.search(pattern, content, re.IGNORECASE)
-                if match:
-                    return match.group(1)
+            return version
 
         except Exception as e:
             logger.debug(f"Failed to parse idatag.cfg: {e}")
 
         return None
 
+    def _search_cfg_version(self, content: str) -> Optional[str]:
+        """Return the first version captured by the idatag.cfg patterns, in pattern order."""
+        for pattern in self._CFG_PATTERNS:
+            match = pattern.search(content)
+            if match:
+                return match.group(1)
+        return None
+
     def _extract_version_from_path(self, ida_path: Path) -> Optional[str]:
         """Extract version from directory name."""
-        # Pattern: "IDA Pro X.Y" or "IDA Pro X.Y.ZZZ"
-        match = re.search(r"IDA Pro\s+(\d+\.\d+)", str(ida_path), re.IGNORECASE)
-        if match:
-            return match.group(1)
-
-        # Pattern: Just version number
-        match = re.search(r"(\d+\.\d+)", str(ida_path))
-        if match:
-            return match.group(1)
+        path_str = str(ida_path)
+        for pattern in self._PATH_PATTERNS:
+            match = pattern.search(path_str)
+            if match:
+                return match.group(1)
 
         return None
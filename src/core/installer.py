@@ -5,15 +5,33 @@ Handles installing, updating, and uninstalling IDA Pro plugins
 from various sources (GitHub clone, release download, local files).
 """
 
+import asyncio
+import errno
+import hashlib
 import json
+import mmap
+import os
+import re
 import shutil
 import tempfile
+import threading
+import time
+import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, List, Optional, Tuple, Union
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+from src.config.constants import ASSET_CACHE_DIR, ASSET_CACHE_MAX_BYTES, INSTALL_BACKUP_KEEP
 from src.core.version_manager import VersionManager
 from src.github.client import GitHubClient
+from src.github.release_fetcher import ReleaseFetcher
 from src.github.repo_parser import RepoParser
 from src.models.github_info import GitHubRepo, GitHubRelease
 from src.models.plugin import (
@@ -25,8 +43,6 @@ from src.models.plugin import (
 )
 from src.utils.file_ops import (
     backup_directory,
-    cleanup_temp_directory,
-    extract_archive,
     Result as FileResult,
     safe_copy_directory,
     safe_delete_directory,
@@ -36,6 +52,404 @@ from src.utils.validators import parse_github_url, validate_github_url
 
 logger = get_logger(__name__)
 
+# libarchive (libarchive-c) streams archive members in C and releases the GIL;
+# zipfile is used when it or its native library is unavailable
+try:
+    import libarchive
+except (ImportError, OSError):
+    libarchive = None
+
+# Upper bound for the buffer used to stream one zip member to disk
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Markers of a legacy IDA plugin entry point, searched in raw file bytes
+_LEGACY_MARKERS = (b"PLUGIN_ENTRY", b"IDAPEnter", b"IDP_init")
+_SCAN_CHUNK_SIZE = 64 * 1024
+# Files at least this large are memory-mapped for the marker scan
+_MMAP_THRESHOLD = 256 * 1024
+
+# Limits concurrent clones across all installers and threads (GitHub secondary rate limit)
+_GITHUB_THROTTLE = threading.Semaphore(4)
+
+# Hidden directory, beside an uninstalled plugin, that holds backups made by rename
+_BACKUP_DIR_NAME = ".ida-plugin-manager-backups"
+
+# __version__ = "x.y" assignment in a plugin source file
+_VERSION_RE = re.compile(rb"""__version__\s*=\s*["']([^"']+)["']""")
+
+
+def _member_parts(name: str, prefix: str) -> List[str]:
+    """
+    Split an archive member name into path components below the extraction root.
+
+    Raises:
+        ValueError: If the member would escape the extraction root
+    """
+    name = name[len(prefix):].replace("\\", "/")
+    parts = [part for part in name.split("/") if part and part != "."]
+    if parts and (name.startswith("/") or ".." in parts or ":" in parts[0]):
+        raise ValueError(f"Unsafe path in archive: {prefix}{name}")
+    return parts
+
+
+def _extract_zip_fast(
+    archive: Union[Path, BinaryIO], dest_root: Path, strip_single_toplevel: bool = True
+) -> FileResult:
+    """
+    Extract a zip archive directly into its final location.
+
+    Release archives usually wrap the plugin in a single ``<repo>-<tag>/``
+    directory; when every member shares one top-level directory it is
+    stripped so its contents land in ``dest_root``. Every member name is
+    checked before anything is written, and members that would escape
+    ``dest_root`` abort the extraction. Member data is streamed by libarchive
+    when available, otherwise by zipfile.
+
+    Args:
+        archive: Path to the zip archive, or a seekable binary file object
+        dest_root: Directory to extract into
+        strip_single_toplevel: Whether to strip a shared top-level directory
+
+    Returns:
+        Result object with the destination path
+    """
+    try:
+        with zipfile.ZipFile(archive) as zip_file:
+            # Only the central directory is read here; member data is untouched
+            infos = zip_file.infolist()
+
+            # One pass over the names finds a shared top-level directory
+            prefix = ""
+            if strip_single_toplevel and infos:
+                top, sep, _ = infos[0].filename.partition("/")
+                if sep and all(info.filename.startswith(top + "/") for info in infos):
+                    prefix = top + "/"
+
+            members = [(info, _member_parts(info.filename, prefix)) for info in infos]
+
+            dest_root.mkdir(parents=True, exist_ok=True)
+            if libarchive is not None:
+                _extract_members_libarchive(archive, dest_root, prefix)
+            else:
+                _extract_members_zipfile(zip_file, members, dest_root)
+
+        logger.info(f"Extracted ZIP archive to {dest_root}")
+        return FileResult.ok(dest_root)
+
+    except Exception as e:
+        logger.error(f"Failed to extract archive: {e}")
+        return FileResult.fail(str(e))
+
+
+def _extract_members_zipfile(
+    zip_file: zipfile.ZipFile, members: List[Tuple[zipfile.ZipInfo, List[str]]], dest_root: Path
+) -> None:
+    """Write pre-validated (ZipInfo, parts) members with zipfile."""
+    last_dir = None
+    for info, parts in members:
+        if not parts:
+            continue
+
+        target = os.path.join(dest_root, *parts)
+        if info.is_dir():
+            os.makedirs(target, exist_ok=True)
+            continue
+
+        parent = os.path.dirname(target)
+        if parent != last_dir:
+            os.makedirs(parent, exist_ok=True)
+            last_dir = parent
+
+        # Empty members (typically __init__.py) need no member stream
+        if info.file_size == 0:
+            open(target, "wb").close()
+            continue
+
+        with zip_file.open(info) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, min(info.file_size, _COPY_BUFFER_SIZE))
+
+
+def _extract_members_libarchive(
+    archive: Union[Path, BinaryIO], dest_root: Path, prefix: str
+) -> None:
+    """Stream every member with libarchive in a single pass; links and devices are skipped."""
+    if isinstance(archive, Path):
+        reader = libarchive.file_reader(str(archive))
+    else:
+        archive.seek(0)
+        reader = libarchive.stream_reader(archive, format_name="zip")
+
+    last_dir = None
+    with reader as entries:
+        for entry in entries:
+            parts = _member_parts(entry.pathname, prefix)
+            if not parts:
+                continue
+
+            target = os.path.join(dest_root, *parts)
+            if entry.isdir:
+                os.makedirs(target, exist_ok=True)
+                continue
+            if not entry.isreg:
+                continue
+
+            parent = os.path.dirname(target)
+            if parent != last_dir:
+                os.makedirs(parent, exist_ok=True)
+                last_dir = parent
+
+            with open(target, "wb") as dst:
+                for block in entry.get_blocks():
+                    dst.write(block)
+
+
+@dataclass
+class _PluginProbe:
+    """Result of one pass over a plugin directory, shared by validation and versioning."""
+
+    has_manifest: bool = False
+    manifest: Optional[dict] = None
+    manifest_error: Optional[str] = None
+    py_files: List[Path] = field(default_factory=list)
+
+
+def _has_entry_point(py_file: Path) -> bool:
+    """
+    Check whether a Python file contains an IDA plugin entry point marker.
+
+    The file is scanned as bytes in fixed-size chunks, stopping at the first
+    marker, so large files are never loaded whole. Consecutive chunks overlap
+    so markers straddling a chunk boundary are still found. Files of
+    _MMAP_THRESHOLD bytes or more (e.g. generated Qt resource modules) are
+    memory-mapped and searched in place instead of being copied chunk by chunk.
+    """
+    overlap = max(len(marker) for marker in _LEGACY_MARKERS) - 1
+    tail = b""
+    with open(py_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return any(mm.find(marker) != -1 for marker in _LEGACY_MARKERS)
+
+        while chunk := f.read(_SCAN_CHUNK_SIZE):
+            window = tail + chunk
+            if any(marker in window for marker in _LEGACY_MARKERS):
+                return True
+            tail = window[-overlap:]
+    return False
+
+
+def _rename_backup(install_path: Path, install_stat: os.stat_result) -> Tuple[Path, bool]:
+    """
+    Back up a plugin directory by moving it aside.
+
+    The directory is renamed into a hidden backup directory next to it, a
+    metadata-only operation regardless of plugin size. The backup sits two
+    levels below the plugins directory, so IDA never loads it. If the rename
+    fails (e.g. the target is locked or on another device), a copy is made
+    with backup_directory instead and the original is left in place.
+
+    Args:
+        install_path: Plugin directory to back up
+        install_stat: os.stat result for install_path, used to detect a
+            backup directory on another device without attempting the rename
+
+    Returns:
+        Tuple of (backup path, whether install_path was moved)
+    """
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    backup_path = install_path.parent / _BACKUP_DIR_NAME / f"{install_path.name}_{timestamp}"
+    try:
+        backup_path.parent.mkdir(exist_ok=True)
+        if os.stat(backup_path.parent).st_dev != install_stat.st_dev:
+            raise OSError(errno.EXDEV, "Backup directory is on another device")
+        os.rename(install_path, backup_path)
+        logger.info(f"Created backup: {backup_path}")
+        _prune_backups(backup_path.parent, install_path.name)
+        return backup_path, True
+    except OSError as e:
+        logger.debug(f"Backup by rename failed, copying instead: {e}")
+        return backup_directory(install_path), False
+
+
+def _prune_backups(backup_root: Path, name: str, keep: int = INSTALL_BACKUP_KEEP) -> None:
+    """
+    Delete all but the newest backups of one plugin from a backup directory.
+
+    Args:
+        backup_root: Directory holding backups made by _rename_backup
+        name: Plugin directory name the backups were made from
+        keep: Number of most recent backups to keep
+    """
+    pattern = re.compile(re.escape(name) + r"_\d{8}_\d{6}")
+    # Timestamps are zero-padded, so name order is age order
+    backups = sorted(p for p in backup_root.iterdir() if pattern.fullmatch(p.name))
+    for old in backups[:-keep] if keep > 0 else backups:
+        logger.info(f"Removing old backup: {old}")
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def _install_tree(source: Path, destination: Path) -> FileResult:
+    """
+    Move a directory tree into place, replacing any existing destination.
+
+    When source and destination share a filesystem the tree is renamed,
+    which costs the same however large it is. Otherwise it is copied,
+    hardlinking files where the filesystem allows, and the source removed.
+
+    Args:
+        source: Directory to move; it no longer exists afterwards
+        destination: Target directory path
+
+    Returns:
+        Result object
+    """
+    try:
+        same_fs = os.stat(source).st_dev == os.stat(destination.parent).st_dev
+    except OSError:
+        same_fs = False
+
+    if same_fs:
+        try:
+            if destination.exists():
+                shutil.rmtree(destination)
+            os.replace(source, destination)
+            logger.debug(f"Moved directory {source} to {destination}")
+            return FileResult.ok(destination)
+        except OSError as e:
+            logger.debug(f"Rename failed, falling back to copy: {e}")
+
+    # The source is discarded, so hardlinked files cannot alias a live tree
+    result = safe_copy_directory(source, destination, prefer_hardlink=True)
+    if result.success:
+        shutil.rmtree(source, ignore_errors=True)
+    return result
+
+
+def _swap_directory(staging: Path, destination: Path) -> None:
+    """
+    Replace destination with staging, a directory beside it on the same filesystem.
+
+    Any existing destination is renamed aside first and only deleted once
+    staging is in place; if that rename into place fails, it is restored.
+    The aside name must not exist yet, as Windows cannot rename a directory
+    onto an existing one, even an empty one.
+
+    Raises:
+        OSError: If the swap fails; destination is then unchanged
+    """
+    aside = None
+    if destination.exists():
+        aside = destination.with_name(f".{destination.name}.old-{uuid.uuid4().hex}")
+        os.replace(destination, aside)
+    try:
+        os.replace(staging, destination)
+    except OSError:
+        if aside is not None:
+            os.replace(aside, destination)
+        raise
+    if aside is not None:
+        shutil.rmtree(aside, ignore_errors=True)
+
+
+class AssetCache:
+    """
+    On-disk cache of downloaded release assets, validated by ETag.
+
+    Entries are keyed by (plugin_id, tag_name, asset_name) and stored as a
+    data file plus a sidecar file holding the ETag the data was served with.
+    A re-install or rollback to the same release then only costs a HEAD
+    request instead of a full download. The cache holds at most max_bytes of
+    asset data; storing an entry evicts the least recently used ones beyond that.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: int = ASSET_CACHE_MAX_BYTES):
+        """
+        Initialize asset cache.
+
+        Args:
+            cache_dir: Directory holding cached assets (default: ASSET_CACHE_DIR)
+            max_bytes: Largest total size of cached asset data
+        """
+        self.cache_dir = cache_dir or ASSET_CACHE_DIR
+        self.max_bytes = max_bytes
+
+    def _entry_paths(self, key: Tuple[str, str, str]) -> Tuple[Path, Path]:
+        """Return the (data, etag) file paths for a cache key."""
+        digest = hashlib.sha1("\0".join(key).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.bin", self.cache_dir / f"{digest}.etag"
+
+    def get_etag(self, key: Tuple[str, str, str]) -> Optional[str]:
+        """Return the ETag a key was cached under, or None if it is not cached."""
+        try:
+            return self._entry_paths(key)[1].read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def get(self, key: Tuple[str, str, str], etag: str) -> Optional[BinaryIO]:
+        """
+        Open the cached asset for a key if it was stored under the given ETag.
+
+        Returns:
+            Binary file object positioned at the start, or None on a miss.
+            The caller is responsible for closing it.
+        """
+        data_path, etag_path = self._entry_paths(key)
+        try:
+            if etag_path.read_text(encoding="utf-8") != etag:
+                return None
+            buffer = open(data_path, "rb")
+            # The data file's mtime is its last use, for least-recently-used eviction
+            os.utime(data_path)
+            return buffer
+        except OSError:
+            return None
+
+    def put(self, key: Tuple[str, str, str], etag: str, buffer: BinaryIO) -> None:
+        """Store a downloaded asset under a key and ETag, leaving the buffer rewound."""
+        data_path, etag_path = self._entry_paths(key)
+        try:
+            if buffer.seek(0, os.SEEK_END) > self.max_bytes:
+                return
+            buffer.seek(0)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Drop the old ETag first so a half-written entry can never validate
+            etag_path.unlink(missing_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    shutil.copyfileobj(buffer, f, _COPY_BUFFER_SIZE)
+                os.replace(tmp_path, data_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            etag_path.write_text(etag, encoding="utf-8")
+            self._evict(keep=data_path)
+        except OSError as e:
+            logger.debug(f"Failed to cache release asset: {e}")
+        finally:
+            buffer.seek(0)
+
+    def _evict(self, keep: Path) -> None:
+        """Delete least recently used entries, other than keep, until within max_bytes."""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".bin"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.path, stat.st_size))
+                    total += stat.st_size
+
+        for _, path, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == str(keep):
+                continue
+            # ETag first, so an entry never validates with its data missing
+            Path(path).with_suffix(".etag").unlink(missing_ok=True)
+            Path(path).unlink(missing_ok=True)
+            total -= size
+
 
 class PluginInstaller:
     """
@@ -54,6 +468,7 @@ class PluginInstaller:
         self,
         github_client: Optional[GitHubClient] = None,
         version_manager: Optional[VersionManager] = None,
+        asset_cache: Optional[AssetCache] = None,
     ):
         """
         Initialize plugin installer.
@@ -61,10 +476,13 @@ class PluginInstaller:
         Args:
             github_client: GitHub API client (optional)
             version_manager: Version manager (optional)
+            asset_cache: Cache of downloaded release assets (optional)
         """
         self.github_client = github_client or GitHubClient()
         self.version_manager = version_manager or VersionManager()
+        self.asset_cache = asset_cache or AssetCache()
         self.repo_parser = RepoParser()
+        self.release_fetcher = ReleaseFetcher()
 
     def install_from_github_clone(
         self,
@@ -127,7 +545,8 @@ class PluginInstaller:
                 logger.info(f"Removed existing directory: {destination}")
 
             # Clone repository
-            success = self.github_client.clone_repository(repo_url, destination, branch)
+            with _GITHUB_THROTTLE:
+                success = self.github_client.clone_repository(repo_url, destination, branch)
 
             if not success:
                 return InstallationResult(
@@ -137,8 +556,9 @@ class PluginInstaller:
                     error="Git clone operation failed",
                 )
 
-            # Validate plugin structure
-            validation = self._validate_plugin_structure(destination)
+            # Validate plugin structure; the probe is reused for the version below
+            probe = self._probe_plugin(destination)
+            validation = self._validate_plugin_structure(destination, probe)
 
             if not validation.valid:
                 # Cleanup on failure
@@ -152,7 +572,7 @@ class PluginInstaller:
 
             # Get commit hash for version tracking
             commit_hash = self.github_client.get_commit_hash(destination)
-            version = commit_hash or self._extract_version_from_clone(destination)
+            version = commit_hash or self._extract_version_from_probe(probe)
 
             # Success
             logger.info(f"Successfully installed {plugin_id} from clone")
@@ -175,6 +595,54 @@ class PluginInstaller:
                 error=str(e),
             )
 
+    def install_many(
+        self, items: List[Tuple[str, Path, str]], max_workers: int = 4
+    ) -> List[InstallationResult]:
+        """
+        Install several plugins from GitHub clones concurrently.
+
+        Clones are network bound and release the GIL, so running them on a
+        thread pool overlaps their transfers and validation. Use this instead
+        of calling install_from_github_clone in a loop; at most four clones
+        run at once across all callers, in line with GitHub's secondary rate
+        limits.
+
+        Args:
+            items: (repo_url, destination, branch) for each plugin
+            max_workers: Maximum number of concurrent installs
+
+        Returns:
+            InstallationResult for each item, in the same order as items
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.install_from_github_clone, repo_url, destination, branch)
+                for repo_url, destination, branch in items
+            ]
+            return [future.result() for future in futures]
+
+    async def install_from_github_clone_async(
+        self, repo_url: str, destination: Path, branch: str = "main"
+    ) -> InstallationResult:
+        """
+        Install plugin from GitHub clone without blocking the event loop.
+
+        Runs install_from_github_clone on a worker thread, so several installs
+        can be awaited together (e.g. with asyncio.gather). The clone itself is
+        still throttled by the shared limit on concurrent GitHub clones.
+
+        Args:
+            repo_url: GitHub repository URL
+            destination: Installation destination path
+            branch: Branch to clone
+
+        Returns:
+            InstallationResult with operation status
+        """
+        return await asyncio.to_thread(
+            self.install_from_github_clone, repo_url, destination, branch
+        )
+
     def install_from_github_release(
         self,
         repo_url: str,
@@ -210,41 +678,55 @@ class PluginInstaller:
         logger.info(f"Installing plugin from GitHub release: {plugin_id} {release.tag_name}")
 
         try:
-            # Find appropriate asset
-            download_url = None
-            for asset in release.assets:
-                if asset.name.endswith(".zip"):
-                    download_url = asset.download_url
-                    break
-                elif asset.name.endswith(".py") and not download_url:
-                    download_url = asset.download_url
-
-            if not download_url:
+            # Find appropriate asset: the first .zip, else the first .py
+            asset = next(
+                (asset for asset in release.assets if asset.name.endswith(".zip")), None
+            ) or next((asset for asset in release.assets if asset.name.endswith(".py")), None)
+
+            if asset is None or not asset.download_url:
                 return InstallationResult(
                     success=False,
                     plugin_id=plugin_id,
                     message="No downloadable asset found in release",
                     error="Release contains no .zip or .py files",
                 )
+            download_url = asset.download_url
+
+            # Reuse a previous download of this asset while its ETag is unchanged;
+            # only an asset already in the cache costs a HEAD request to revalidate
+            cache_key = (plugin_id, release.tag_name, asset.name)
+            buffer = None
+            if self.asset_cache.get_etag(cache_key) is not None:
+                etag = self.github_client.get_asset_etag(download_url)
+                buffer = self.asset_cache.get(cache_key, etag) if etag else None
+
+            if buffer is not None:
+                logger.info(f"Using cached release asset {asset.name}")
+            else:
+                # Download into a buffer that ZipFile reads directly; a copy is kept
+                # in the size-bounded asset cache for later reinstalls
+                buffer, etag = self.github_client.download_release_asset_with_etag(download_url)
+                if buffer is not None and etag:
+                    self.asset_cache.put(cache_key, etag, buffer)
+
+            if buffer is None:
+                return InstallationResult(
+                    success=False,
+                    plugin_id=plugin_id,
+                    message="Failed to download release asset",
+                    error="Download operation failed",
+                )
 
-            # Download to temp file
-            temp_dir = Path(tempfile.mkdtemp(prefix="ida_plugin_release_"))
-
+            # Extract into a hidden sibling of the destination and swap it in by
+            # rename only once it validates, so a bad archive never touches an
+            # existing installation
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            staging = Path(
+                tempfile.mkdtemp(dir=destination.parent, prefix=f".{destination.name}.new-")
+            )
             try:
-                # Download
-                temp_file = temp_dir / "release.zip"
-                downloaded = self.github_client.download_release_asset(download_url, temp_file)
-
-                if not downloaded:
-                    return InstallationResult(
-                        success=False,
-                        plugin_id=plugin_id,
-                        message="Failed to download release asset",
-                        error="Download operation failed",
-                    )
-
-                # Extract archive
-                extract_result = extract_archive(temp_file, temp_dir / "extracted")
+                # If the archive contains a single directory, its contents are used
+                extract_result = _extract_zip_fast(buffer, staging)
 
                 if not extract_result.success:
                     return InstallationResult(
@@ -254,22 +736,9 @@ class PluginInstaller:
                         error=extract_result.error,
                     )
 
-                # Copy to destination
-                extracted_path = temp_dir / "extracted"
-                contents = list(extracted_path.iterdir())
-
-                # If archive contains single directory, use its contents
-                if len(contents) == 1 and contents[0].is_dir():
-                    source = contents[0]
-                else:
-                    source = extracted_path
-
-                safe_copy_directory(source, destination)
-
                 # Validate
-                validation = self._validate_plugin_structure(destination)
+                validation = self._validate_plugin_structure(staging)
                 if not validation.valid:
-                    safe_delete_directory(destination)
                     return InstallationResult(
                         success=False,
                         plugin_id=plugin_id,
@@ -277,10 +746,10 @@ class PluginInstaller:
                         error=validation.error,
                     )
 
+                _swap_directory(staging, destination)
+
                 # Success
-                version = self.github_client.__class__.__dict__.get("ReleaseFetcher", type(
-                    "ReleaseFetcher", (), {}
-                )()).extract_version(release.tag_name) if hasattr(release, "tag_name") else release.tag_name
+                version = self.release_fetcher.extract_version(release.tag_name)
 
                 logger.info(f"Successfully installed {plugin_id} from release")
                 return InstallationResult(
@@ -293,8 +762,8 @@ class PluginInstaller:
                 )
 
             finally:
-                # Cleanup temp directory
-                shutil.rmtree(temp_dir, ignore_errors=True)
+                buffer.close()
+                shutil.rmtree(staging, ignore_errors=True)
 
         except Exception as e:
             logger.error(f"Release installation failed: {e}")
@@ -321,7 +790,13 @@ class PluginInstaller:
         try:
             install_path = Path(plugin.install_path) if plugin.install_path else None
 
-            if not install_path or not install_path.exists():
+            # One stat answers both "does it exist" and, for the backup, "which device"
+            try:
+                install_stat = os.stat(install_path) if install_path else None
+            except OSError:
+                install_stat = None
+
+            if install_stat is None:
                 return InstallationResult(
                     success=False,
                     plugin_id=plugin.id,
@@ -329,18 +804,19 @@ class PluginInstaller:
                     error="Plugin files do not exist at expected location",
                 )
 
-            # Create backup if requested
+            # Create backup if requested; a backup made by rename already removed the files
             backup_path = None
+            moved = False
             if backup:
-                backup_path = backup_directory(install_path)
+                backup_path, moved = _rename_backup(install_path, install_stat)
 
             # Delete plugin files
-            result = safe_delete_directory(install_path)
+            result = FileResult.ok() if moved else safe_delete_directory(install_path)
 
             if not result.success:
                 # Restore backup if deletion failed
                 if backup_path and backup_path.exists():
-                    safe_copy_directory(backup_path, install_path)
+                    _install_tree(backup_path, install_path)
                 return InstallationResult(
                     success=False,
                     plugin_id=plugin.id,
@@ -354,6 +830,7 @@ class PluginInstaller:
                 plugin_id=plugin.id,
                 message=f"Successfully uninstalled {plugin.name}",
                 previous_version=plugin.installed_version,
+                backup_path=str(backup_path) if backup_path else None,
             )
 
         except Exception as e:
@@ -379,53 +856,82 @@ class PluginInstaller:
 
     # ============ Private Methods ============
 
-    def _validate_plugin_structure(self, plugin_path: Path) -> ValidationResult:
+    def _probe_plugin(self, plugin_path: Path) -> _PluginProbe:
+        """
+        Collect what validation and version extraction need in one directory pass.
+
+        Lists ``plugin_path`` once, parsing plugins.json if present and
+        recording the top-level Python files. A path that is not a directory
+        yields an empty probe.
+        """
+        probe = _PluginProbe()
+        try:
+            with os.scandir(plugin_path) as entries:
+                for entry in entries:
+                    if entry.name == "plugins.json":
+                        probe.has_manifest = True
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        probe.py_files.append(Path(entry.path))
+        except NotADirectoryError:
+            return probe
+
+        if probe.has_manifest:
+            try:
+                raw = (plugin_path / "plugins.json").read_bytes()
+                probe.manifest = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except (ValueError, OSError) as e:
+                # Both json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors
+                probe.manifest_error = str(e)
+
+        return probe
+
+    def _validate_plugin_structure(
+        self, plugin_path: Path, probe: Optional[_PluginProbe] = None
+    ) -> ValidationResult:
         """Validate plugin structure and detect type."""
         if not plugin_path.exists():
             return ValidationResult(valid=False, error="Plugin path does not exist")
 
-        # Check for plugins.json (modern plugin)
-        plugins_json = plugin_path / "plugins.json"
-        if plugins_json.exists():
-            try:
-                with open(plugins_json, "r") as f:
-                    data = json.load(f)
+        if probe is None:
+            probe = self._probe_plugin(plugin_path)
 
-                # Validate required fields
-                if "name" not in data or "version" not in data:
-                    return ValidationResult(
-                        valid=False,
-                        error="Invalid plugins.json: missing required fields",
-                    )
-
-                # Check entry point exists
-                entry_point = data.get("entry_point", "plugin.py")
-                entry_path = plugin_path / entry_point
-                if not entry_path.exists():
-                    return ValidationResult(
-                        valid=False,
-                        error=f"Entry point {entry_point} not found",
-                    )
+        # Check for plugins.json (modern plugin)
+        if probe.has_manifest:
+            if probe.manifest is None:
+                return ValidationResult(
+                    valid=False,
+                    error=f"Invalid plugins.json: {probe.manifest_error}",
+                )
+            data = probe.manifest
 
+            # Validate required fields
+            if "name" not in data or "version" not in data:
                 return ValidationResult(
-                    valid=True,
-                    plugin_type=PluginType.MODERN,
+                    valid=False,
+                    error="Invalid plugins.json: missing required fields",
                 )
 
-            except json.JSONDecodeError as e:
+            # Check entry point exists
+            entry_point = data.get("entry_point", "plugin.py")
+            entry_path = plugin_path / entry_point
+            if not entry_path.exists():
                 return ValidationResult(
                     valid=False,
-                    error=f"Invalid plugins.json: {e}",
+                    error=f"Entry point {entry_point} not found",
                 )
 
+            return ValidationResult(
+                valid=True,
+                plugin_type=PluginType.MODERN,
+            )
+
         # Check for legacy plugin patterns
-        py_files = list(plugin_path.glob("*.py"))
+        py_files = probe.py_files
 
         if py_files:
             # Look for IDA plugin entry points
             for py_file in py_files:
-                content = py_file.read_text(errors="ignore")
-                if "PLUGIN_ENTRY" in content or "IDAPEnter" in content or "IDP_init" in content:
+                if _has_entry_point(py_file):
                     return ValidationResult(
                         valid=True,
                         plugin_type=PluginType.LEGACY,
@@ -445,22 +951,18 @@ class PluginInstaller:
 
     def _extract_version_from_clone(self, plugin_path: Path) -> Optional[str]:
         """Extract version from cloned plugin."""
+        return self._extract_version_from_probe(self._probe_plugin(plugin_path))
+
+    def _extract_version_from_probe(self, probe: _PluginProbe) -> Optional[str]:
+        """Extract version from an already probed plugin without re-reading plugins.json."""
         # Check plugins.json
-        plugins_json = plugin_path / "plugins.json"
-        if plugins_json.exists():
-            try:
-                data = json.loads(plugins_json.read_text())
-                return data.get("version")
-            except (json.JSONDecodeError, IOError):
-                pass
+        if probe.manifest is not None:
+            return probe.manifest.get("version")
 
         # Check for version in Python files
-        for py_file in plugin_path.glob("*.py"):
-            content = py_file.read_text(errors="ignore")
-            import re
-
-            match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
+        for py_file in probe.py_files:
+            match = _VERSION_RE.search(py_file.read_bytes())
             if match:
-                return match.group(1)
+                return match.group(1).decode("utf-8", "replace")
 
         return None
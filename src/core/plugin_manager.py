@@ -7,16 +7,23 @@ Maintained for backwards compatibility.
 New code should use PluginService directly.
 """
 
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 from src.core.ida_detector import IDADetector
 from src.core.installer import PluginInstaller
 from src.core.version_manager import VersionManager
 from src.database.db_manager import DatabaseManager
-from src.database.models import Plugin as DBPlugin
 from src.github.client import GitHubClient
-from src.models.github_info import GitHubRepo, GitHubRelease
 from src.models.plugin import (
     InstallationResult,
     Plugin,
@@ -29,6 +36,14 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Module-level dunder assignments in single-file legacy plugins
+_VERSION_RE = re.compile(r'__version__\s*=\s*["\']([^"\']+)["\']')
+_AUTHOR_RE = re.compile(r'__author__\s*=\s*["\']([^"\']+)["\']')
+# Those assignments sit at the top of the file, so only its head is read
+_LEGACY_HEAD_SIZE = 8192
+# Plugin entries inspected concurrently by scan_local_plugins
+_SCAN_WORKERS = 8
+
 
 class PluginManager:
     """
@@ -99,23 +114,19 @@ class PluginManager:
             logger.info(f"Plugin directory does not exist: {plugin_dir}")
             return []
 
-        plugins = []
+        # Scan for plugins; scandir entries carry their file type, so telling
+        # directories from files needs no extra stat per entry
+        with os.scandir(plugin_dir) as it:
+            entries = list(it)
+        if os.name == "posix":
+            # Visiting entries in inode order keeps disk access roughly sequential.
+            # On Windows inode() costs a stat per entry, so the listing order stays.
+            entries.sort(key=lambda e: e.inode())
 
-        # Scan for plugins
-        for item in plugin_dir.iterdir():
-            if item.is_dir():
-                # Modern plugin or directory-based legacy plugin
-                validation = self.installer.validate_plugin_structure(item)
-                if validation.valid:
-                    plugin = self._create_plugin_from_path(item, validation.plugin_type)
-                    if plugin:
-                        plugins.append(plugin)
-
-            elif item.is_file() and item.suffix == ".py":
-                # Single-file legacy plugin
-                plugin = self._create_legacy_plugin_from_file(item)
-                if plugin:
-                    plugins.append(plugin)
+        # Each entry needs its own small reads, so overlap them on a thread pool;
+        # map() keeps the results in entry order
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+            plugins = [p for p in executor.map(self._scan_entry, entries) if p]
 
         logger.info(f"Found {len(plugins)} local plugins")
         return plugins
@@ -229,26 +240,42 @@ class PluginManager:
 
     # ============ Private Methods ============
 
+    def _scan_entry(self, entry: os.DirEntry) -> Optional[Plugin]:
+        """Create Plugin object from a plugin directory entry, if it holds one."""
+        if entry.is_dir():
+            # Modern plugin or directory-based legacy plugin
+            item = Path(entry.path)
+            validation = self.installer.validate_plugin_structure(item)
+            if validation.valid:
+                return self._create_plugin_from_path(item, validation.plugin_type)
+
+        elif entry.name.endswith(".py") and entry.is_file():
+            # Single-file legacy plugin
+            return self._create_legacy_plugin_from_file(Path(entry.path))
+
+        return None
+
     def _create_plugin_from_path(self, path: Path, plugin_type: PluginType) -> Optional[Plugin]:
         """Create Plugin object from directory path."""
-        import json
-
         name = path.name
         version = None
         author = None
         description = None
 
         if plugin_type == PluginType.MODERN:
-            plugins_json = path / "plugins.json"
-            if plugins_json.exists():
-                try:
-                    data = json.loads(plugins_json.read_text())
-                    name = data.get("name", name)
-                    version = data.get("version")
-                    author = data.get("author")
-                    description = data.get("description")
-                except (json.JSONDecodeError, IOError):
-                    pass
+            # A modern plugin was validated from the directory listing, which
+            # included plugins.json, so read it without another existence check;
+            # a file removed since then surfaces as OSError
+            try:
+                raw = (path / "plugins.json").read_bytes()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                name = data.get("name", name)
+                version = data.get("version")
+                author = data.get("author")
+                description = data.get("description")
+            except (ValueError, OSError):
+                # Both json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors
+                pass
 
         return Plugin(
             id=name,
@@ -263,24 +290,25 @@ class PluginManager:
 
     def _create_legacy_plugin_from_file(self, path: Path) -> Optional[Plugin]:
         """Create Plugin object from single .py file."""
-        import re
-
         name = path.stem
         version = None
         author = None
 
         try:
-            content = path.read_text(errors="ignore")
+            with open(path, "rb") as f:
+                content = f.read(_LEGACY_HEAD_SIZE).decode("utf-8", errors="ignore")
 
             # Extract version
-            match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
-            if match:
-                version = match.group(1)
+            if "__version__" in content:
+                match = _VERSION_RE.search(content)
+                if match:
+                    version = match.group(1)
 
             # Extract author
-            match = re.search(r'__author__\s*=\s*["\']([^"\']+)["\']', content)
-            if match:
-                author = match.group(1)
+            if "__author__" in content:
+                match = _AUTHOR_RE.search(content)
+                if match:
+                    author = match.group(1)
 
         except IOError:
             pass
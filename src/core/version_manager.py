@@ -4,6 +4,7 @@ Version management and compatibility checking.
 Handles version parsing, comparison, and compatibility validation.
 """
 
+from functools import lru_cache
 from typing import Optional, Tuple
 
 from packaging import version
@@ -15,6 +16,15 @@ from src.utils.validators import validate_ida_version, validate_version_string
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _parse_version_cached(cleaned: str) -> Optional[version.Version]:
+    """Parse a cleaned version string; Version objects are immutable, so results are shared."""
+    try:
+        return version.parse(cleaned)
+    except version.InvalidVersion:
+        return None
+
+
 class VersionManager:
     """
     Manage plugin versions and compatibility.
@@ -39,13 +49,11 @@ class VersionManager:
         Returns:
             Version object or None if invalid
         """
-        try:
-            # Clean version string
-            cleaned = version_str.strip().lstrip("vV")
-            return version.parse(cleaned)
-        except version.InvalidVersion:
+        # Clean version string
+        parsed = _parse_version_cached(version_str.strip().lstrip("vV"))
+        if parsed is None:
             logger.warning(f"Invalid version string: {version_str}")
-            return None
+        return parsed
 
     def compare_versions(self, v1: str, v2: str) -> int:
         """
@@ -7,20 +7,133 @@ and queries for plugins, history, and settings.
 REFACTORED: Uses context managers for all session operations to prevent resource leaks.
 """
 
+import copy
 import json
+import threading
 from datetime import datetime, timezone
 from logging import getLogger
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from sqlalchemy import create_engine
+from sqlalchemy import (
+    Row, bindparam, create_engine, event, insert, inspect, or_, select, text, update
+)
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker, Session
 
 from src.config.constants import DATABASE_FILE
 from src.database.models import Base, Plugin, GitHubRepo, InstallationHistory, Settings
+from src.utils.version_utils import is_version_compatible, pack_version
 
 logger = getLogger(__name__)
 
+# Applied to every new SQLite connection. WAL with synchronous=NORMAL drops the
+# per-commit fsync of the rollback journal; the mmap window and the larger page
+# cache (negative = KiB) cut read syscalls on list queries.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Plugin columns written by update_plugin(); status and update-check state
+# have their own update methods
+_UPDATABLE_PLUGIN_FIELDS = (
+    "name",
+    "description",
+    "author",
+    "repository_url",
+    "installed_version",
+    "latest_version",
+    "install_date",
+    "last_updated",
+    "plugin_type",
+    "ida_version_min",
+    "ida_version_max",
+    "is_active",
+    "install_path",
+    "metadata_json",
+)
+
+# Hot single-row lookups, built once so every call reuses the same statement
+# objects and hits SQLAlchemy's compiled-statement cache
+_STMT_PLUGIN_BY_ID = select(Plugin).where(Plugin.id == bindparam("plugin_id"))
+_STMT_PLUGIN_BY_NAME = select(Plugin).where(Plugin.name == bindparam("name")).limit(1)
+_STMT_INSTALLED_VERSION = select(Plugin.installed_version).where(
+    Plugin.id == bindparam("plugin_id")
+)
+_STMT_GITHUB_REPO_BY_ID = select(GitHubRepo).where(GitHubRepo.id == bindparam("repo_id"))
+_STMT_HISTORY_FOR_PLUGIN = (
+    select(InstallationHistory)
+    .where(InstallationHistory.plugin_id == bindparam("plugin_id"))
+    .order_by(InstallationHistory.timestamp.desc())
+    .limit(bindparam("limit"))
+)
+
+# Full-text index over plugin names and descriptions. The trigram tokenizer
+# (SQLite 3.34+) matches any substring of three or more characters,
+# case-insensitively, so it answers the same queries as LIKE '%q%'. It is an
+# external-content table over plugins, kept in sync by triggers, and keyed by
+# plugins.fts_rowid rather than the implicit rowid, which VACUUM may renumber.
+_PLUGIN_FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS plugin_fts USING fts5(
+        name, description, content='plugins', content_rowid='fts_rowid', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS plugin_fts_insert AFTER INSERT ON plugins BEGIN
+        UPDATE plugins
+        SET fts_rowid = (SELECT COALESCE(MAX(fts_rowid), 0) + 1 FROM plugins)
+        WHERE rowid = new.rowid AND new.fts_rowid IS NULL;
+        INSERT INTO plugin_fts(rowid, name, description)
+        SELECT fts_rowid, name, description FROM plugins WHERE rowid = new.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS plugin_fts_delete AFTER DELETE ON plugins BEGIN
+        INSERT INTO plugin_fts(plugin_fts, rowid, name, description)
+        VALUES ('delete', old.fts_rowid, old.name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS plugin_fts_update AFTER UPDATE OF name, description ON plugins
+    BEGIN
+        INSERT INTO plugin_fts(plugin_fts, rowid, name, description)
+        VALUES ('delete', old.fts_rowid, old.name, old.description);
+        INSERT INTO plugin_fts(rowid, name, description)
+        VALUES (new.fts_rowid, new.name, new.description);
+    END
+    """,
+)
+# Objects of an index keyed by the implicit rowid, replaced on upgrade
+_PLUGIN_FTS_DROP = (
+    "DROP TRIGGER IF EXISTS plugin_fts_insert",
+    "DROP TRIGGER IF EXISTS plugin_fts_delete",
+    "DROP TRIGGER IF EXISTS plugin_fts_update",
+    "DROP TABLE IF EXISTS plugin_fts",
+)
+_FTS_MIN_QUERY_LENGTH = 3  # Shortest query a trigram index can match
+_STMT_SEARCH_FTS = select(Plugin).from_statement(
+    text(
+        "SELECT plugins.* FROM plugins JOIN plugin_fts ON plugin_fts.rowid = plugins.fts_rowid "
+        "WHERE plugin_fts MATCH :query ORDER BY bm25(plugin_fts)"
+    )
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Engine "connect" hook that tunes each new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class DatabaseManager:
     """
@@ -44,27 +157,105 @@ class DatabaseManager:
 
         # Create engine
         self.engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
+        event.listen(self.engine, "connect", _apply_sqlite_pragmas)
 
         # Create session factory with expire_on_commit=False to avoid detached instance errors
         self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
 
+        # Set by init_database once the plugin_fts index is available
+        self._fts_enabled = False
+
+        # Parsed settings, loaded on first read and dropped by set_setting
+        self._settings_cache: Optional[Dict[str, Any]] = None
+        self._settings_lock = threading.Lock()
+
     def init_database(self) -> bool:
         """
         Initialize database schema.
 
-        Creates all tables if they don't exist.
+        Creates all tables and the plugin search index if they don't exist,
+        and adds columns introduced since an existing database was created.
 
         Returns:
             True if successful, False otherwise.
         """
         try:
             Base.metadata.create_all(self.engine)
+            self._upgrade_schema()
+            self._fts_enabled = self._init_search_index()
             logger.info(f"Database initialized at {self.db_path}")
             return True
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}")
             return False
 
+    def _upgrade_schema(self) -> None:
+        """
+        Bring tables created by an older version up to the current models.
+
+        create_all() skips tables that already exist, so columns added to a
+        model since are missing from upgraded databases. Each missing nullable
+        column is added with ALTER TABLE, the same change the corresponding
+        migration in migrations.py makes. Indexes are then created if absent,
+        including those over the new columns. Data backfills are left to the
+        code that owns the column (e.g. _init_search_index for fts_rowid).
+        """
+        with self.engine.begin() as conn:
+            inspector = inspect(conn)
+            for table in Base.metadata.sorted_tables:
+                existing = {column["name"] for column in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name in existing:
+                        continue
+                    if not column.nullable:
+                        logger.error(
+                            f"Cannot add NOT NULL column {table.name}.{column.name}; "
+                            f"run the database migrations"
+                        )
+                        continue
+                    column_type = column.type.compile(dialect=conn.dialect)
+                    conn.exec_driver_sql(
+                        f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+                    )
+                    logger.info(f"Added column {table.name}.{column.name}")
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+
+    def _init_search_index(self) -> bool:
+        """
+        Create the plugin_fts index and its triggers, filling it on first creation.
+
+        An index from an older version, keyed by the implicit rowid, is dropped
+        and rebuilt over fts_rowid.
+
+        Returns:
+            True if the index is usable, False if this SQLite build lacks FTS5
+            or the trigram tokenizer (search then falls back to LIKE).
+        """
+        try:
+            with self.engine.begin() as conn:
+                existing = conn.exec_driver_sql(
+                    "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'plugin_fts'"
+                ).scalar()
+                rebuild = existing is None or "fts_rowid" not in existing
+                if rebuild:
+                    for statement in _PLUGIN_FTS_DROP:
+                        conn.exec_driver_sql(statement)
+                    # Offset past any assigned ids so backfilled ones stay unique
+                    conn.exec_driver_sql(
+                        "UPDATE plugins SET fts_rowid = rowid + "
+                        "(SELECT COALESCE(MAX(fts_rowid), 0) FROM plugins) "
+                        "WHERE fts_rowid IS NULL"
+                    )
+                for statement in _PLUGIN_FTS_DDL:
+                    conn.exec_driver_sql(statement)
+                if rebuild:
+                    conn.exec_driver_sql("INSERT INTO plugin_fts(plugin_fts) VALUES ('rebuild')")
+            return True
+        except OperationalError as e:
+            logger.warning(f"Full-text search unavailable, using LIKE search: {e}")
+            return False
+
     def get_session(self) -> Session:
         """
         Get a new database session.
@@ -98,6 +289,34 @@ class DatabaseManager:
             logger.error(f"Failed to add plugin {plugin.id}: {e}")
             return False
 
+    def add_plugins(self, plugins: Iterable[Plugin], log_action: Optional[str] = None) -> bool:
+        """
+        Add several plugins to the database in a single transaction.
+
+        Args:
+            plugins: Plugin objects to add
+            log_action: If given, also log this action (e.g. 'install') for
+                each plugin, in the same transaction
+
+        Returns:
+            True if successful, False otherwise (nothing is written).
+        """
+        plugins = list(plugins)
+        try:
+            with self.Session() as session:
+                session.add_all(plugins)
+                if log_action:
+                    session.add_all(
+                        self._history_entry(plugin.id, log_action, plugin.installed_version)
+                        for plugin in plugins
+                    )
+                session.commit()
+                logger.debug(f"Added {len(plugins)} plugins")
+                return True
+        except Exception as e:
+            logger.error(f"Failed to add plugins: {e}")
+            return False
+
     def get_plugin(self, plugin_id: str) -> Optional[Plugin]:
         """
         Get a plugin by ID.
@@ -109,7 +328,24 @@ class DatabaseManager:
             Plugin object or None if not found.
         """
         with self.Session() as session:
-            return session.query(Plugin).filter_by(id=plugin_id).first()
+            return session.scalars(_STMT_PLUGIN_BY_ID, {"plugin_id": plugin_id}).first()
+
+    def get_plugin_installed_version(self, plugin_id: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check whether a plugin exists, reading only its installed version.
+
+        Args:
+            plugin_id: Plugin identifier
+
+        Returns:
+            (exists, installed_version); the version is None if the plugin
+            does not exist or has no installed version.
+        """
+        with self.Session() as session:
+            row = session.execute(_STMT_INSTALLED_VERSION, {"plugin_id": plugin_id}).first()
+            if row is None:
+                return False, None
+            return True, row.installed_version
 
     def get_plugin_by_name(self, name: str) -> Optional[Plugin]:
         """
@@ -122,7 +358,7 @@ class DatabaseManager:
             Plugin object or None if not found.
         """
         with self.Session() as session:
-            return session.query(Plugin).filter_by(name=name).first()
+            return session.scalars(_STMT_PLUGIN_BY_NAME, {"name": name}).first()
 
     def get_all_plugins(self) -> List[Plugin]:
         """
@@ -134,6 +370,42 @@ class DatabaseManager:
         with self.Session() as session:
             return session.query(Plugin).all()
 
+    def get_all_plugin_rows(self) -> List[Row]:
+        """
+        Get all plugins as plain rows.
+
+        Read-only counterpart of get_all_plugins; see get_installed_plugin_rows.
+
+        Returns:
+            List of rows with all plugin columns.
+        """
+        with self.Session() as session:
+            return session.execute(select(Plugin.__table__)).all()
+
+    def iter_plugins_brief(self, batch_size: int = 500) -> Iterator[Row]:
+        """
+        Stream the columns a plugin list view needs.
+
+        Rows are fetched from the cursor in batches of batch_size rather than
+        loaded all at once. The session stays open until the iterator is
+        exhausted or closed.
+
+        Args:
+            batch_size: Rows fetched per batch
+
+        Yields:
+            Rows of (id, name, installed_version, latest_version, status).
+        """
+        query = select(
+            Plugin.id,
+            Plugin.name,
+            Plugin.installed_version,
+            Plugin.latest_version,
+            Plugin.status,
+        ).execution_options(yield_per=batch_size)
+        with self.Session() as session:
+            yield from session.execute(query)
+
     def get_installed_plugins(self) -> List[Plugin]:
         """
         Get all installed plugins.
@@ -144,38 +416,71 @@ class DatabaseManager:
         with self.Session() as session:
             return session.query(Plugin).filter(Plugin.installed_version.isnot(None)).all()
 
+    def get_installed_plugin_rows(self) -> List[Row]:
+        """
+        Get all installed plugins as plain rows.
+
+        Rows expose the same attribute names as Plugin objects but skip ORM
+        object construction and identity tracking, for read-only bulk use.
+
+        Returns:
+            List of rows with all plugin columns.
+        """
+        with self.Session() as session:
+            table = Plugin.__table__
+            query = select(table).where(table.c.installed_version.isnot(None))
+            return session.execute(query).all()
+
+    def get_updatable_plugin_rows(self) -> List[Row]:
+        """
+        Get the fields an update check needs for every installed GitHub plugin.
+
+        Returns:
+            List of rows with id, repository_url, installed_version,
+            latest_version, release_etag and last_checked_at.
+        """
+        with self.Session() as session:
+            query = select(
+                Plugin.id,
+                Plugin.repository_url,
+                Plugin.installed_version,
+                Plugin.latest_version,
+                Plugin.release_etag,
+                Plugin.last_checked_at,
+            ).where(
+                Plugin.installed_version.isnot(None),
+                Plugin.repository_url.isnot(None),
+                Plugin.repository_url != "",
+            )
+            return session.execute(query).all()
+
     def update_plugin(self, plugin: Plugin) -> bool:
         """
         Update an existing plugin.
 
+        Only the fields in _UPDATABLE_PLUGIN_FIELDS are written, with a single
+        UPDATE statement and no prior SELECT.
+
         Args:
             plugin: Plugin object with updated data
 
         Returns:
-            True if successful, False otherwise.
-        """
+            True if successful, False otherwise (including when the plugin
+            does not exist).
+        """
+        values = {field: getattr(plugin, field) for field in _UPDATABLE_PLUGIN_FIELDS}
+        # Bulk UPDATEs skip the flush listener that keeps these in step
+        values["ida_min_packed"] = pack_version(plugin.ida_version_min)
+        values["ida_max_packed"] = pack_version(plugin.ida_version_max)
+        values["updated_at"] = datetime.now(timezone.utc)
         try:
             with self.Session() as session:
-                existing = session.query(Plugin).filter_by(id=plugin.id).first()
-                if existing:
-                    # Update specific fields only
-                    existing.name = plugin.name
-                    existing.description = plugin.description
-                    existing.author = plugin.author
-                    existing.repository_url = plugin.repository_url
-                    existing.installed_version = plugin.installed_version
-                    existing.latest_version = plugin.latest_version
-                    existing.install_date = plugin.install_date
-                    existing.last_updated = plugin.last_updated
-                    existing.plugin_type = plugin.plugin_type
-                    existing.ida_version_min = plugin.ida_version_min
-                    existing.ida_version_max = plugin.ida_version_max
-                    existing.is_active = plugin.is_active
-                    existing.install_path = plugin.install_path
-                    existing.metadata_json = plugin.metadata_json
-                    existing.updated_at = datetime.now(timezone.utc)
-
-                    session.commit()
+                result = session.execute(
+                    update(Plugin).where(Plugin.id == plugin.id).values(values),
+                    execution_options={"synchronize_session": False},
+                )
+                session.commit()
+                if result.rowcount:
                     logger.debug(f"Updated plugin: {plugin.id}")
                     return True
                 return False
@@ -183,6 +488,38 @@ class DatabaseManager:
             logger.error(f"Failed to update plugin {plugin.id}: {e}")
             return False
 
+    def record_update_checks(
+        self, checks: Iterable[Tuple[str, Optional[str], Optional[str]]]
+    ) -> bool:
+        """
+        Store the results of update checks in a single transaction.
+
+        Args:
+            checks: (plugin_id, latest_version, release_etag) for each plugin
+                checked against GitHub; all are stamped with the current time
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            with self.Session() as session:
+                for plugin_id, latest_version, release_etag in checks:
+                    session.execute(
+                        update(Plugin)
+                        .where(Plugin.id == plugin_id)
+                        .values(
+                            latest_version=latest_version,
+                            release_etag=release_etag,
+                            last_checked_at=now,
+                        )
+                    )
+                session.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Failed to record update checks: {e}")
+            return False
+
     def delete_plugin(self, plugin_id: str) -> bool:
         """
         Delete a plugin from database.
@@ -207,7 +544,13 @@ class DatabaseManager:
             return False
 
     def update_plugin_status(
-        self, plugin_id: str, status: str, error_message: Optional[str] = None
+        self,
+        plugin_id: str,
+        status: str,
+        error_message: Optional[str] = None,
+        log_action: Optional[str] = None,
+        log_version: Optional[str] = None,
+        installed_version: Optional[str] = None,
     ) -> bool:
         """
         Update plugin installation status.
@@ -216,24 +559,33 @@ class DatabaseManager:
             plugin_id: Plugin identifier
             status: New status ('not_installed', 'installed', 'failed')
             error_message: Optional error message for failed status
+            log_action: If given, also log this action (e.g. 'uninstall') in
+                the same transaction
+            log_version: Plugin version recorded with log_action
+            installed_version: If given, also set the installed version
 
         Returns:
             True if successful, False otherwise.
         """
+        values = {"status": status, "error_message": error_message}
+        if status == "installed":
+            values["install_date"] = datetime.now(timezone.utc)
+        if installed_version is not None:
+            values["installed_version"] = installed_version
         try:
             with self.Session() as session:
-                plugin = session.query(Plugin).filter_by(id=plugin_id).first()
-                if plugin:
-                    plugin.status = status
-                    plugin.error_message = error_message
-                    if status == "installed":
-                        from datetime import datetime, timezone
-
-                        plugin.install_date = datetime.now(timezone.utc)
-                    session.commit()
-                    logger.debug(f"Updated plugin status: {plugin_id} -> {status}")
-                    return True
-                return False
+                result = session.execute(
+                    update(Plugin).where(Plugin.id == plugin_id).values(values),
+                    execution_options={"synchronize_session": False},
+                )
+                if not result.rowcount:
+                    session.rollback()
+                    return False
+                if log_action:
+                    session.add(self._history_entry(plugin_id, log_action, log_version))
+                session.commit()
+                logger.debug(f"Updated plugin status: {plugin_id} -> {status}")
+                return True
         except Exception as e:
             logger.error(f"Failed to update plugin status {plugin_id}: {e}")
             return False
@@ -242,6 +594,10 @@ class DatabaseManager:
         """
         Search plugins by name or description.
 
+        Case-insensitive substring match, answered from the plugin_fts index
+        and ranked by relevance when the index is available and the query is
+        long enough for it; otherwise a LIKE scan.
+
         Args:
             query: Search query string
 
@@ -249,6 +605,10 @@ class DatabaseManager:
             List of matching plugins.
         """
         with self.Session() as session:
+            if self._fts_enabled and len(query) >= _FTS_MIN_QUERY_LENGTH:
+                # Quoted as a single FTS string so operators in the query are literal
+                phrase = '"' + query.replace('"', '""') + '"'
+                return session.scalars(_STMT_SEARCH_FTS, {"query": phrase}).all()
             return (
                 session.query(Plugin)
                 .filter(
@@ -274,7 +634,10 @@ class DatabaseManager:
         """
         Get plugins compatible with given IDA version.
 
-        Uses proper version comparison via IDAVersion utility.
+        Rows whose packed bounds rule them out are filtered by SQLite on the
+        indexed ida_min_packed/ida_max_packed columns. Bounds that could not
+        be packed are NULL there and pass that filter, so the remaining rows
+        are checked exactly with the IDAVersion utility.
 
         Args:
             ida_version: IDA Pro version string
@@ -282,14 +645,18 @@ class DatabaseManager:
         Returns:
             List of compatible plugins.
         """
-        from src.utils.version_utils import is_version_compatible
+        packed = pack_version(ida_version)
 
         with self.Session() as session:
-            # Get all plugins and filter in Python (more reliable than SQL comparison)
-            all_plugins = session.query(Plugin).all()
+            query = session.query(Plugin)
+            if packed is not None:
+                query = query.filter(
+                    or_(Plugin.ida_min_packed.is_(None), Plugin.ida_min_packed <= packed),
+                    or_(Plugin.ida_max_packed.is_(None), Plugin.ida_max_packed >= packed),
+                )
 
             compatible_plugins = []
-            for plugin in all_plugins:
+            for plugin in query.all():
                 if is_version_compatible(
                     plugin.ida_version_min,
                     plugin.ida_version_max,
@@ -305,26 +672,25 @@ class DatabaseManager:
         """
         Save or update GitHub repository information.
 
+        Issued as a single INSERT ... ON CONFLICT DO UPDATE statement.
+
         Args:
             repo: GitHubRepo object
 
         Returns:
             True if successful, False otherwise.
         """
+        values = {column.key: getattr(repo, column.key) for column in GitHubRepo.__table__.columns}
+        # Unset columns are left out of the insert so their defaults apply
+        statement = sqlite_insert(GitHubRepo).values(
+            {key: value for key, value in values.items() if value is not None}
+        ).on_conflict_do_update(
+            index_elements=[GitHubRepo.id],
+            set_={key: value for key, value in values.items() if key != "id"},
+        )
         try:
             with self.Session() as session:
-                existing = session.query(GitHubRepo).filter_by(id=repo.id).first()
-                if existing:
-                    # Update fields manually
-                    existing.plugin_id = repo.plugin_id
-                    existing.repo_owner = repo.repo_owner
-                    existing.repo_name = repo.repo_name
-                    existing.stars = repo.stars
-                    existing.last_fetched = repo.last_fetched
-                    existing.topics = repo.topics
-                    existing.releases = repo.releases
-                else:
-                    session.add(repo)
+                session.execute(statement)
                 session.commit()
                 logger.debug(f"Saved GitHub repo: {repo.id}")
                 return True
@@ -343,7 +709,7 @@ class DatabaseManager:
             GitHubRepo object or None.
         """
         with self.Session() as session:
-            return session.query(GitHubRepo).filter_by(id=repo_id).first()
+            return session.scalars(_STMT_GITHUB_REPO_BY_ID, {"repo_id": repo_id}).first()
 
     # ============ Installation History Operations ============
 
@@ -370,14 +736,9 @@ class DatabaseManager:
         """
         try:
             with self.Session() as session:
-                history = InstallationHistory(
-                    plugin_id=plugin_id,
-                    action=action,
-                    version=version,
-                    success=success,
-                    error_message=error_message,
+                session.add(
+                    self._history_entry(plugin_id, action, version, success, error_message)
                 )
-                session.add(history)
                 session.commit()
                 logger.debug(f"Logged installation: {plugin_id} - {action}")
                 return True
@@ -385,6 +746,51 @@ class DatabaseManager:
             logger.error(f"Failed to log installation {plugin_id}: {e}")
             return False
 
+    def log_installations(self, entries: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Log several installation actions in a single transaction.
+
+        Args:
+            entries: Dicts with the keyword arguments of log_installation
+                (plugin_id and action required)
+
+        Returns:
+            True if successful, False otherwise (nothing is written).
+        """
+        rows = [
+            {"version": None, "success": True, "error_message": None, **entry}
+            for entry in entries
+        ]
+        if not rows:
+            return True
+
+        try:
+            with self.Session() as session:
+                session.execute(insert(InstallationHistory), rows)
+                session.commit()
+                logger.debug(f"Logged {len(rows)} installation actions")
+                return True
+        except Exception as e:
+            logger.error(f"Failed to log installations: {e}")
+            return False
+
+    @staticmethod
+    def _history_entry(
+        plugin_id: str,
+        action: str,
+        version: Optional[str] = None,
+        success: bool = True,
+        error_message: Optional[str] = None,
+    ) -> InstallationHistory:
+        """Build an InstallationHistory row for the given action."""
+        return InstallationHistory(
+            plugin_id=plugin_id,
+            action=action,
+            version=version,
+            success=success,
+            error_message=error_message,
+        )
+
     def get_installation_history(self, plugin_id: str, limit: int = 100) -> List[InstallationHistory]:
         """
         Get installation history for a plugin.
@@ -397,13 +803,9 @@ class DatabaseManager:
             List of installation history records.
         """
         with self.Session() as session:
-            return (
-                session.query(InstallationHistory)
-                .filter_by(plugin_id=plugin_id)
-                .order_by(InstallationHistory.timestamp.desc())
-                .limit(limit)
-                .all()
-            )
+            return session.scalars(
+                _STMT_HISTORY_FOR_PLUGIN, {"plugin_id": plugin_id, "limit": limit}
+            ).all()
 
     def get_recent_history(self, limit: int = 50) -> List[InstallationHistory]:
         """
@@ -452,6 +854,8 @@ class DatabaseManager:
         """
         Get a setting value.
 
+        Served from the in-memory settings cache after the first read.
+
         Args:
             key: Setting key
             default: Default value if key not found
@@ -459,18 +863,15 @@ class DatabaseManager:
         Returns:
             Setting value or default.
         """
-        with self.Session() as session:
-            try:
-                setting = session.query(Settings).filter_by(key=key).first()
-                if setting and setting.value:
-                    try:
-                        return json.loads(setting.value)
-                    except json.JSONDecodeError:
-                        return setting.value
-                return default
-            except Exception as e:
-                logger.error(f"Failed to get setting {key}: {e}")
-                return default
+        try:
+            settings = self._cached_settings()
+        except Exception as e:
+            logger.error(f"Failed to get setting {key}: {e}")
+            return default
+
+        if key not in settings:
+            return default
+        return copy.deepcopy(settings[key])
 
     def set_setting(self, key: str, value: Any) -> bool:
         """
@@ -493,8 +894,10 @@ class DatabaseManager:
                     setting = Settings(key=key, value=json.dumps(value))
                     session.add(setting)
                 session.commit()
-                logger.debug(f"Set setting: {key}")
-                return True
+            with self._settings_lock:
+                self._settings_cache = None
+            logger.debug(f"Set setting: {key}")
+            return True
         except Exception as e:
             logger.error(f"Failed to set setting {key}: {e}")
             return False
@@ -506,6 +909,21 @@ class DatabaseManager:
         Returns:
             Dictionary of all settings.
         """
+        return copy.deepcopy(self._cached_settings())
+
+    def _cached_settings(self) -> Dict[str, Any]:
+        """
+        Return the parsed settings, loading them on first use.
+
+        The returned dict is shared; callers must copy before handing values out.
+        """
+        with self._settings_lock:
+            if self._settings_cache is None:
+                self._settings_cache = self._load_settings()
+            return self._settings_cache
+
+    def _load_settings(self) -> Dict[str, Any]:
+        """Read and JSON-decode every setting from the database."""
         with self.Session() as session:
             settings = session.query(Settings).all()
 
@@ -76,6 +76,60 @@ MIGRATIONS: List[Migration] = [
             ALTER TABLE plugins DROP COLUMN status;
         """
     ),
+    Migration(
+        version=3,
+        name="Add update check state",
+        up_sql="""
+            -- ETag of the last latest-release response, for conditional requests
+            ALTER TABLE plugins ADD COLUMN release_etag VARCHAR(255);
+
+            -- When the latest release was last fetched
+            ALTER TABLE plugins ADD COLUMN last_checked_at DATETIME;
+        """,
+        down_sql="""
+            ALTER TABLE plugins DROP COLUMN last_checked_at;
+            ALTER TABLE plugins DROP COLUMN release_etag;
+        """
+    ),
+    Migration(
+        version=4,
+        name="Add packed IDA version bounds",
+        up_sql="""
+            -- Integer forms of ida_version_min/max, filled in when a plugin is
+            -- next saved; until then NULL, which the compatibility query re-checks
+            ALTER TABLE plugins ADD COLUMN ida_min_packed INTEGER;
+            ALTER TABLE plugins ADD COLUMN ida_max_packed INTEGER;
+
+            CREATE INDEX IF NOT EXISTS idx_plugin_ida_range ON plugins(ida_min_packed, ida_max_packed);
+        """,
+        down_sql="""
+            DROP INDEX IF EXISTS idx_plugin_ida_range;
+            ALTER TABLE plugins DROP COLUMN ida_max_packed;
+            ALTER TABLE plugins DROP COLUMN ida_min_packed;
+        """
+    ),
+    Migration(
+        version=5,
+        name="Add stable search index row ids",
+        up_sql="""
+            -- Row id of each plugin in plugin_fts; the implicit rowid may be
+            -- renumbered by VACUUM. The index itself is rebuilt on next startup.
+            ALTER TABLE plugins ADD COLUMN fts_rowid INTEGER;
+            UPDATE plugins SET fts_rowid = rowid;
+
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_plugin_fts_rowid ON plugins(fts_rowid);
+        """,
+        down_sql="""
+            -- The search index and its triggers refer to fts_rowid
+            DROP TRIGGER IF EXISTS plugin_fts_insert;
+            DROP TRIGGER IF EXISTS plugin_fts_delete;
+            DROP TRIGGER IF EXISTS plugin_fts_update;
+            DROP TABLE IF EXISTS plugin_fts;
+
+            DROP INDEX IF EXISTS idx_plugin_fts_rowid;
+            ALTER TABLE plugins DROP COLUMN fts_rowid;
+        """
+    ),
 ]
 
 
@@ -4,11 +4,17 @@ SQLAlchemy database models for IDA Plugin Manager.
 Compatible with SQLAlchemy 2.0+
 """
 
+import sys
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, String, Text, func, JSON
+from sqlalchemy import (
+    Boolean, Column, DateTime, Enum, ForeignKey, Index, Integer, String, Text, func, JSON, event
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.utils.version_utils import pack_version
 
 
 class Base(DeclarativeBase):
@@ -24,6 +30,10 @@ class Plugin(Base):
     """
 
     __tablename__ = "plugins"
+    __table_args__ = (
+        Index("idx_plugin_ida_range", "ida_min_packed", "ida_max_packed"),
+        Index("idx_plugin_fts_rowid", "fts_rowid", unique=True),
+    )
 
     id: Mapped[str] = mapped_column(String(255), primary_key=True)
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
@@ -40,6 +50,10 @@ class Plugin(Base):
     )
     ida_version_min: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     ida_version_max: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    # pack_version() of the two bounds above, kept in sync on flush; NULL when a
+    # bound is absent or cannot be packed
+    ida_min_packed: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    ida_max_packed: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, server_default="1", index=True)
     install_path: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
     metadata_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON stored as text
@@ -59,6 +73,13 @@ class Plugin(Base):
     added_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     last_updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, index=True)
     tags: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # Stored as JSON array
+
+    # Update check state: ETag of the latest-release response and when it was fetched
+    release_etag: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    last_checked_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Row id of this plugin in the plugin_fts index, assigned by its insert trigger.
+    # Stored explicitly because VACUUM may renumber the implicit rowid.
+    fts_rowid: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
@@ -137,3 +158,42 @@ class Settings(Base):
     key: Mapped[str] = mapped_column(String(255), primary_key=True)
     value: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON stored as text
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+@event.listens_for(Plugin, "before_insert")
+@event.listens_for(Plugin, "before_update")
+def _pack_ida_versions(mapper, connection, target: Plugin) -> None:
+    """Keep the packed IDA version bounds in step with their string columns."""
+    target.ida_min_packed = pack_version(target.ida_version_min)
+    target.ida_max_packed = pack_version(target.ida_version_max)
+
+
+# Low-cardinality string columns: a handful of versions and enum values repeated
+# across every loaded row. Interning them on load makes each distinct value one
+# shared object, so equality and hashing downstream can short-circuit on identity.
+_INTERNED_COLUMNS = {
+    Plugin: (
+        "installed_version",
+        "latest_version",
+        "ida_version_min",
+        "ida_version_max",
+        "plugin_type",
+        "status",
+        "installation_method",
+    ),
+    InstallationHistory: ("action", "version"),
+}
+
+
+def _intern_columns(target, context) -> None:
+    """Intern low-cardinality string columns of a freshly loaded ORM object."""
+    state = target.__dict__
+    for key in _INTERNED_COLUMNS[type(target)]:
+        value = state.get(key)
+        if isinstance(value, str):
+            # Committed-value set: the object is not marked as modified
+            set_committed_value(target, key, sys.intern(value))
+
+
+for _model in _INTERNED_COLUMNS:
+    event.listen(_model, "load", _intern_columns)
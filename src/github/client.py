@@ -7,22 +7,31 @@ release downloads, and rate limit management.
 REFACTORED: Thread-safe cache and rate limit tracking with proper locking.
 """
 
+import io
 import shutil
+import tempfile
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Iterator, List, Optional, Tuple
 
 import git
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from src.config.constants import GITHUB_API_BASE
+from src.config.constants import GITHUB_API_BASE, LATEST_RELEASE_CACHE_TTL_SECONDS
 from src.models.github_info import GitHubRepo, GitHubRelease, GitHubAsset, GitHubContentItem
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Hosts kept in the connection pool (API, release downloads, redirects) and
+# connections per host; the latter covers PluginService's update-check workers
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 16
+
 
 class GitHubClient:
     """
@@ -47,7 +56,24 @@ class GitHubClient:
         """
         self.token = token
         self.session = requests.Session()
+        # One pooled session for the client's lifetime, so concurrent callers
+        # (e.g. batch update checks) reuse TLS connections instead of
+        # reconnecting. Transient gateway errors are retried with backoff.
+        adapter = HTTPAdapter(
+            pool_connections=_POOL_CONNECTIONS,
+            pool_maxsize=_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET", "HEAD"}),
+            ),
+        )
+        self.session.mount("https://", adapter)
         self.cache: dict = {}
+        # ETag and last response per cache key, for conditional requests
+        # (protected by _cache_lock)
+        self._etags: dict = {}
 
         # Thread safety locks
         self._cache_lock = threading.RLock()  # Reentrant for nested calls
@@ -99,7 +125,7 @@ class GitHubClient:
             if reset:
                 self.rate_limit_reset = int(reset)
 
-    def _get_cached(self, cache_key: str) -> Optional[any]:
+    def _get_cached(self, cache_key: str, ttl: int = 3600) -> Optional[any]:
         """
         Get value from cache.
 
@@ -107,6 +133,7 @@ class GitHubClient:
 
         Args:
             cache_key: Cache key
+            ttl: Maximum age of the entry in seconds (default 1 hour)
 
         Returns:
             Cached value or None
@@ -114,8 +141,7 @@ class GitHubClient:
         with self._cache_lock:
             if cache_key in self.cache:
                 cached_time, value = self.cache[cache_key]
-                # Cache expires after 1 hour
-                if time.time() - cached_time < 3600:
+                if time.time() - cached_time < ttl:
                     return value
                 else:
                     # Remove expired entry
@@ -305,25 +331,7 @@ class GitHubClient:
             self._update_rate_limit(response)
             response.raise_for_status()
 
-            releases = []
-            for data in response.json():
-                release = GitHubRelease(
-                    tag_name=data.get("tag_name"),
-                    name=data.get("name") or data.get("tag_name"),
-                    body=data.get("body"),
-                    prerelease=data.get("prerelease", False),
-                    created_at=data.get("created_at"),
-                    published_at=data.get("published_at"),
-                    assets=[
-                        GitHubAsset(
-                            name=asset["name"],
-                            size=asset.get("size", 0),
-                            download_url=asset.get("browser_download_url"),
-                        )
-                        for asset in data.get("assets", [])
-                    ],
-                )
-                releases.append(release)
+            releases = [self._parse_release(data) for data in response.json()]
 
             # Cache result (thread-safe)
             self._set_cached(cache_key, releases)
@@ -333,6 +341,148 @@ class GitHubClient:
             logger.error(f"Failed to fetch releases: {e}")
             return []
 
+    def iter_releases(
+        self, owner: str, repo: str, per_page: int = 100
+    ) -> Iterator[GitHubRelease]:
+        """
+        Iterate over a repository's releases, newest first, one page at a time.
+
+        The next page is only requested once the caller has consumed the
+        current one, so stopping early (e.g. with next()) skips the
+        remaining round-trips. A failed request ends the iteration.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            per_page: Releases per page (GitHub allows at most 100)
+
+        Yields:
+            GitHubRelease objects
+        """
+        url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases"
+        params = {"per_page": per_page}
+
+        while url:
+            self._check_rate_limit()
+            try:
+                response = self.session.get(url, params=params, timeout=30)
+                self._update_rate_limit(response)
+                response.raise_for_status()
+                page = response.json()
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Failed to fetch releases: {e}")
+                return
+
+            for data in page:
+                yield self._parse_release(data)
+
+            # The "next" link already carries the query string
+            url = response.links.get("next", {}).get("url")
+            params = None
+
+    def get_latest_release(self, owner: str, repo: str) -> Optional[GitHubRelease]:
+        """
+        Fetch the latest published release of a repository.
+
+        Results are cached for a few minutes. Once that expires the request is
+        repeated with the stored ETag, and a 304 reply (which GitHub does not
+        count against the rate limit) reuses the cached release.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            GitHubRelease object or None if there is no release or the request failed
+        """
+        cache_key = f"latest_release:{owner}/{repo}"
+
+        # Check cache first (thread-safe)
+        cached = self._get_cached(cache_key, ttl=LATEST_RELEASE_CACHE_TTL_SECONDS)
+        if cached:
+            return cached
+
+        with self._cache_lock:
+            etag, previous = self._etags.get(cache_key, (None, None))
+
+        changed, release, etag = self.get_latest_release_if_changed(owner, repo, etag)
+        if not changed:
+            release = previous
+        elif release is None:
+            return None
+
+        # Cache result (thread-safe)
+        self._set_cached(cache_key, release)
+        if changed and etag:
+            with self._cache_lock:
+                self._etags[cache_key] = (etag, release)
+        return release
+
+    def get_latest_release_if_changed(
+        self, owner: str, repo: str, etag: Optional[str] = None
+    ) -> Tuple[bool, Optional[GitHubRelease], Optional[str]]:
+        """
+        Fetch the latest release unless it still matches a known ETag.
+
+        Not cached; callers that persist the ETag (e.g. in the database) use
+        this to turn repeat checks into 304 replies, which GitHub does not
+        count against the rate limit.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            etag: ETag from an earlier response, or None for a plain request
+
+        Returns:
+            (changed, release, etag). changed is False, with no release, when
+            the latest release still matches etag. Otherwise release is the
+            latest release (None if there is none or the request failed) and
+            etag is its new ETag.
+        """
+        self._check_rate_limit()
+
+        url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases/latest"
+        headers = {"If-None-Match": etag} if etag else None
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=30)
+            self._update_rate_limit(response)
+
+            if etag and response.status_code == 304:
+                return False, None, etag
+            if response.status_code == 404:
+                # Repository has no published release
+                return True, None, None
+            response.raise_for_status()
+
+            return True, self._parse_release(response.json()), response.headers.get("ETag")
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to fetch latest release: {e}")
+            return True, None, None
+
+    @staticmethod
+    def _parse_release(data: dict) -> GitHubRelease:
+        """Build a GitHubRelease from a GitHub API release object."""
+        return GitHubRelease(
+            id=data.get("id", 0),
+            tag_name=data.get("tag_name"),
+            name=data.get("name") or data.get("tag_name"),
+            body=data.get("body"),
+            prerelease=data.get("prerelease", False),
+            published_at=data.get("published_at"),
+            html_url=data.get("html_url", ""),
+            assets=[
+                GitHubAsset(
+                    name=asset["name"],
+                    size=asset.get("size", 0),
+                    download_url=asset.get("browser_download_url"),
+                    content_type=asset.get("content_type", "application/octet-stream"),
+                )
+                for asset in data.get("assets", [])
+            ],
+        )
+
     def download_release_asset(
         self, download_url: str, destination: Path, timeout: int = 300
     ) -> Optional[Path]:
@@ -368,6 +518,82 @@ class GitHubClient:
             logger.error(f"Failed to download asset: {e}")
             return None
 
+    def get_asset_etag(self, download_url: str) -> Optional[str]:
+        """
+        Get the ETag of a release asset without downloading it.
+
+        Args:
+            download_url: URL of the asset; redirects to the CDN are followed
+
+        Returns:
+            ETag header value or None if unavailable
+        """
+        try:
+            response = self.session.head(download_url, allow_redirects=True, timeout=30)
+            response.raise_for_status()
+            return response.headers.get("ETag")
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Failed to fetch asset ETag: {e}")
+            return None
+
+    def download_release_asset_to_buffer(
+        self, download_url: str, max_memory: int = 64 * 1024 * 1024
+    ) -> Optional[BinaryIO]:
+        """
+        Download a release asset into a file object instead of a named file.
+
+        Assets whose Content-Length fits in max_memory are buffered in memory;
+        larger or unsized ones spill to an anonymous temporary file.
+
+        Args:
+            download_url: URL to download from
+            max_memory: Largest asset size to keep in memory, in bytes
+
+        Returns:
+            Binary file object positioned at the start, or None if failed.
+            The caller is responsible for closing it.
+        """
+        return self.download_release_asset_with_etag(download_url, max_memory)[0]
+
+    def download_release_asset_with_etag(
+        self, download_url: str, max_memory: int = 64 * 1024 * 1024
+    ) -> Tuple[Optional[BinaryIO], Optional[str]]:
+        """
+        Download a release asset into a file object, along with its ETag.
+
+        Same as download_release_asset_to_buffer, but also returns the ETag
+        the asset was served with, so it can be cached without a HEAD request.
+
+        Args:
+            download_url: URL to download from
+            max_memory: Largest asset size to keep in memory, in bytes
+
+        Returns:
+            Tuple of (file object positioned at the start or None if failed,
+            ETag header value or None)
+        """
+        try:
+            response = self.session.get(download_url, stream=True, timeout=30)
+            response.raise_for_status()
+
+            size = int(response.headers.get("Content-Length") or 0)
+            buffer = io.BytesIO() if 0 < size <= max_memory else tempfile.TemporaryFile()
+            try:
+                for chunk in response.iter_content(chunk_size=65536):
+                    if chunk:
+                        buffer.write(chunk)
+            except BaseException:
+                buffer.close()
+                raise
+
+            buffer.seek(0)
+            logger.info(f"Downloaded asset from {download_url}")
+            return buffer, response.headers.get("ETag")
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to download asset: {e}")
+            return None, None
+
     def clone_repository(self, repo_url: str, destination: Path, branch: str = "main") -> bool:
         """
         Clone a GitHub repository using GitPython.
@@ -4,6 +4,7 @@ Release fetcher for GitHub plugin releases.
 Handles fetching, parsing, and filtering GitHub releases for IDA plugins.
 """
 
+import re
 from typing import List, Optional
 
 from src.models.github_info import GitHubRelease, GitHubAsset
@@ -11,6 +12,9 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Dotted version number inside a tag name, e.g. "1.2.3" in "release-1.2.3"
+_VERSION_NUMBER_RE = re.compile(r"(\d+\.\d+[\d.]*)")
+
 
 class ReleaseFetcher:
     """
@@ -192,8 +196,6 @@ class ReleaseFetcher:
         Returns:
             Clean version string
         """
-        import re
-
         # Remove 'v' prefix
         version = tag_name.lstrip("vV")
 
@@ -204,7 +206,7 @@ class ReleaseFetcher:
                 break
 
         # Extract version numbers
-        match = re.search(r"(\d+\.\d+[\d.]*)", version)
+        match = _VERSION_NUMBER_RE.search(version)
         if match:
             return match.group(1)
 
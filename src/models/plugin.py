@@ -68,6 +68,8 @@ class Plugin(BaseModel):
     added_at: Optional[datetime] = Field(None, description="When plugin was added to catalog")
     last_updated_at: Optional[datetime] = Field(None, description="Last time plugin was updated on GitHub")
     tags: List[str] = Field(default_factory=list, description="Plugin tags (e.g., debugger, decompiler)")
+    release_etag: Optional[str] = Field(None, description="ETag of the last latest-release response")
+    last_checked_at: Optional[datetime] = Field(None, description="When updates were last checked")
 
     model_config = ConfigDict(
         use_enum_values=True,
@@ -128,6 +130,7 @@ class InstallationResult(BaseModel):
     error: Optional[str] = Field(None, description="Error message if failed")
     previous_version: Optional[str] = Field(None, description="Previous version if updated")
     new_version: Optional[str] = Field(None, description="New version installed")
+    backup_path: Optional[str] = Field(None, description="Backup of removed files, if any")
     plugin_type: Optional[PluginType] = Field(None, description="Detected plugin type")
     metadata: Optional[PluginMetadata] = Field(None, description="Parsed plugin metadata")
 
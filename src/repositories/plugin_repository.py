@@ -5,6 +5,7 @@ Provides abstraction over database operations for plugins.
 Follows Repository Pattern for clean separation of concerns.
 """
 
+import json
 from logging import getLogger
 from typing import List, Optional
 
@@ -70,8 +71,8 @@ class PluginRepository:
         Returns:
             List of all plugins
         """
-        db_plugins = self.db.get_all_plugins()
-        return [self._db_to_model(p) for p in db_plugins]
+        rows = self.db.get_all_plugin_rows()
+        return [self._db_to_model(row) for row in rows]
 
     def find_installed(self) -> List[Plugin]:
         """
@@ -80,8 +81,9 @@ class PluginRepository:
         Returns:
             List of installed plugins
         """
-        db_plugins = self.db.get_installed_plugins()
-        return [self._db_to_model(p) for p in db_plugins]
+        # Plain rows carry the same attributes as DBPlugin, without ORM overhead
+        rows = self.db.get_installed_plugin_rows()
+        return [self._db_to_model(row) for row in rows]
 
     def find_by_type(self, plugin_type: PluginType) -> List[Plugin]:
         """
@@ -215,7 +217,6 @@ class PluginRepository:
         metadata_json = {}
         if db_plugin.metadata_json:
             try:
-                import json
                 metadata_json = json.loads(db_plugin.metadata_json)
             except json.JSONDecodeError:
                 logger.warning(f"Failed to parse metadata_json for {db_plugin.id}")
@@ -262,6 +263,8 @@ class PluginRepository:
             added_at=db_plugin.added_at,
             last_updated_at=db_plugin.last_updated_at,
             tags=tags,
+            release_etag=db_plugin.release_etag,
+            last_checked_at=db_plugin.last_checked_at,
         )
 
     def _model_to_db(self, plugin: Plugin) -> DBPlugin:
@@ -277,7 +280,6 @@ class PluginRepository:
         # Serialize metadata to JSON
         metadata_json = None
         if plugin.metadata:
-            import json
             metadata_json = json.dumps(plugin.metadata.model_dump())
 
         return DBPlugin(
@@ -11,11 +11,16 @@ Responsibilities:
 - Plugin discovery and search
 """
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from pathlib import Path
-from typing import List, Optional
-from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 
+import requests
+
+from src.config.constants import UPDATE_RECHECK_INTERVAL_SECONDS
 from src.core.ida_detector import IDADetector
 from src.core.installer import PluginInstaller
 from src.core.version_manager import VersionManager
@@ -37,11 +42,16 @@ from src.models.plugin import (
 from src.models.github_info import GitHubRepo, GitHubRelease
 from src.repositories.plugin_repository import PluginRepository
 from src.services.plugin_tagger import PluginTagger
+from src.utils.file_ops import restore_backup
 from src.utils.version_utils import IDAVersion, is_version_compatible
 from src.utils.validators import parse_github_url
 
 logger = getLogger(__name__)
 
+# Concurrent GitHub requests made by a batch update check; kept low enough
+# to stay clear of GitHub's secondary rate limits
+_UPDATE_CHECK_WORKERS = 16
+
 
 class PluginService:
     """
@@ -88,6 +98,15 @@ class PluginService:
         # Tagger for automatic tag extraction
         self.tagger = PluginTagger(self.github_client)
 
+        # Stateless helper shared by every update check
+        self.release_fetcher = ReleaseFetcher()
+
+        # install_plugin handlers, keyed by InstallationMethod value
+        self._install_methods = {
+            InstallationMethod.CLONE.value: self._install_via_clone,
+            InstallationMethod.RELEASE.value: self._install_via_release,
+        }
+
     # ============ Plugin Discovery ============
 
     def validate_plugin_from_url(self, url: str) -> ValidationResult:
@@ -100,8 +119,6 @@ class PluginService:
         Returns:
             ValidationResult with plugin metadata
         """
-        from src.utils.validators import parse_github_url
-
         logger.info(f"Validating plugin from URL: {url}")
 
         # Parse URL
@@ -132,11 +149,9 @@ class PluginService:
             None
         )
         if plugins_json_item and plugins_json_item.download_url:
-            import requests
             try:
                 response = requests.get(plugins_json_item.download_url, timeout=10)
                 if response.status_code == 200:
-                    import json
                     plugins_json = json.loads(response.text)
                     logger.info("ida-plugin.json parsed successfully")
             except Exception as e:
@@ -201,48 +216,20 @@ class PluginService:
         plugin_dir = self.ida_detector.get_plugin_directory(ida_path)
         install_path = plugin_dir / repo_name
 
-        # Check if already installed
-        existing = self.repository.find_by_id(plugin_id)
-        if existing:
+        # Check if already installed; only the version column is read
+        exists, existing_version = self.db.get_plugin_installed_version(plugin_id)
+        if exists:
             return InstallationResult(
                 success=False,
                 plugin_id=plugin_id,
                 message="Plugin already installed",
                 error=f"Plugin {plugin_id} is already installed",
-                previous_version=existing.installed_version,
+                previous_version=existing_version,
             )
 
         # Install using specified method
-        result: InstallationResult
-
-        if method == "clone":
-            result = self.installer.install_from_github_clone(
-                url, install_path, branch, plugin_type, metadata
-            )
-
-        elif method == "release":
-            # Fetch releases
-            releases = self.github_client.get_releases(owner, repo_name)
-
-            if not releases:
-                return InstallationResult(
-                    success=False,
-                    plugin_id=plugin_id,
-                    message="No releases found",
-                    error="Repository has no releases",
-                )
-
-            # Get latest stable
-            target_release = next(
-                (r for r in releases if not r.prerelease),
-                releases[0]
-            )
-
-            result = self.installer.install_from_github_release(
-                url, target_release, install_path, plugin_type, metadata
-            )
-
-        else:
+        handler = self._install_methods.get(method)
+        if handler is None:
             return InstallationResult(
                 success=False,
                 plugin_id=plugin_id,
@@ -250,11 +237,10 @@ class PluginService:
                 error=f"Unknown method: {method}",
             )
 
+        result = handler(url, owner, repo_name, install_path, branch, plugin_type, metadata)
+
         # Update database if successful
         if result.success:
-            # Determine installation method
-            install_method = InstallationMethod.CLONE if method == "clone" else InstallationMethod.RELEASE
-
             self._add_plugin_to_database(
                 plugin_id=plugin_id,
                 name=repo_name,
@@ -262,7 +248,7 @@ class PluginService:
                 install_path=str(install_path),
                 version=result.new_version,
                 plugin_type=result.plugin_type,
-                installation_method=install_method.value,
+                installation_method=method,
                 status=PluginStatus.INSTALLED.value,
             )
 
@@ -293,17 +279,14 @@ class PluginService:
         result = self.installer.uninstall_plugin(plugin, backup)
 
         if result.success:
-            # Update database - set status back to not_installed
-            self.db.log_installation(
-                plugin_id=plugin_id,
-                action="uninstall",
-                version=plugin.installed_version,
-                success=True,
+            # Set status back to not_installed and log it in one transaction
+            self.db.update_plugin_status(
+                plugin_id,
+                PluginStatus.NOT_INSTALLED.value,
+                log_action="uninstall",
+                log_version=plugin.installed_version,
             )
 
-            # Update plugin status to not_installed
-            self.repository.update_status(plugin_id, PluginStatus.NOT_INSTALLED)
-
         return result
 
     def add_plugin_to_catalog(
@@ -403,19 +386,6 @@ class PluginService:
                 message="Plugin not installed",
             )
 
-        # Check for updates
-        update_info = self.check_plugin_update(plugin_id)
-        if not update_info or not update_info.has_update:
-            return InstallationResult(
-                success=True,
-                plugin_id=plugin_id,
-                message="Plugin is already up to date",
-            )
-
-        # Uninstall current version
-        self.uninstall_plugin(plugin_id, backup=True)
-
-        # Install new version
         repo_url = plugin.repository_url
         parsed = parse_github_url(repo_url) if repo_url else None
 
@@ -428,23 +398,19 @@ class PluginService:
 
         owner, repo_name = parsed
 
-        # Get target release
-        releases = self.github_client.get_releases(owner, repo_name)
-        target_release = None
-
-        for r in releases:
-            if update_info.latest_version in r.tag_name:
-                target_release = r
-                break
-
-        if not target_release:
+        # One release lookup serves both the version check and the install
+        target_release = self.github_client.get_latest_release(owner, repo_name)
+        update_info = None
+        if target_release:
+            latest_version = self.release_fetcher.extract_version(target_release.tag_name)
+            update_info = self._update_info(plugin, latest_version, target_release)
+        if not update_info or not update_info.has_update:
             return InstallationResult(
-                success=False,
+                success=True,
                 plugin_id=plugin_id,
-                message="Update version not found",
+                message="Plugin is already up to date",
             )
 
-        # Install new version
         ida_path = self.ida_detector.find_ida_installation()
         if not ida_path:
             return InstallationResult(
@@ -453,18 +419,52 @@ class PluginService:
                 message="IDA Pro not found",
             )
 
-        plugin_dir = self.ida_detector.get_plugin_directory(ida_path)
-        install_path = plugin_dir / repo_name
+        # The new release replaces the files where the current version lives
+        if plugin.install_path:
+            install_path = Path(plugin.install_path)
+        else:
+            install_path = self.ida_detector.get_plugin_directory(ida_path) / repo_name
+
+        # Move the current files to a backup first, and put them back if the
+        # new release fails to install. The database row stays in place
+        # throughout and is updated once at the end.
+        backup_path = None
+        if install_path.exists():
+            removed = self.installer.uninstall_plugin(
+                plugin.model_copy(update={"install_path": str(install_path)}), backup=True
+            )
+            if not removed.success:
+                return InstallationResult(
+                    success=False,
+                    plugin_id=plugin_id,
+                    message="Failed to remove the current version",
+                    error=removed.error,
+                )
+            backup_path = removed.backup_path
 
         result = self.installer.install_from_github_release(repo_url, target_release, install_path)
 
+        if not result.success and backup_path:
+            restored = restore_backup(Path(backup_path), install_path)
+            if restored.success:
+                # The previous version is back in place and still installed
+                logger.warning(f"Update of {plugin_id} failed, restored previous version")
+                return result
+            logger.error(f"Failed to restore {plugin_id} from {backup_path}: {restored.error}")
+
         if result.success:
-            # Log update
-            self.db.log_installation(
-                plugin_id=plugin_id,
-                action="update",
-                version=result.new_version,
-                success=True,
+            self.db.update_plugin_status(
+                plugin_id,
+                PluginStatus.INSTALLED.value,
+                log_action="update",
+                log_version=result.new_version,
+                installed_version=result.new_version,
+            )
+        else:
+            self.db.update_plugin_status(
+                plugin_id,
+                PluginStatus.FAILED.value,
+                error_message=result.error,
             )
 
         return result
@@ -493,15 +493,22 @@ class PluginService:
             List of UpdateInfo objects for plugins with updates available
         """
         logger.info("Checking for plugin updates")
-        updates = []
+        # One query for just the columns the checks read, instead of full models
+        plugins = self.db.get_updatable_plugin_rows()
+        if not plugins:
+            return []
+
+        # Each check is at most one GitHub round-trip, so run them concurrently
+        workers = min(_UPDATE_CHECK_WORKERS, len(plugins))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self._check_update, plugins))
 
-        for plugin in self.get_installed_plugins():
-            if plugin.repository_url:
-                info = self.check_plugin_update(plugin.id)
-                if info and info.has_update:
-                    updates.append(info)
+        # Store what GitHub returned in one transaction
+        checks = [check for _, check in results if check]
+        if checks:
+            self.db.record_update_checks(checks)
 
-        return updates
+        return [info for info, _ in results if info and info.has_update]
 
     def check_plugin_update(self, plugin_id: str) -> Optional[UpdateInfo]:
         """
@@ -519,22 +526,75 @@ class PluginService:
         if not plugin or not plugin.repository_url:
             return None
 
+        info, check = self._check_update(plugin)
+        if check:
+            self.db.record_update_checks([check])
+        return info
+
+    def _check_update(
+        self, plugin: Plugin
+    ) -> Tuple[Optional[UpdateInfo], Optional[Tuple[str, Optional[str], Optional[str]]]]:
+        """
+        Compare a plugin against its latest GitHub release.
+
+        A result stored by a check within UPDATE_RECHECK_INTERVAL_SECONDS is
+        reused without asking GitHub. Otherwise the request carries the stored
+        ETag, and a 304 reply reuses the stored latest version. Makes no
+        database calls, so it is safe to run on worker threads.
+
+        Args:
+            plugin: Plugin with a repository URL, or a row from
+                get_updatable_plugin_rows, which has the same attributes
+
+        Returns:
+            (info, check). info is None if the latest release cannot be
+            determined; check is the (plugin_id, latest_version, release_etag)
+            to record, or None if GitHub was not asked or did not answer.
+        """
+        if plugin.latest_version and self._checked_recently(plugin):
+            return self._update_info(plugin, plugin.latest_version), None
+
         parsed = parse_github_url(plugin.repository_url)
         if not parsed:
-            return None
+            return None, None
 
         owner, repo_name = parsed
 
-        # Fetch latest release
-        latest_release = self.github_client.get_latest_release(owner, repo_name)
+        # A stored ETag is only meaningful together with the version it describes
+        etag = plugin.release_etag if plugin.latest_version else None
+        changed, latest_release, etag = self.github_client.get_latest_release_if_changed(
+            owner, repo_name, etag
+        )
 
-        if not latest_release:
-            return None
+        if not changed:
+            info = self._update_info(plugin, plugin.latest_version)
+        elif latest_release:
+            latest_version = self.release_fetcher.extract_version(latest_release.tag_name)
+            info = self._update_info(plugin, latest_version, latest_release)
+        else:
+            return None, None
 
-        # Extract version
-        fetcher = ReleaseFetcher()
-        latest_version = fetcher.extract_version(latest_release.tag_name)
+        return info, (plugin.id, info.latest_version, etag)
 
+    @staticmethod
+    def _checked_recently(plugin: Plugin) -> bool:
+        """Whether the plugin's stored update-check result is still fresh."""
+        checked_at = plugin.last_checked_at
+        if not checked_at:
+            return False
+        if checked_at.tzinfo is None:
+            # SQLite returns naive datetimes; they are stored in UTC
+            checked_at = checked_at.replace(tzinfo=timezone.utc)
+        age = datetime.now(timezone.utc) - checked_at
+        return age < timedelta(seconds=UPDATE_RECHECK_INTERVAL_SECONDS)
+
+    def _update_info(
+        self,
+        plugin: Plugin,
+        latest_version: str,
+        latest_release: Optional[GitHubRelease] = None,
+    ) -> UpdateInfo:
+        """Build UpdateInfo for a plugin, with release details when available."""
         # Compare versions
         has_update = False
         if plugin.installed_version:
@@ -547,8 +607,10 @@ class PluginService:
             has_update=has_update,
             current_version=plugin.installed_version,
             latest_version=latest_version,
-            changelog=fetcher.get_changelog(latest_release),
-            release_url=latest_release.html_url,
+            changelog=(
+                self.release_fetcher.get_changelog(latest_release) if latest_release else None
+            ),
+            release_url=latest_release.html_url if latest_release else None,
         )
 
     # ============ Compatibility ============
@@ -624,6 +686,55 @@ class PluginService:
 
     # ============ Private Methods ============
 
+    def _install_via_clone(
+        self,
+        url: str,
+        owner: str,
+        repo_name: str,
+        install_path: Path,
+        branch: str,
+        plugin_type: Optional[PluginType],
+        metadata: Optional[PluginMetadata],
+    ) -> InstallationResult:
+        """Install a plugin by cloning its repository."""
+        return self.installer.install_from_github_clone(
+            url, install_path, branch, plugin_type, metadata
+        )
+
+    def _install_via_release(
+        self,
+        url: str,
+        owner: str,
+        repo_name: str,
+        install_path: Path,
+        branch: str,
+        plugin_type: Optional[PluginType],
+        metadata: Optional[PluginMetadata],
+    ) -> InstallationResult:
+        """Install a plugin from its latest stable (or newest) release."""
+        # Get latest stable, falling back to the newest release; pages
+        # past the first stable release are never fetched
+        first_release = None
+        target_release = None
+        for release in self.github_client.iter_releases(owner, repo_name):
+            first_release = first_release or release
+            if not release.prerelease:
+                target_release = release
+                break
+        target_release = target_release or first_release
+
+        if not target_release:
+            return InstallationResult(
+                success=False,
+                plugin_id=f"{owner}/{repo_name}",
+                message="No releases found",
+                error="Repository has no releases",
+            )
+
+        return self.installer.install_from_github_release(
+            url, target_release, install_path, plugin_type, metadata
+        )
+
     def _add_plugin_to_database(
         self,
         plugin_id: str,
@@ -653,13 +764,8 @@ class PluginService:
             is_active=True,
         )
 
-        self.db.add_plugin(db_plugin)
-        self.db.log_installation(
-            plugin_id=plugin_id,
-            action="install",
-            version=version,
-            success=True,
-        )
+        # Plugin row and its history entry are written in one transaction
+        self.db.add_plugins([db_plugin], log_action="install")
 
     # ============ Lifecycle Management ============
 
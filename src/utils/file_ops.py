@@ -5,6 +5,7 @@ Provides safe file operations including copy, delete, backup, etc.
 """
 
 import hashlib
+import os
 import shutil
 import tempfile
 import zipfile
@@ -72,13 +73,24 @@ def safe_copy_file(src: Path, dst: Path) -> Result:
         return Result.fail(str(e))
 
 
-def safe_copy_directory(src: Path, dst: Path) -> Result:
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink a file, falling back to a copy (e.g. across filesystems)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def safe_copy_directory(src: Path, dst: Path, prefer_hardlink: bool = False) -> Result:
     """
     Safely copy a directory.
 
     Args:
         src: Source directory path
         dst: Destination directory path
+        prefer_hardlink: Hardlink files instead of copying their bytes where
+            possible. Only use this when src is discarded afterwards, since
+            linked files share their contents with the source.
 
     Returns:
         Result object
@@ -86,7 +98,8 @@ def safe_copy_directory(src: Path, dst: Path) -> Result:
     try:
         if dst.exists():
             shutil.rmtree(dst)
-        shutil.copytree(src, dst)
+        copy_function = _link_or_copy if prefer_hardlink else shutil.copy2
+        shutil.copytree(src, dst, copy_function=copy_function)
         logger.debug(f"Copied directory {src} to {dst}")
         return Result.ok(dst)
     except Exception as e:
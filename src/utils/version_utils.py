@@ -188,3 +188,40 @@ def is_version_compatible(
             return False
 
     return True
+
+
+def pack_version(version_string: Optional[str]) -> Optional[int]:
+    """
+    Pack a plain release version into an integer that orders like the version.
+
+    Lets the database compare versions with an indexed integer column.
+    Only versions with up to three components below 100 and no pre-, post-
+    or dev-release part can be packed; anything else returns None, and
+    callers must then fall back to IDAVersion comparison.
+
+    Args:
+        version_string: Version string (e.g., "9.0", "8.4.1")
+
+    Returns:
+        Packed version (major * 10000 + minor * 100 + patch) or None
+
+    Examples:
+        >>> pack_version("8.4.1")
+        80401
+
+        >>> pack_version("8.10") > pack_version("8.9")
+        True
+    """
+    if not version_string:
+        return None
+
+    parsed = IDAVersion(version_string)._version
+    if parsed is None or parsed.epoch or parsed.pre or parsed.post or parsed.dev or parsed.local:
+        return None
+
+    release = parsed.release
+    if len(release) > 3 or any(part > 99 for part in release):
+        return None
+
+    major, minor, patch = (release + (0, 0))[:3]
+    return major * 10000 + minor * 100 + patch
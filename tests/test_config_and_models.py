@@ -11,6 +11,7 @@ from pathlib import Path
 
 import pytest
 
+from src.config import constants
 from src.config.constants import (
     CONFIG_DIR,
     CONFIG_FILE,
@@ -373,6 +374,23 @@ class TestSettingsManager:
             assert manager.config.ida.version == "8.4"
             assert manager.config.ui.theme == "Light"
 
+    def test_settings_manager_batch_defers_save(self):
+        """Test that set() inside batch() writes the file once on exit."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "test_config.json"
+            manager = SettingsManager(config_path=config_path)
+
+            with manager.batch():
+                assert manager.set("ida.version", "8.4") is True
+                assert manager.set("ui.theme", "Light") is True
+                with open(config_path, "r", encoding="utf-8") as f:
+                    assert json.load(f)["ida"]["version"] == ""
+
+            with open(config_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            assert data["ida"]["version"] == "8.4"
+            assert data["ui"]["theme"] == "Light"
+
     def test_settings_manager_to_dict(self):
         """Test converting config to dictionary."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -388,6 +406,23 @@ class TestSettingsManager:
             assert "updates" in data
             assert data["ida"]["version"] == "9.0"
 
+    def test_settings_manager_to_dict_round_trip(self):
+        """Test that every config field survives a save/load round trip."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "test_config.json"
+            manager = SettingsManager(config_path=config_path)
+
+            manager.config.plugin_sources = ["https://github.com/test/plugins"]
+            manager.config.ui.column_widths["name"] = 250
+            manager.config.advanced.max_history_entries = 50
+            assert manager.save() is True
+
+            with open(config_path, "r", encoding="utf-8") as f:
+                assert json.load(f) == manager._to_dict()
+
+            manager2 = SettingsManager(config_path=config_path)
+            assert manager2.config == manager.config
+
     def test_settings_manager_export_import(self):
         """Test exporting and importing configuration."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -446,3 +481,24 @@ class TestConstants:
     def test_github_api_constants(self):
         """Test GitHub API constants."""
         assert GITHUB_API_BASE == "https://api.github.com"
+
+    def test_resolve_ida_paths_expands_prefix_wildcards(self, monkeypatch, tmp_path):
+        """Test that trailing wildcards expand to matching directories only."""
+        (tmp_path / "IDA Pro 9.0").mkdir()
+        (tmp_path / "IDA Professional 9.1").mkdir()
+        (tmp_path / "Other").mkdir()
+        (tmp_path / "IDA.txt").write_text("not a directory")
+
+        monkeypatch.setattr(
+            constants,
+            "IDA_DEFAULT_PATHS",
+            [tmp_path / "IDA Pro*", tmp_path / "IDA*", tmp_path / "missing" / "IDA*"],
+        )
+        constants.resolve_ida_paths.cache_clear()
+        try:
+            paths = constants.resolve_ida_paths()
+        finally:
+            constants.resolve_ida_paths.cache_clear()
+
+        assert set(paths) == {tmp_path / "IDA Pro 9.0", tmp_path / "IDA Professional 9.1"}
+        assert len(paths) == 2
@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
+from sqlalchemy import create_engine
 
 from src.database.db_manager import DatabaseManager
 from src.database.models import Base, GitHubRepo, InstallationHistory, Plugin, Settings
@@ -103,6 +104,12 @@ class TestDatabaseManager:
         assert session.query(Settings).count() == 0
         session.close()
 
+    def test_connection_pragmas(self, db_manager):
+        """Test that new connections are tuned for WAL writes."""
+        with db_manager.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+
     def test_add_and_get_plugin(self, db_manager):
         """Test adding and retrieving a plugin."""
         # Add plugin
@@ -119,6 +126,17 @@ class TestDatabaseManager:
         assert retrieved.id == "test-plugin"
         assert retrieved.name == "Test Plugin"
 
+    def test_get_plugin_installed_version(self, db_manager):
+        """Test the existence check that reads only the installed version."""
+        db_manager.add_plugin(
+            Plugin(id="installed", name="A", plugin_type="modern", installed_version="1.0")
+        )
+        db_manager.add_plugin(Plugin(id="catalog", name="B", plugin_type="modern"))
+
+        assert db_manager.get_plugin_installed_version("installed") == (True, "1.0")
+        assert db_manager.get_plugin_installed_version("catalog") == (True, None)
+        assert db_manager.get_plugin_installed_version("missing") == (False, None)
+
     def test_get_plugin_by_name(self, db_manager):
         """Test getting plugin by name."""
         plugin = Plugin(id="test-1", name="Unique Name", plugin_type="modern")
@@ -157,6 +175,68 @@ class TestDatabaseManager:
         assert len(installed) == 1
         assert installed[0].id == "plugin-1"
 
+    def test_get_installed_plugin_rows(self, db_manager):
+        """Test getting installed plugins as plain rows."""
+        db_manager.add_plugin(
+            Plugin(id="p1", name="Installed", plugin_type="modern", installed_version="1.0")
+        )
+        db_manager.add_plugin(Plugin(id="p2", name="Not Installed", plugin_type="legacy"))
+
+        rows = db_manager.get_installed_plugin_rows()
+        assert len(rows) == 1
+        assert rows[0].id == "p1"
+        assert rows[0].plugin_type == "modern"
+        assert rows[0].installed_version == "1.0"
+
+    def test_get_all_plugin_rows(self, db_manager):
+        """Test fetching every plugin as a plain row."""
+        db_manager.add_plugin(Plugin(id="p1", name="One", plugin_type="modern"))
+        db_manager.add_plugin(Plugin(id="p2", name="Two", plugin_type="legacy"))
+
+        rows = db_manager.get_all_plugin_rows()
+        assert sorted(row.id for row in rows) == ["p1", "p2"]
+        assert not isinstance(rows[0], Plugin)
+
+    def test_iter_plugins_brief(self, db_manager):
+        """Test streaming the list-view columns in batches."""
+        for i in range(5):
+            db_manager.add_plugin(Plugin(id=f"p{i}", name=f"Plugin {i}", plugin_type="modern",
+                                         installed_version="1.0"))
+
+        rows = list(db_manager.iter_plugins_brief(batch_size=2))
+        assert len(rows) == 5
+        assert rows[0]._fields == ("id", "name", "installed_version", "latest_version", "status")
+        assert {row.installed_version for row in rows} == {"1.0"}
+
+    def test_get_updatable_plugin_rows(self, db_manager):
+        """Test selecting installed plugins that have a repository URL."""
+        db_manager.add_plugin(
+            Plugin(
+                id="p1",
+                name="GitHub",
+                plugin_type="modern",
+                installed_version="1.0",
+                repository_url="https://github.com/o/p1",
+            )
+        )
+        db_manager.add_plugin(
+            Plugin(id="p2", name="Local", plugin_type="modern", installed_version="1.0")
+        )
+        db_manager.add_plugin(
+            Plugin(
+                id="p3",
+                name="Catalog",
+                plugin_type="modern",
+                repository_url="https://github.com/o/p3",
+            )
+        )
+
+        rows = db_manager.get_updatable_plugin_rows()
+        assert [row.id for row in rows] == ["p1"]
+        assert rows[0].repository_url == "https://github.com/o/p1"
+        assert rows[0].installed_version == "1.0"
+        assert rows[0].release_etag is None
+
     def test_update_plugin(self, db_manager):
         """Test updating a plugin."""
         # Add plugin
@@ -173,6 +253,52 @@ class TestDatabaseManager:
         assert retrieved.name == "Updated Name"
         assert retrieved.installed_version == "2.0.0"
 
+    def test_update_plugin_refreshes_packed_versions(self, db_manager):
+        """Test that updating version bounds keeps the packed columns in step."""
+        plugin = Plugin(id="test-plugin", name="Plugin", plugin_type="modern",
+                        ida_version_min="8.0")
+        db_manager.add_plugin(plugin)
+
+        plugin.ida_version_min = "9.0"
+        assert db_manager.update_plugin(plugin) is True
+
+        assert db_manager.get_plugin("test-plugin").ida_min_packed == 90000
+        assert db_manager.get_plugins_by_compatibility("8.5") == []
+
+    def test_update_missing_plugin(self, db_manager):
+        """Test updating a plugin that does not exist."""
+        plugin = Plugin(id="missing", name="Missing", plugin_type="modern")
+        assert db_manager.update_plugin(plugin) is False
+        assert db_manager.update_plugin_status("missing", "installed", log_action="install") is False
+        assert db_manager.get_installation_history("missing") == []
+
+    def test_record_update_checks(self, db_manager):
+        """Test storing update check results."""
+        db_manager.add_plugin(Plugin(id="p1", name="One", plugin_type="modern"))
+        db_manager.add_plugin(Plugin(id="p2", name="Two", plugin_type="modern"))
+
+        assert db_manager.record_update_checks([("p1", "2.0", '"etag-1"'), ("p2", "1.5", None)])
+
+        plugin = db_manager.get_plugin("p1")
+        assert plugin.latest_version == "2.0"
+        assert plugin.release_etag == '"etag-1"'
+        assert plugin.last_checked_at is not None
+        assert db_manager.get_plugin("p2").latest_version == "1.5"
+
+    def test_get_plugins_by_compatibility_unpackable_bound(self, db_manager):
+        """Test that bounds too fine to pack still get an exact check."""
+        db_manager.add_plugin(Plugin(id="p1", name="One", plugin_type="modern",
+                                     ida_version_min="8.4.1.5"))
+        db_manager.add_plugin(Plugin(id="p2", name="Two", plugin_type="modern",
+                                     ida_version_min="8.0", ida_version_max="8.4"))
+
+        assert db_manager.get_plugin("p1").ida_min_packed is None
+        assert db_manager.get_plugin("p2").ida_max_packed == 80400
+
+        assert [p.id for p in db_manager.get_plugins_by_compatibility("8.4.1")] == []
+        assert [p.id for p in db_manager.get_plugins_by_compatibility("8.4")] == ["p2"]
+        assert [p.id for p in db_manager.get_plugins_by_compatibility("9.0")] == ["p1"]
+
     def test_delete_plugin(self, db_manager):
         """Test deleting a plugin."""
         plugin = Plugin(id="test-plugin", name="To Delete", plugin_type="modern")
@@ -205,6 +331,72 @@ class TestDatabaseManager:
         assert len(results) == 1
         assert results[0].id == "p3"
 
+    def test_search_plugins_tracks_changes(self, db_manager):
+        """Test that search follows plugin updates and deletes."""
+        plugin = Plugin(id="p1", name="Python Analyzer", plugin_type="modern")
+        db_manager.add_plugin(plugin)
+        db_manager.add_plugin(Plugin(id="p2", name="Py", plugin_type="modern"))
+
+        assert [p.id for p in db_manager.search_plugins("ANALY")] == ["p1"]
+        assert {p.id for p in db_manager.search_plugins("py")} == {"p1", "p2"}
+        assert db_manager.search_plugins('"analyzer" OR') == []
+
+        plugin.name = "Rust Decoder"
+        db_manager.update_plugin(plugin)
+        assert db_manager.search_plugins("Analyzer") == []
+        assert [p.id for p in db_manager.search_plugins("decode")] == ["p1"]
+
+        db_manager.delete_plugin("p1")
+        assert db_manager.search_plugins("decode") == []
+
+    def test_search_index_filled_for_existing_plugins(self, db_manager):
+        """Test that creating the search index picks up rows already stored."""
+        db_manager.add_plugin(Plugin(id="p1", name="Python Analyzer", plugin_type="modern"))
+        with db_manager.engine.begin() as conn:
+            conn.exec_driver_sql("DROP TABLE plugin_fts")
+
+        assert db_manager.init_database() is True
+        assert [p.id for p in db_manager.search_plugins("analyzer")] == ["p1"]
+
+    def test_search_survives_renumbered_rows(self, db_manager):
+        """Test that search results stay correct when the implicit rowids change."""
+        names = {"p1": "Python Analyzer", "p2": "ARM Helper", "p3": "X86 Decoder"}
+        for plugin_id, name in names.items():
+            db_manager.add_plugin(Plugin(id=plugin_id, name=name, plugin_type="modern"))
+        db_manager.delete_plugin("p1")
+        # What VACUUM may do to a table without an INTEGER PRIMARY KEY: p2 now holds
+        # the rowid p3 had, and p3 the one p1 had
+        with db_manager.engine.begin() as conn:
+            for statement in (
+                "UPDATE plugins SET rowid = 1 WHERE id = 'p3'",
+                "UPDATE plugins SET rowid = 3 WHERE id = 'p2'",
+            ):
+                conn.exec_driver_sql(statement)
+
+        assert [p.id for p in db_manager.search_plugins("decoder")] == ["p3"]
+        assert [p.id for p in db_manager.search_plugins("helper")] == ["p2"]
+
+        db_manager.add_plugin(Plugin(id="p4", name="Rust Demangler", plugin_type="modern"))
+        assert [p.id for p in db_manager.search_plugins("demangler")] == ["p4"]
+        assert [p.id for p in db_manager.search_plugins("decoder")] == ["p3"]
+
+    def test_rowid_keyed_search_index_is_rebuilt(self, db_manager):
+        """Test that an index keyed by the implicit rowid is replaced on startup."""
+        db_manager.add_plugin(Plugin(id="p1", name="Python Analyzer", plugin_type="modern"))
+        with db_manager.engine.begin() as conn:
+            for statement in (
+                "DROP TABLE plugin_fts",
+                "UPDATE plugins SET fts_rowid = NULL",
+                "CREATE VIRTUAL TABLE plugin_fts USING fts5(name, description, "
+                "content='plugins', content_rowid='rowid', tokenize='trigram')",
+            ):
+                conn.exec_driver_sql(statement)
+
+        assert db_manager.init_database() is True
+        assert [p.id for p in db_manager.search_plugins("analyzer")] == ["p1"]
+        db_manager.add_plugin(Plugin(id="p2", name="X86 Decoder", plugin_type="modern"))
+        assert [p.id for p in db_manager.search_plugins("decoder")] == ["p2"]
+
     def test_get_plugins_by_type(self, db_manager):
         """Test filtering plugins by type."""
         plugin1 = Plugin(id="p1", name="Modern Plugin", plugin_type="modern")
@@ -270,6 +462,71 @@ class TestDatabaseManager:
         assert history[0].action == "install"
         assert history[0].version == "1.0.0"
 
+    def test_log_installations(self, db_manager):
+        """Test logging several actions at once."""
+        assert db_manager.log_installations([
+            {"plugin_id": "plugin-1", "action": "install", "version": "1.0.0"},
+            {"plugin_id": "plugin-2", "action": "failed", "success": False,
+             "error_message": "boom"},
+        ]) is True
+
+        assert db_manager.get_installation_history("plugin-1")[0].version == "1.0.0"
+        failed = db_manager.get_installation_history("plugin-2")[0]
+        assert failed.success is False
+        assert failed.error_message == "boom"
+        assert failed.timestamp is not None
+
+    def test_add_plugins_logs_in_same_transaction(self, db_manager):
+        """Test adding several plugins with their history entries."""
+        plugins = [
+            Plugin(id="plugin-1", name="One", plugin_type="modern", installed_version="1.0"),
+            Plugin(id="plugin-2", name="Two", plugin_type="legacy"),
+        ]
+        assert db_manager.add_plugins(plugins, log_action="install") is True
+
+        assert len(db_manager.get_all_plugins()) == 2
+        history = db_manager.get_installation_history("plugin-1")
+        assert len(history) == 1
+        assert history[0].action == "install"
+        assert history[0].version == "1.0"
+
+        # A duplicate id rolls back the whole batch, history included
+        duplicate = [
+            Plugin(id="plugin-3", name="Three", plugin_type="modern"),
+            Plugin(id="plugin-1", name="One again", plugin_type="modern"),
+        ]
+        assert db_manager.add_plugins(duplicate, log_action="install") is False
+        assert db_manager.get_plugin("plugin-3") is None
+        assert db_manager.get_installation_history("plugin-3") == []
+
+    def test_update_plugin_status_with_log(self, db_manager):
+        """Test updating status and logging the action together."""
+        db_manager.add_plugin(Plugin(id="plugin-1", name="One", plugin_type="modern"))
+
+        assert db_manager.update_plugin_status(
+            "plugin-1", "not_installed", log_action="uninstall", log_version="1.0"
+        ) is True
+
+        assert db_manager.get_plugin("plugin-1").status == "not_installed"
+        history = db_manager.get_installation_history("plugin-1")
+        assert [(h.action, h.version) for h in history] == [("uninstall", "1.0")]
+
+    def test_update_plugin_status_sets_installed_version(self, db_manager):
+        """Test recording an update's new version with its status."""
+        db_manager.add_plugin(
+            Plugin(id="plugin-1", name="One", plugin_type="modern", installed_version="1.0")
+        )
+
+        assert db_manager.update_plugin_status(
+            "plugin-1", "installed", log_action="update", log_version="2.0",
+            installed_version="2.0",
+        ) is True
+
+        plugin = db_manager.get_plugin("plugin-1")
+        assert plugin.installed_version == "2.0"
+        assert plugin.install_date is not None
+        assert db_manager.get_installation_history("plugin-1")[0].action == "update"
+
     def test_get_installation_history(self, db_manager):
         """Test getting installation history."""
         # Log multiple actions
@@ -329,6 +586,16 @@ class TestDatabaseManager:
         assert settings["key1"] == "value1"
         assert settings["key2"] == {"nested": "value2"}
 
+    def test_settings_cache_invalidated_on_set(self, db_manager):
+        """Test that cached settings reflect writes and are not shared with callers."""
+        db_manager.set_setting("key", {"items": [1]})
+        db_manager.get_setting("key")["items"].append(2)
+        assert db_manager.get_setting("key") == {"items": [1]}
+
+        db_manager.set_setting("key", {"items": [3]})
+        assert db_manager.get_setting("key") == {"items": [3]}
+        assert db_manager.get_all_settings() == {"key": {"items": [3]}}
+
     def test_plugin_relationships(self, db_manager):
         """Test plugin-installation history relationship."""
         # Add plugin
@@ -391,6 +658,111 @@ class TestMigrations:
         assert "Current schema version: 0" in captured.out
         assert "Applied migrations: []" in captured.out
 
+    @staticmethod
+    def _create_old_schema(db_path, dropped_columns):
+        """Create a database whose plugins table predates the given columns."""
+        import sqlite3
+
+        engine = create_engine(f"sqlite:///{db_path}")
+        Base.metadata.create_all(engine)
+        engine.dispose()
+
+        conn = sqlite3.connect(db_path)
+        for index in Plugin.__table__.indexes:
+            if set(index.columns.keys()) & set(dropped_columns):
+                conn.execute(f"DROP INDEX {index.name}")
+        for column in dropped_columns:
+            conn.execute(f"ALTER TABLE plugins DROP COLUMN {column}")
+        conn.execute(
+            "INSERT INTO plugins (id, name, plugin_type, status, is_active, created_at, updated_at) "
+            "VALUES ('old', 'Old Plugin', 'modern', 'installed', 1, "
+            "'2024-01-01 00:00:00', '2024-01-01 00:00:00')"
+        )
+        conn.commit()
+        conn.close()
+
+    def test_init_database_upgrades_old_schema(self, migration_manager):
+        """Test that opening a database from an older version adds new columns."""
+        self._create_old_schema(migration_manager.db_path, ["release_etag", "last_checked_at"])
+
+        manager = DatabaseManager(db_path=migration_manager.db_path)
+        try:
+            assert manager.init_database() is True
+
+            plugins = manager.get_all_plugins()
+            assert [p.id for p in plugins] == ["old"]
+            assert plugins[0].release_etag is None
+            assert manager.record_update_checks([("old", "2.0", '"etag"')])
+            assert manager.get_plugin("old").release_etag == '"etag"'
+        finally:
+            manager.engine.dispose()
+
+    def test_init_database_adds_packed_version_columns(self, migration_manager):
+        """Test that old databases gain the packed version columns and their index."""
+        self._create_old_schema(migration_manager.db_path, ["ida_min_packed", "ida_max_packed"])
+
+        manager = DatabaseManager(db_path=migration_manager.db_path)
+        try:
+            assert manager.init_database() is True
+
+            # Rows stored before the upgrade have NULL packed bounds and still match
+            assert [p.id for p in manager.get_plugins_by_compatibility("9.0")] == ["old"]
+
+            manager.add_plugin(Plugin(id="new", name="New", plugin_type="modern",
+                                      ida_version_min="9.5"))
+            assert [p.id for p in manager.get_plugins_by_compatibility("9.0")] == ["old"]
+
+            with manager.engine.connect() as conn:
+                indexes = conn.exec_driver_sql("PRAGMA index_list(plugins)").all()
+            assert "idx_plugin_ida_range" in {row[1] for row in indexes}
+        finally:
+            manager.engine.dispose()
+
+    def test_init_database_adds_search_row_ids(self, migration_manager):
+        """Test that old databases gain fts_rowid and a search index keyed by it."""
+        self._create_old_schema(migration_manager.db_path, ["fts_rowid"])
+
+        manager = DatabaseManager(db_path=migration_manager.db_path)
+        try:
+            assert manager.init_database() is True
+
+            assert [p.id for p in manager.search_plugins("old plugin")] == ["old"]
+            manager.add_plugin(Plugin(id="new", name="New Plugin", plugin_type="modern"))
+            assert {p.id for p in manager.search_plugins("plugin")} == {"old", "new"}
+        finally:
+            manager.engine.dispose()
+
+    def test_migration_backfills_search_row_ids(self, migration_manager):
+        """Test that migration 5 adds, fills and uniquely indexes fts_rowid."""
+        import sqlite3
+
+        self._create_old_schema(migration_manager.db_path, ["fts_rowid"])
+        migration_manager._ensure_migration_table()
+        conn = sqlite3.connect(migration_manager.db_path)
+        conn.executemany(
+            "INSERT INTO schema_migrations (version, name) VALUES (?, ?)",
+            [(m.version, m.name) for m in MIGRATIONS if m.version < 5],
+        )
+        conn.commit()
+        conn.close()
+
+        assert migration_manager.migrate() is True
+
+        conn = sqlite3.connect(migration_manager.db_path)
+        try:
+            assert conn.execute("SELECT fts_rowid FROM plugins WHERE id = 'old'").fetchone()[0]
+            unique = {row[1]: row[2] for row in conn.execute("PRAGMA index_list(plugins)")}
+            assert unique["idx_plugin_fts_rowid"] == 1
+        finally:
+            conn.close()
+
+        manager = DatabaseManager(db_path=migration_manager.db_path)
+        try:
+            assert manager.init_database() is True
+            assert [p.id for p in manager.search_plugins("old plugin")] == ["old"]
+        finally:
+            manager.engine.dispose()
+
 
 class TestDatabaseIntegration:
     """Integration tests for database operations."""
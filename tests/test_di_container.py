@@ -13,10 +13,12 @@ import pytest
 from pathlib import Path
 import tempfile
 import shutil
+from unittest.mock import Mock
 
 from src.containers.di_container import (
     DIContainer,
     ApplicationContainer,
+    CircularDependencyError,
     get_container,
     reset_container,
 )
@@ -197,6 +199,39 @@ class TestDIContainer:
         client = container.get(GitHubClient)
         assert client is not None
 
+    def test_same_named_types_do_not_collide(self):
+        """Test classes sharing a name in different modules get separate registrations."""
+        from src.database.models import Plugin as DBPlugin
+        from src.models.plugin import Plugin
+
+        container = DIContainer()
+        container.register(DBPlugin, "db")
+        container.register(Plugin, "model")
+
+        assert container.get(DBPlugin) == "db"
+        assert container.get(Plugin) == "model"
+        assert not container.is_registered("Plugin")
+
+    def test_short_names_resolve_builtin_components(self):
+        """Test a built-in component is the same registration by type and by name."""
+        container = DIContainer()
+        manager = VersionManager()
+        container.register("VersionManager", manager)
+
+        assert container.get(VersionManager) is manager
+        assert container.get("src.core.version_manager.VersionManager") is manager
+
+    def test_registered_factory_skips_default_dependencies(self):
+        """Test a replaced factory does not construct the default's dependencies."""
+        container = DIContainer()
+        db_factory = Mock()
+        service = object()
+        container.register_factory(DatabaseManager, db_factory)
+        container.register_factory(PluginService, lambda: service)
+
+        assert container.get(PluginService) is service
+        db_factory.assert_not_called()
+
     def test_config_management(self):
         """Test configuration management."""
         container = DIContainer()
@@ -224,6 +259,24 @@ class TestDIContainer:
 
         assert container.is_registered(NotRegistered) is False
 
+    def test_get_by_type_name(self):
+        """Test resolving by type name returns the same singleton as by type."""
+        container = DIContainer()
+
+        assert container.is_registered("VersionManager") is True
+        manager = container.get("VersionManager")
+
+        assert isinstance(manager, VersionManager)
+        assert container.get(VersionManager) is manager
+
+    def test_plugin_service_shares_installer_singleton(self):
+        """Test PluginService receives the container's PluginInstaller singleton."""
+        container = DIContainer()
+
+        service = container.get(PluginService)
+
+        assert service.installer is container.get(PluginInstaller)
+
     def test_clear_singletons(self):
         """Test clearing singletons."""
         container = DIContainer()
@@ -266,6 +319,18 @@ class TestDIContainer:
         with pytest.raises(ValueError, match="is not registered"):
             container.get(NotRegistered)
 
+    def test_circular_factories_raise_error(self):
+        """Test mutually dependent factories raise instead of recursing forever."""
+        container = DIContainer()
+        container.register_factory("A", lambda: container.get("B"))
+        container.register_factory("B", lambda: container.get("A"))
+
+        with pytest.raises(CircularDependencyError, match="A -> B -> A"):
+            container.get("A")
+
+        # The resolution stack unwinds, so unrelated types still resolve
+        assert isinstance(container.get(VersionManager), VersionManager)
+
 
 class TestApplicationContainer:
     """Test ApplicationContainer convenience methods."""
@@ -286,6 +351,16 @@ class TestApplicationContainer:
         # Should return same instance
         assert container.db is db
 
+    def test_property_cache_cleared(self):
+        """Test clear() drops instances cached by the properties."""
+        container = ApplicationContainer()
+        db = container.db
+
+        container.clear()
+
+        assert container.db is not db
+        assert container.db is container.get(DatabaseManager)
+
     def test_github_property(self):
         """Test github convenience property."""
         container = ApplicationContainer()
@@ -0,0 +1,99 @@
+"""
+Tests for the editor hook scripts in .claude/hooks/scripts.
+
+The scripts are standalone files with hyphenated names, so they are loaded
+by path rather than imported as modules.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / ".claude" / "hooks" / "scripts"
+
+
+def load_script(name):
+    """Load a hook script as a module."""
+    path = SCRIPTS_DIR / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def security_check():
+    """Load the secret scanning hook."""
+    return load_script("security-check")
+
+
+@pytest.fixture(scope="module")
+def validate_prompt():
+    """Load the prompt validation hook."""
+    return load_script("validate-prompt")
+
+
+OPENAI_KEY = "sk-" + "a" * 48
+GITHUB_PAT = "ghp_" + "b" * 36
+
+
+class TestSecurityCheck:
+    """Test secret detection in edit payloads."""
+
+    def test_clean_content(self, security_check):
+        """Test that content without secrets passes."""
+        assert security_check.check_for_secrets("x = compute()\n", "app.py") == []
+
+    def test_detects_single_secret(self, security_check):
+        """Test that a lone token is reported."""
+        issues = security_check.check_for_secrets(f"token = {GITHUB_PAT}\n", "app.py")
+
+        assert issues == ["Potential GitHub Personal Access Token detected"]
+
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            (
+                f"api_key = '{OPENAI_KEY}'",
+                {"Potential API key detected", "Potential OpenAI API Key detected"},
+            ),
+            (
+                f"password='{GITHUB_PAT}'",
+                {
+                    "Potential Password/Secret detected",
+                    "Potential GitHub Personal Access Token detected",
+                },
+            ),
+        ],
+    )
+    def test_detects_secret_nested_in_another_match(self, security_check, content, expected):
+        """Test that a secret inside a span matched by another pattern is still reported."""
+        assert set(security_check.check_for_secrets(content, "app.py")) == expected
+
+    def test_nested_secret_in_large_ascii_content(self, security_check):
+        """Test that the bytes scan of large content reports nested secrets too."""
+        padding = "#" * security_check.BYTES_SCAN_THRESHOLD + "\n"
+
+        issues = security_check.check_for_secrets(padding + f"api_key = '{OPENAI_KEY}'", "app.py")
+
+        assert set(issues) == {"Potential API key detected", "Potential OpenAI API Key detected"}
+
+
+class TestValidatePrompt:
+    """Test warnings for dangerous commands in prompts."""
+
+    def test_safe_prompt_has_no_warnings(self, validate_prompt):
+        """Test that an ordinary command produces no warning."""
+        assert validate_prompt.validate_prompt("git push origin main") == []
+
+    def test_warns_about_every_dangerous_command(self, validate_prompt):
+        """Test that a greedy match does not hide later commands on the same line."""
+        messages = validate_prompt.validate_prompt(
+            "git push x; git reset --hard; git push --force"
+        )
+
+        assert messages == [
+            validate_prompt.DANGEROUS_PATTERNS[1][1],
+            validate_prompt.DANGEROUS_PATTERNS[2][1],
+        ]
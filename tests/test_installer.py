@@ -0,0 +1,547 @@
+"""
+Tests for PluginInstaller.
+
+Tests verify release extraction, plugin validation, moving and backing up
+install trees, and that release installs only replace an existing
+installation once the new files have been extracted and validated.
+"""
+
+import io
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.core import installer as installer_module
+from src.core.installer import (
+    _BACKUP_DIR_NAME,
+    AssetCache,
+    PluginInstaller,
+    _extract_zip_fast,
+    _has_entry_point,
+    _install_tree,
+    _rename_backup,
+)
+from src.github.client import GitHubClient
+from src.models.github_info import GitHubAsset, GitHubRelease
+from src.models.plugin import InstallationResult, Plugin, PluginType
+from src.utils.file_ops import restore_backup
+
+REPO_URL = "https://github.com/user/test-plugin"
+
+LEGACY_PLUGIN = b"def PLUGIN_ENTRY():\n    return None\n"
+
+
+def make_zip(files):
+    """Build an in-memory zip archive from a {member name: bytes} mapping."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    buffer.seek(0)
+    return buffer
+
+
+def make_release(tag="v1.0.0"):
+    """Build a release with a single zip asset."""
+    return GitHubRelease(
+        id=1,
+        tag_name=tag,
+        html_url=f"{REPO_URL}/releases/tag/{tag}",
+        assets=[
+            GitHubAsset(
+                name="plugin.zip",
+                size=0,
+                download_url=f"{REPO_URL}/releases/download/{tag}/plugin.zip",
+                content_type="application/zip",
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for testing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def github_client():
+    """Create a mock GitHub client."""
+    return Mock(spec=GitHubClient)
+
+
+@pytest.fixture
+def installer(github_client, temp_dir):
+    """Create an installer with a mock GitHub client and a private asset cache."""
+    return PluginInstaller(
+        github_client=github_client,
+        version_manager=Mock(),
+        asset_cache=AssetCache(temp_dir / "asset_cache"),
+    )
+
+
+@pytest.fixture
+def existing_install(temp_dir):
+    """Create an installed plugin directory."""
+    destination = temp_dir / "plugins" / "test-plugin"
+    destination.mkdir(parents=True)
+    (destination / "old_plugin.py").write_bytes(LEGACY_PLUGIN)
+    return destination
+
+
+class TestInstallFromGithubRelease:
+    """Test installing plugins from release archives."""
+
+    def test_replaces_existing_install(self, installer, github_client, existing_install):
+        """Test that a valid release replaces the previous files."""
+        github_client.download_release_asset_with_etag.return_value = (
+            make_zip({"test-plugin-1.0.0/new_plugin.py": LEGACY_PLUGIN}), None
+        )
+
+        result = installer.install_from_github_release(REPO_URL, make_release(), existing_install)
+
+        assert result.success is True
+        assert result.new_version == "1.0.0"
+        assert sorted(p.name for p in existing_install.iterdir()) == ["new_plugin.py"]
+        # No staging or set-aside directories are left behind
+        assert list(existing_install.parent.iterdir()) == [existing_install]
+
+    def test_replaces_existing_install_with_windows_rename(
+        self, installer, github_client, existing_install, monkeypatch
+    ):
+        """Test the swap when renaming onto an existing directory fails, as on Windows."""
+        real_replace = os.replace
+
+        def windows_replace(src, dst):
+            if os.path.isdir(dst):
+                raise PermissionError(5, "Access is denied", str(dst))
+            real_replace(src, dst)
+
+        monkeypatch.setattr(installer_module.os, "replace", windows_replace)
+        github_client.download_release_asset_with_etag.return_value = (
+            make_zip({"new_plugin.py": LEGACY_PLUGIN}), None
+        )
+
+        result = installer.install_from_github_release(REPO_URL, make_release(), existing_install)
+
+        assert result.success is True
+        assert sorted(p.name for p in existing_install.iterdir()) == ["new_plugin.py"]
+        assert list(existing_install.parent.iterdir()) == [existing_install]
+
+    def test_corrupt_archive_keeps_existing_install(
+        self, installer, github_client, existing_install
+    ):
+        """Test that an archive that fails to extract leaves the old install alone."""
+        github_client.download_release_asset_with_etag.return_value = (
+            io.BytesIO(b"not a zip"), None
+        )
+
+        result = installer.install_from_github_release(REPO_URL, make_release(), existing_install)
+
+        assert result.success is False
+        assert result.message == "Failed to extract release archive"
+        assert (existing_install / "old_plugin.py").read_bytes() == LEGACY_PLUGIN
+        assert list(existing_install.parent.iterdir()) == [existing_install]
+
+    def test_unsafe_member_keeps_existing_install(
+        self, installer, github_client, existing_install
+    ):
+        """Test that a member escaping the destination aborts before replacing anything."""
+        github_client.download_release_asset_with_etag.return_value = (
+            make_zip({"plugin.py": LEGACY_PLUGIN, "../escape.py": b""}), None
+        )
+
+        result = installer.install_from_github_release(REPO_URL, make_release(), existing_install)
+
+        assert result.success is False
+        assert (existing_install / "old_plugin.py").exists()
+        assert not (existing_install.parent / "escape.py").exists()
+
+    def test_invalid_plugin_keeps_existing_install(
+        self, installer, github_client, existing_install
+    ):
+        """Test that a release without a plugin leaves the old install alone."""
+        github_client.download_release_asset_with_etag.return_value = (
+            make_zip({"README.md": b"no plugin here"}), None
+        )
+
+        result = installer.install_from_github_release(REPO_URL, make_release(), existing_install)
+
+        assert result.success is False
+        assert result.message == "Invalid plugin structure"
+        assert sorted(p.name for p in existing_install.iterdir()) == ["old_plugin.py"]
+
+    def test_fresh_install(self, installer, github_client, temp_dir):
+        """Test installing into a destination that does not exist yet."""
+        github_client.download_release_asset_with_etag.return_value = (
+            make_zip({"plugin.py": LEGACY_PLUGIN}), None
+        )
+        destination = temp_dir / "plugins" / "new-plugin"
+
+        result = installer.install_from_github_release(REPO_URL, make_release(), destination)
+
+        assert result.success is True
+        assert (destination / "plugin.py").exists()
+
+    def test_cold_install_skips_etag_request(self, installer, github_client, temp_dir):
+        """Test that an asset not in the cache is downloaded without a HEAD request."""
+        github_client.download_release_asset_with_etag.return_value = (
+            make_zip({"plugin.py": LEGACY_PLUGIN}), '"v1"'
+        )
+
+        result = installer.install_from_github_release(
+            REPO_URL, make_release(), temp_dir / "plugins" / "new-plugin"
+        )
+
+        assert result.success is True
+        github_client.get_asset_etag.assert_not_called()
+        key = ("user/test-plugin", "v1.0.0", "plugin.zip")
+        assert installer.asset_cache.get_etag(key) == '"v1"'
+
+    def test_reinstall_uses_cached_asset(self, installer, github_client, temp_dir):
+        """Test that a reinstall with an unchanged ETag does not download again."""
+        key = ("user/test-plugin", "v1.0.0", "plugin.zip")
+        installer.asset_cache.put(key, '"v1"', make_zip({"plugin.py": LEGACY_PLUGIN}))
+        github_client.get_asset_etag.return_value = '"v1"'
+        destination = temp_dir / "plugins" / "new-plugin"
+
+        result = installer.install_from_github_release(REPO_URL, make_release(), destination)
+
+        assert result.success is True
+        assert (destination / "plugin.py").exists()
+        github_client.download_release_asset_with_etag.assert_not_called()
+
+    def test_changed_etag_downloads_again(self, installer, github_client, temp_dir):
+        """Test that a cached asset whose ETag changed is downloaded and replaced."""
+        key = ("user/test-plugin", "v1.0.0", "plugin.zip")
+        installer.asset_cache.put(key, '"v1"', make_zip({"README.md": b"stale"}))
+        github_client.get_asset_etag.return_value = '"v2"'
+        github_client.download_release_asset_with_etag.return_value = (
+            make_zip({"plugin.py": LEGACY_PLUGIN}), '"v2"'
+        )
+
+        result = installer.install_from_github_release(
+            REPO_URL, make_release(), temp_dir / "plugins" / "new-plugin"
+        )
+
+        assert result.success is True
+        assert installer.asset_cache.get_etag(key) == '"v2"'
+
+
+class TestAssetCache:
+    """Test the on-disk release asset cache."""
+
+    def test_get_requires_matching_etag(self, temp_dir):
+        """Test that an entry is only returned for the ETag it was stored under."""
+        cache = AssetCache(temp_dir)
+        cache.put(("p", "v1", "a.zip"), '"x"', io.BytesIO(b"data"))
+
+        assert cache.get(("p", "v1", "a.zip"), '"y"') is None
+        assert cache.get(("p", "v2", "a.zip"), '"x"') is None
+        with cache.get(("p", "v1", "a.zip"), '"x"') as cached:
+            assert cached.read() == b"data"
+
+    def test_put_rewinds_buffer(self, temp_dir):
+        """Test that the stored buffer can still be read by the caller."""
+        buffer = io.BytesIO(b"data")
+
+        AssetCache(temp_dir).put(("p", "v1", "a.zip"), '"x"', buffer)
+
+        assert buffer.read() == b"data"
+
+    def test_oversized_asset_is_not_stored(self, temp_dir):
+        """Test that an asset larger than the whole cache is skipped."""
+        cache = AssetCache(temp_dir, max_bytes=4)
+        buffer = io.BytesIO(b"too large")
+
+        cache.put(("p", "v1", "a.zip"), '"x"', buffer)
+
+        assert cache.get_etag(("p", "v1", "a.zip")) is None
+        assert buffer.read() == b"too large"
+
+    def test_evicts_least_recently_used(self, temp_dir):
+        """Test that storing past max_bytes evicts the entry used longest ago."""
+        cache = AssetCache(temp_dir, max_bytes=8)
+        first, second, third = ("p", "v1", "a.zip"), ("p", "v2", "a.zip"), ("p", "v3", "a.zip")
+        cache.put(first, '"1"', io.BytesIO(b"1111"))
+        cache.put(second, '"2"', io.BytesIO(b"2222"))
+        # Make the first entry older, then use it so the second is least recent
+        for key, mtime in ((first, 100), (second, 200)):
+            os.utime(cache._entry_paths(key)[0], (mtime, mtime))
+        cache.get(first, '"1"').close()
+
+        cache.put(third, '"3"', io.BytesIO(b"3333"))
+
+        assert cache.get_etag(first) == '"1"'
+        assert cache.get_etag(second) is None
+        assert not cache._entry_paths(second)[0].exists()
+        assert cache.get_etag(third) == '"3"'
+
+
+class TestRenameBackup:
+    """Test backing up a plugin directory before it is removed."""
+
+    def test_moves_install_into_backup_directory(self, existing_install):
+        """Test that the plugin directory is renamed into the hidden backup directory."""
+        backup_path, moved = _rename_backup(existing_install, os.stat(existing_install))
+
+        assert moved is True
+        assert not existing_install.exists()
+        assert backup_path.parent == existing_install.parent / _BACKUP_DIR_NAME
+        assert (backup_path / "old_plugin.py").read_bytes() == LEGACY_PLUGIN
+
+    def test_keeps_only_recent_backups(self, existing_install):
+        """Test that older backups of the same plugin are pruned."""
+        backup_root = existing_install.parent / _BACKUP_DIR_NAME
+        for day in range(1, 5):
+            (backup_root / f"test-plugin_2024010{day}_120000").mkdir(parents=True)
+        (backup_root / "test-plugin-extra_20240101_120000").mkdir()
+
+        backup_path, _ = _rename_backup(existing_install, os.stat(existing_install))
+
+        assert sorted(p.name for p in backup_root.iterdir()) == [
+            "test-plugin-extra_20240101_120000",
+            "test-plugin_20240103_120000",
+            "test-plugin_20240104_120000",
+            backup_path.name,
+        ]
+
+
+@pytest.fixture(params=["libarchive", "zipfile"])
+def extract_backend(request, monkeypatch):
+    """Run a test with each member extraction backend."""
+    if request.param == "libarchive":
+        if installer_module.libarchive is None:
+            pytest.skip("libarchive not installed")
+    else:
+        monkeypatch.setattr(installer_module, "libarchive", None)
+    return request.param
+
+
+class TestExtractZipFast:
+    """Test extracting release archives."""
+
+    def test_strips_single_toplevel_directory(self, temp_dir, extract_backend):
+        """Test that a shared <repo>-<tag>/ directory is stripped."""
+        archive = make_zip(
+            {"repo-1.0/plugin.py": LEGACY_PLUGIN, "repo-1.0/pkg/__init__.py": b""}
+        )
+
+        result = _extract_zip_fast(archive, temp_dir / "out")
+
+        assert result.success is True
+        assert (temp_dir / "out" / "plugin.py").read_bytes() == LEGACY_PLUGIN
+        assert (temp_dir / "out" / "pkg" / "__init__.py").read_bytes() == b""
+
+    def test_keeps_multiple_toplevel_entries(self, temp_dir, extract_backend):
+        """Test that nothing is stripped when members do not share one directory."""
+        archive = make_zip({"a/plugin.py": LEGACY_PLUGIN, "README.md": b"readme"})
+
+        result = _extract_zip_fast(archive, temp_dir / "out")
+
+        assert result.success is True
+        assert (temp_dir / "out" / "a" / "plugin.py").exists()
+        assert (temp_dir / "out" / "README.md").exists()
+
+    def test_extracts_from_path(self, temp_dir, extract_backend):
+        """Test extracting an archive stored on disk."""
+        archive_path = temp_dir / "plugin.zip"
+        archive_path.write_bytes(make_zip({"plugin.py": LEGACY_PLUGIN}).getvalue())
+
+        result = _extract_zip_fast(archive_path, temp_dir / "out", strip_single_toplevel=False)
+
+        assert result.success is True
+        assert (temp_dir / "out" / "plugin.py").read_bytes() == LEGACY_PLUGIN
+
+    @pytest.mark.parametrize("member", ["../escape.py", "/abs.py", "C:/drive.py"])
+    def test_unsafe_member_writes_nothing(self, temp_dir, extract_backend, member):
+        """Test that an escaping member fails the extraction before any file is written."""
+        archive = make_zip({"plugin.py": LEGACY_PLUGIN, member: b""})
+
+        result = _extract_zip_fast(archive, temp_dir / "out")
+
+        assert result.success is False
+        assert "Unsafe path" in result.error
+        assert not (temp_dir / "out").exists()
+
+    def test_corrupt_archive_fails(self, temp_dir):
+        """Test that data that is not a zip archive is reported as a failure."""
+        result = _extract_zip_fast(io.BytesIO(b"not a zip"), temp_dir / "out")
+
+        assert result.success is False
+        assert not (temp_dir / "out").exists()
+
+
+class TestHasEntryPoint:
+    """Test scanning Python files for IDA plugin entry points."""
+
+    def test_finds_marker(self, temp_dir):
+        """Test that a plugin entry point is detected."""
+        py_file = temp_dir / "plugin.py"
+        py_file.write_bytes(LEGACY_PLUGIN)
+
+        assert _has_entry_point(py_file) is True
+
+    def test_plain_module_has_no_entry_point(self, temp_dir):
+        """Test that a module without markers is not treated as a plugin."""
+        py_file = temp_dir / "helpers.py"
+        py_file.write_bytes(b"def helper():\n    return 1\n")
+
+        assert _has_entry_point(py_file) is False
+
+    def test_finds_marker_across_chunk_boundary(self, temp_dir):
+        """Test that a marker split between two read chunks is still found."""
+        py_file = temp_dir / "plugin.py"
+        padding = installer_module._SCAN_CHUNK_SIZE - 5
+        py_file.write_bytes(b"#" * padding + b"PLUGIN_ENTRY")
+
+        assert _has_entry_point(py_file) is True
+
+    def test_large_file_is_memory_mapped(self, temp_dir):
+        """Test that files past the mmap threshold are scanned in full."""
+        py_file = temp_dir / "resources.py"
+        py_file.write_bytes(b"#" * installer_module._MMAP_THRESHOLD + b"IDP_init")
+
+        assert _has_entry_point(py_file) is True
+
+
+class TestInstallTree:
+    """Test moving extracted trees into place."""
+
+    def test_rename_replaces_destination(self, temp_dir):
+        """Test that the source tree replaces an existing destination."""
+        source = temp_dir / "source"
+        (source / "pkg").mkdir(parents=True)
+        (source / "pkg" / "plugin.py").write_bytes(LEGACY_PLUGIN)
+        destination = temp_dir / "destination"
+        destination.mkdir()
+        (destination / "stale.py").write_bytes(b"")
+
+        result = _install_tree(source, destination)
+
+        assert result.success is True
+        assert not source.exists()
+        assert [p.name for p in destination.iterdir()] == ["pkg"]
+
+    def test_failed_rename_falls_back_to_hardlinks(self, temp_dir, monkeypatch):
+        """Test that a failed rename copies by hardlink and removes the source."""
+        source = temp_dir / "source"
+        source.mkdir()
+        (source / "plugin.py").write_bytes(LEGACY_PLUGIN)
+        source_inode = os.stat(source / "plugin.py").st_ino
+        destination = temp_dir / "destination"
+
+        def fail_replace(src, dst):
+            raise OSError("rename not permitted")
+
+        monkeypatch.setattr(installer_module.os, "replace", fail_replace)
+        result = _install_tree(source, destination)
+
+        assert result.success is True
+        assert not source.exists()
+        assert (destination / "plugin.py").read_bytes() == LEGACY_PLUGIN
+        assert os.stat(destination / "plugin.py").st_ino == source_inode
+
+
+class TestValidatePluginStructure:
+    """Test plugin structure validation."""
+
+    def test_legacy_plugin(self, installer, temp_dir):
+        """Test that a directory with an entry point is a legacy plugin."""
+        (temp_dir / "plugin.py").write_bytes(LEGACY_PLUGIN)
+        (temp_dir / "helpers.py").write_bytes(b"")
+
+        result = installer.validate_plugin_structure(temp_dir)
+
+        assert result.valid is True
+        assert result.plugin_type == PluginType.LEGACY
+
+    def test_modern_plugin(self, installer, temp_dir):
+        """Test that a manifest with its entry point is a modern plugin."""
+        (temp_dir / "plugins.json").write_text('{"name": "p", "version": "2.0"}')
+        (temp_dir / "plugin.py").write_bytes(b"")
+
+        result = installer.validate_plugin_structure(temp_dir)
+
+        assert result.valid is True
+        assert result.plugin_type == PluginType.MODERN
+        assert installer._extract_version_from_clone(temp_dir) == "2.0"
+
+    def test_missing_path(self, installer, temp_dir):
+        """Test that a missing path is reported as such."""
+        result = installer.validate_plugin_structure(temp_dir / "missing")
+
+        assert result.valid is False
+        assert result.error == "Plugin path does not exist"
+
+    def test_file_is_not_a_plugin(self, installer, temp_dir):
+        """Test that a regular file is rejected rather than raising."""
+        py_file = temp_dir / "plugin.py"
+        py_file.write_bytes(LEGACY_PLUGIN)
+
+        result = installer.validate_plugin_structure(py_file)
+
+        assert result.valid is False
+        assert result.error == "No valid plugin structure found"
+        assert installer._extract_version_from_clone(py_file) is None
+
+
+class TestUninstallPlugin:
+    """Test uninstalling plugins with a backup."""
+
+    def test_backup_can_be_restored(self, installer, existing_install):
+        """Test that the backup made on uninstall restores the removed files."""
+        plugin = Plugin(
+            id="user/test-plugin",
+            name="test-plugin",
+            plugin_type=PluginType.LEGACY,
+            install_path=str(existing_install),
+        )
+
+        result = installer.uninstall_plugin(plugin, backup=True)
+
+        assert result.success is True
+        assert not existing_install.exists()
+        assert restore_backup(Path(result.backup_path), existing_install).success is True
+        assert (existing_install / "old_plugin.py").read_bytes() == LEGACY_PLUGIN
+
+    def test_without_backup(self, installer, existing_install):
+        """Test that uninstalling without a backup deletes the files outright."""
+        plugin = Plugin(
+            id="user/test-plugin",
+            name="test-plugin",
+            plugin_type=PluginType.LEGACY,
+            install_path=str(existing_install),
+        )
+
+        result = installer.uninstall_plugin(plugin, backup=False)
+
+        assert result.success is True
+        assert result.backup_path is None
+        assert not existing_install.exists()
+        assert not (existing_install.parent / _BACKUP_DIR_NAME).exists()
+
+
+class TestInstallMany:
+    """Test installing several plugins concurrently."""
+
+    def test_results_follow_input_order(self, installer, temp_dir, monkeypatch):
+        """Test that each item gets its own result, in input order."""
+
+        def fake_clone(repo_url, destination, branch):
+            return InstallationResult(success=branch == "main", plugin_id=repo_url, message="")
+
+        monkeypatch.setattr(installer, "install_from_github_clone", fake_clone)
+        items = [
+            (f"{REPO_URL}-{i}", temp_dir / str(i), "main" if i % 2 else "dev") for i in range(6)
+        ]
+
+        results = installer.install_many(items, max_workers=3)
+
+        assert [r.plugin_id for r in results] == [item[0] for item in items]
+        assert [r.success for r in results] == [bool(i % 2) for i in range(6)]
@@ -546,3 +546,80 @@ class TestPluginServiceIntegration:
 
         assert result.success is True
         mock_installer.update_plugin.assert_called_once_with("test/update_workflow")
+
+
+class TestPluginServiceUpdateRollback:
+    """Test that a failed update leaves the previous version installed."""
+
+    @pytest.fixture
+    def install_dir(self):
+        """Create a plugins directory holding an installed plugin."""
+        temp_dir = Path(tempfile.mkdtemp())
+        install_path = temp_dir / "plugins" / "rollback"
+        install_path.mkdir(parents=True)
+        (install_path / "plugin.py").write_text("def PLUGIN_ENTRY():\n    pass\n")
+
+        yield install_path
+
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    @pytest.fixture
+    def update_service(self, temp_db, mock_github_client, install_dir):
+        """Create a PluginService whose installer works on real directories."""
+        from src.models.github_info import GitHubRelease
+
+        temp_db.add_plugin(Plugin(
+            id="test/rollback",
+            name="Rollback Test",
+            plugin_type="legacy",
+            repository_url="https://github.com/test/rollback",
+            installed_version="1.0.0",
+            install_path=str(install_dir),
+        ))
+        mock_github_client.get_latest_release.return_value = GitHubRelease(
+            id=1, tag_name="v2.0.0", html_url="https://github.com/test/rollback/releases/v2.0.0"
+        )
+
+        ida_detector = Mock(spec=IDADetector)
+        ida_detector.find_ida_installation.return_value = install_dir.parent
+        ida_detector.get_plugin_directory.return_value = install_dir.parent
+
+        return PluginService(
+            db_manager=temp_db,
+            github_client=mock_github_client,
+            ida_detector=ida_detector,
+            installer=PluginInstaller(mock_github_client, VersionManager()),
+            version_manager=VersionManager(),
+        )
+
+    def test_failed_install_restores_previous_version(self, update_service, install_dir):
+        """Test that the backup is restored when the new release fails to install."""
+        failure = InstallationResult(
+            success=False, plugin_id="test/rollback", message="Failed", error="boom"
+        )
+        with patch.object(
+            update_service.installer, "install_from_github_release", return_value=failure
+        ) as install:
+            result = update_service.update_plugin("test/rollback")
+
+        assert result.success is False
+        install.assert_called_once()
+        assert install.call_args.args[2] == install_dir
+        assert (install_dir / "plugin.py").exists()
+
+        db_plugin = update_service.db.get_plugin("test/rollback")
+        assert db_plugin.installed_version == "1.0.0"
+        assert db_plugin.status != "failed"
+
+    def test_failed_uninstall_aborts_update(self, update_service):
+        """Test that the release is not installed when the old files cannot be removed."""
+        failure = InstallationResult(
+            success=False, plugin_id="test/rollback", message="Failed", error="locked"
+        )
+        with patch.object(update_service.installer, "uninstall_plugin", return_value=failure), \
+                patch.object(update_service.installer, "install_from_github_release") as install:
+            result = update_service.update_plugin("test/rollback")
+
+        assert result.success is False
+        assert result.error == "locked"
+        install.assert_not_called()
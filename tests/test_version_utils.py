@@ -10,6 +10,7 @@ from src.utils.version_utils import (
     IDAVersion,
     compare_versions,
     is_version_compatible,
+    pack_version,
 )
 
 
@@ -201,6 +202,30 @@ class TestIsVersionCompatible:
         assert is_version_compatible("8.0", "9.0", None) is False
 
 
+class TestPackVersion:
+    """Test pack_version function."""
+
+    def test_packs_plain_versions(self):
+        """Test packing versions with up to three components."""
+        assert pack_version("9") == 90000
+        assert pack_version("8.4") == 80400
+        assert pack_version("7.5.1") == 70501
+
+    def test_packed_order_matches_version_order(self):
+        """Test that packed values order like the versions."""
+        assert pack_version("8.10") > pack_version("8.9")
+        assert pack_version("9.0") > pack_version("8.99.99")
+
+    def test_unpackable_versions(self):
+        """Test versions that cannot be packed."""
+        assert pack_version(None) is None
+        assert pack_version("") is None
+        assert pack_version("invalid") is None
+        assert pack_version("8.4.1.5") is None
+        assert pack_version("8.100") is None
+        assert pack_version("9.0b1") is None
+
+
 class TestIDAVersionEdgeCases:
     """Test edge cases in version handling."""
 